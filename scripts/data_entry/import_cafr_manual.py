@@ -91,6 +91,9 @@ class CAFRImporter:
         else:
             self.warnings.append(f"Fund balance file not found: {fund_balance_csv}")
 
+        # Store line item totals so validation doesn't re-sum them
+        self.refresh_fiscal_year_totals(fy)
+
         # Validate imported data
         self.validate_fiscal_year_data(fy.id)
 
@@ -335,6 +338,20 @@ class CAFRImporter:
 
         self.db.commit()
 
+    def refresh_fiscal_year_totals(self, fy: FiscalYear) -> None:
+        """Recompute the denormalized revenue/expenditure totals on a fiscal year."""
+        from sqlalchemy import func, select
+
+        fy.total_revenues, fy.total_expenditures = self.db.query(
+            select(func.coalesce(func.sum(Revenue.actual_amount), 0))
+            .where(Revenue.fiscal_year_id == fy.id)
+            .scalar_subquery(),
+            select(func.coalesce(func.sum(Expenditure.actual_amount), 0))
+            .where(Expenditure.fiscal_year_id == fy.id)
+            .scalar_subquery(),
+        ).one()
+        self.db.commit()
+
     def get_or_create_revenue_category(self, category_name: str) -> RevenueCategory:
         """Get or create revenue category."""
         category = self.db.query(RevenueCategory).filter(
@@ -14,6 +14,9 @@ Usage:
 
     # Run once (for testing)
     python scripts/maintenance/schedule_refresh.py --run-once
+
+    # Drop cached finance pages before checking
+    python scripts/maintenance/schedule_refresh.py --run-once --clear-http-cache
 """
 
 import argparse
@@ -31,7 +34,10 @@ import structlog
 
 from src.config.database import SessionLocal
 from src.config.settings import settings
-from src.data_pipeline.orchestration.refresh_workflows import DataRefreshOrchestrator
+from src.data_pipeline.orchestration.refresh_workflows import (
+    DataRefreshOrchestrator,
+    clear_http_cache,
+)
 from src.database.models.core import City
 
 logger = structlog.get_logger(__name__)
@@ -56,27 +62,25 @@ class DataRefreshScheduler:
 
         db = SessionLocal()
         try:
-            orchestrator = DataRefreshOrchestrator(db)
+            orchestrator = DataRefreshOrchestrator(db, warm_up_connections=True)
 
             # Get all active cities
             cities = db.query(City).filter(City.is_active == True).all()
 
+            results = orchestrator.run_quarterly_check_all(cities)
+
             for city in cities:
-                logger.info("checking_cafr_for_city", city=city.name)
-                try:
-                    result = orchestrator.run_quarterly_check(city.id)
-
-                    if result["cafr_found"]:
-                        logger.info(
-                            "new_cafr_found_and_notified",
-                            city=city.name,
-                            notification_sent=result["notification_sent"],
-                        )
-                    else:
-                        logger.info("no_new_cafr", city=city.name)
-
-                except Exception as e:
-                    logger.error("cafr_check_failed", city=city.name, error=str(e))
+                result = results[city.id]
+                if "error" in result:
+                    logger.error("cafr_check_failed", city=city.name, error=result["error"])
+                elif result["cafr_found"]:
+                    logger.info(
+                        "new_cafr_found_and_notified",
+                        city=city.name,
+                        notification_sent=result["notification_sent"],
+                    )
+                else:
+                    logger.info("no_new_cafr", city=city.name)
 
         finally:
             db.close()
@@ -91,27 +95,25 @@ class DataRefreshScheduler:
 
         db = SessionLocal()
         try:
-            orchestrator = DataRefreshOrchestrator(db)
+            orchestrator = DataRefreshOrchestrator(db, warm_up_connections=True)
 
             # Get all active cities
             cities = db.query(City).filter(City.is_active == True).all()
 
+            results = orchestrator.run_annual_check_all(cities)
+
             for city in cities:
-                logger.info("checking_calpers_for_city", city=city.name)
-                try:
-                    result = orchestrator.run_annual_check(city.id)
-
-                    if result["calpers_found"]:
-                        logger.info(
-                            "new_calpers_found_and_notified",
-                            city=city.name,
-                            notification_sent=result["notification_sent"],
-                        )
-                    else:
-                        logger.info("no_new_calpers", city=city.name)
-
-                except Exception as e:
-                    logger.error("calpers_check_failed", city=city.name, error=str(e))
+                result = results[city.id]
+                if "error" in result:
+                    logger.error("calpers_check_failed", city=city.name, error=result["error"])
+                elif result["calpers_found"]:
+                    logger.info(
+                        "new_calpers_found_and_notified",
+                        city=city.name,
+                        notification_sent=result["notification_sent"],
+                    )
+                else:
+                    logger.info("no_new_calpers", city=city.name)
 
         finally:
             db.close()
@@ -172,6 +174,11 @@ def main():
         action="store_true",
         help="Run only CalPERS check (with --run-once)",
     )
+    parser.add_argument(
+        "--clear-http-cache",
+        action="store_true",
+        help="Drop cached finance page responses before running",
+    )
 
     args = parser.parse_args()
 
@@ -182,6 +189,10 @@ def main():
         run_once=args.run_once,
     )
 
+    if args.clear_http_cache:
+        clear_http_cache()
+        logger.info("http_cache_cleared")
+
     scheduler_instance = DataRefreshScheduler()
 
     if args.run_once:
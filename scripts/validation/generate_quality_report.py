@@ -140,10 +140,10 @@ def generate_html_report(
             html_parts.append(f"    <h3>Fiscal Year {year}</h3>")
 
             for alert in alerts:
-                alert_class = alert.severity.value
+                alert_class = alert.severity
                 html_parts.extend([
                     f"    <div class='alert-box {alert_class}'>",
-                    f"        <p class='{alert_class}'><strong>{alert.severity.value.upper()}</strong> - {alert.category}</p>",
+                    f"        <p class='{alert_class}'><strong>{alert.severity.upper()}</strong> - {alert.category}</p>",
                     f"        <p>{alert.message}</p>",
                     "        <p><strong>Details:</strong></p>",
                     "        <ul>",
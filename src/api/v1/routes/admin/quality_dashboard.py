@@ -14,6 +14,7 @@ from src.api.dependencies import get_db
 from src.data_quality import (
     DataQualityValidator,
     QualityMetricsCalculator,
+    ValidationAlert,
     ValidationSeverity,
     ValidationStatus,
 )
@@ -109,14 +110,14 @@ async def get_quality_status(
     all_metrics = []
     all_alerts = []
 
-    for fy in fiscal_years:
-        # Calculate metrics
-        metrics = metrics_calculator.calculate_metrics(fy)
-        all_metrics.append(metrics)
+    # Validate every year from one prefetch per table, and score the years
+    # from those same alerts instead of re-validating each one
+    alerts_by_year = validator.validate_city(city_id)
+    metrics_by_year = metrics_calculator.calculate_metrics_for_city(city_id, alerts_by_year)
 
-        # Get validation alerts
-        alerts = validator.validate_fiscal_year(fy)
-        all_alerts.extend(alerts)
+    for fy in fiscal_years:
+        all_metrics.append(metrics_by_year[fy.year])
+        all_alerts.extend(alerts_by_year[fy.year])
 
     # Get summary statistics
     summary = metrics_calculator.get_summary_statistics(all_metrics)
@@ -176,14 +177,14 @@ async def get_fiscal_year_quality(
             detail=f"Fiscal year {year} not found for city ID {city_id}",
         )
 
-    # Calculate metrics
-    metrics_calculator = QualityMetricsCalculator(db)
-    metrics = metrics_calculator.calculate_metrics(fiscal_year)
-
     # Get validation alerts
     validator = DataQualityValidator(db)
     alerts = validator.validate_fiscal_year(fiscal_year)
 
+    # Calculate metrics from the same alerts
+    metrics_calculator = QualityMetricsCalculator(db)
+    metrics = metrics_calculator.calculate_metrics(fiscal_year, alerts=alerts)
+
     return FiscalYearQualityResponse(
         fiscal_year=year,
         metrics=QualityMetricsResponse(**metrics.to_dict()),
@@ -192,6 +193,19 @@ async def get_fiscal_year_quality(
     )
 
 
+def _collect_alerts(
+    validator: DataQualityValidator,
+    city_id: int,
+    fiscal_years: List[FiscalYear],
+    fiscal_year: Optional[int],
+) -> List[ValidationAlert]:
+    """Validate the requested fiscal year, or every year of the city from one prefetch per table."""
+    if fiscal_year:
+        return [alert for fy in fiscal_years for alert in validator.validate_fiscal_year(fy)]
+
+    return [alert for alerts in validator.validate_city(city_id).values() for alert in alerts]
+
+
 @router.get("/alerts", response_model=List[ValidationAlertResponse])
 async def get_validation_alerts(
     city_id: int = Query(..., description="City ID"),
@@ -227,21 +241,16 @@ async def get_validation_alerts(
         return []
 
     # Collect all alerts
-    validator = DataQualityValidator(db)
-    all_alerts = []
-
-    for fy in fiscal_years:
-        alerts = validator.validate_fiscal_year(fy)
-        all_alerts.extend(alerts)
+    all_alerts = _collect_alerts(DataQualityValidator(db), city_id, fiscal_years, fiscal_year)
 
     # Apply filters
     filtered_alerts = all_alerts
 
     if severity:
         try:
-            severity_enum = ValidationSeverity(severity.lower())
+            severity_value = ValidationSeverity(severity.lower()).value
             filtered_alerts = [
-                a for a in filtered_alerts if a.severity == severity_enum
+                a for a in filtered_alerts if a.severity == severity_value
             ]
         except ValueError:
             raise HTTPException(
@@ -256,9 +265,9 @@ async def get_validation_alerts(
 
     # Sort by severity (critical first) then by fiscal year
     severity_order = {
-        ValidationSeverity.CRITICAL: 0,
-        ValidationSeverity.WARNING: 1,
-        ValidationSeverity.INFO: 2,
+        ValidationSeverity.CRITICAL.value: 0,
+        ValidationSeverity.WARNING.value: 1,
+        ValidationSeverity.INFO.value: 2,
     }
     filtered_alerts.sort(
         key=lambda a: (severity_order[a.severity], -a.fiscal_year)
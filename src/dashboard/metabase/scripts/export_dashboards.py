@@ -22,12 +22,66 @@ Usage:
 import argparse
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to httpx's stdlib JSON decoding
+    orjson = None
+
+# Characters replaced with "_" when deriving a dashboard's export filename
+_FILENAME_TABLE = str.maketrans({" ": "_", "-": "_", "/": "_", ":": "_"})
+
+
+# Concurrent dashboard fetches, multiplexed over the client's HTTP/2 connection
+MAX_FETCH_WORKERS = 8
+
+# Concurrent dashboard conversions/file writes during a full export
+MAX_WRITE_WORKERS = 4
+
+# GETs answered with one of these statuses are retried with exponential
+# backoff (1s, 2s, 4s); the transport itself only retries failed connects
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 1.0
+
+# Exported config skeletons. Placeholder keys fix the field order in the
+# written JSON; convert_dashboard_to_config fills in per-dashboard values.
+_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "name": None,
+    "description": "",
+    "dashboard_version": "1.0",
+    "created_for": "IBCo Vallejo Console",
+    "parameters": None,
+    "questions": None,
+    "layout": None,
+    "public_access": None,
+    "metadata": None,
+}
+_PUBLIC_ACCESS_TEMPLATE: Dict[str, Any] = {
+    "enabled": False,
+    "embedding_enabled": False,
+    "signed_embedding": False,
+    "auto_refresh_interval": 86400,
+}
+_METADATA_TEMPLATE: Dict[str, Any] = {
+    "created_by": "IBCo System",
+    "version": "1.0",
+    "metabase_dashboard_id": None,
+    "exported_at": "",
+    "data_source": "PostgreSQL - IBCo Production Database",
+    "public_url": None,
+}
+
+
+def _fast_json_hook(response: httpx.Response) -> None:
+    """Response hook that decodes JSON bodies with orjson."""
+    response.json = lambda **_: orjson.loads(response.content)
 
 
 class MetabaseExporter:
@@ -39,16 +93,31 @@ class MetabaseExporter:
         self.username = username
         self.password = password
         self.session_token: Optional[str] = None
-
-        # Configure session with retries
-        self.session = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
+        self._all_cards: Optional[Dict[int, Dict[str, Any]]] = None
+
+        # Configure an HTTP/2 session with connection retries (server errors
+        # are retried by _get). Requests share (and multiplex over) kept-alive
+        # connections; httpx sends "Accept-Encoding: gzip, deflate" by default.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        self.session = httpx.Client(
+            transport=transport,
+            timeout=30.0,
+            event_hooks={"response": [_fast_json_hook] if orjson is not None else []},
         )
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+
+    def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET, retrying with backoff while Metabase answers with a server error."""
+        for attempt in range(MAX_RETRIES):
+            response = self.session.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES:
+                return response
+            time.sleep(BACKOFF_FACTOR * 2**attempt)
+
+        return self.session.get(url, **kwargs)
 
     def authenticate(self) -> None:
         """Authenticate and get session token."""
@@ -66,7 +135,7 @@ class MetabaseExporter:
     def get_all_dashboards(self) -> List[Dict[str, Any]]:
         """Get all dashboards."""
         url = f"{self.base_url}/api/dashboard"
-        response = self.session.get(url)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
@@ -74,7 +143,7 @@ class MetabaseExporter:
     def get_dashboard_by_id(self, dashboard_id: int) -> Dict[str, Any]:
         """Get dashboard by ID with full details."""
         url = f"{self.base_url}/api/dashboard/{dashboard_id}"
-        response = self.session.get(url)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
@@ -88,21 +157,40 @@ class MetabaseExporter:
 
         return None
 
+    def get_all_cards(self) -> Dict[int, Dict[str, Any]]:
+        """Get all questions (cards) in a single request, keyed by card ID."""
+        url = f"{self.base_url}/api/card"
+        response = self._get(url, params={"f": "all"})
+        response.raise_for_status()
+
+        return {card["id"]: card for card in response.json()}
+
     def get_question(self, question_id: int) -> Dict[str, Any]:
-        """Get question (card) details."""
+        """Get question (card) details.
+
+        Cards are fetched in bulk once per exporter and looked up locally;
+        the per-card endpoint is only hit for cards missing from that listing.
+        """
+        if self._all_cards is None:
+            self._all_cards = self.get_all_cards()
+
+        if question_id in self._all_cards:
+            return self._all_cards[question_id]
+
         url = f"{self.base_url}/api/card/{question_id}"
-        response = self.session.get(url)
+        response = self._get(url)
         response.raise_for_status()
 
         return response.json()
 
     def convert_dashboard_to_config(self, dashboard: Dict[str, Any]) -> Dict[str, Any]:
         """Convert Metabase dashboard format to our JSON config format."""
-        # Get all questions used in dashboard
-        questions = []
-        question_id_map = {}
+        # Build questions and layout in a single pass over the dashboard cards
+        ordered_cards = dashboard.get("ordered_cards", [])
+        questions: List[Optional[Dict[str, Any]]] = [None] * len(ordered_cards)
+        layout_cards: List[Optional[Dict[str, Any]]] = [None] * len(ordered_cards)
 
-        for idx, card in enumerate(dashboard.get("ordered_cards", [])):
+        for idx, card in enumerate(ordered_cards):
             card_id = card["card_id"]
 
             # Fetch full question details
@@ -110,13 +198,12 @@ class MetabaseExporter:
 
             # Generate question ID for our config
             question_config_id = f"q{idx + 1}"
-            question_id_map[card_id] = question_config_id
 
             # Convert to our format
             question_config = {
                 "id": question_config_id,
                 "name": question["name"],
-                "description": question.get("description", ""),
+                "description": question.get("description") or "",
                 "visualization": {
                     "type": question["display"],
                 },
@@ -131,26 +218,22 @@ class MetabaseExporter:
             if question["dataset_query"]["type"] == "native":
                 question_config["query"]["native"] = question["dataset_query"]["native"]
 
-            questions.append(question_config)
-
-        # Build layout
-        layout = {
-            "width": 12,
-            "cards": [],
-        }
+            questions[idx] = question_config
 
-        for card in dashboard.get("ordered_cards", []):
-            card_id = card["card_id"]
-            question_config_id = question_id_map[card_id]
-
-            layout["cards"].append({
+            layout_cards[idx] = {
                 "id": f"card_{question_config_id}",
                 "question_id": question_config_id,
                 "row": card.get("row", 0),
                 "col": card.get("col", 0),
                 "size_x": card.get("sizeX", 6),
                 "size_y": card.get("sizeY", 4),
-            })
+            }
+
+        # Build layout
+        layout = {
+            "width": 12,
+            "cards": layout_cards,
+        }
 
         # Check if dashboard has public sharing enabled
         public_enabled = False
@@ -159,27 +242,23 @@ class MetabaseExporter:
             public_enabled = True
             public_url = f"{self.base_url}/public/dashboard/{dashboard['public_uuid']}"
 
-        # Build complete config
+        # Build complete config from the templates (overrides keep key order)
         config = {
+            **_CONFIG_TEMPLATE,
             "name": dashboard["name"],
-            "description": dashboard.get("description", ""),
-            "dashboard_version": "1.0",
-            "created_for": "IBCo Vallejo Console",
+            "description": dashboard.get("description") or "",
             "parameters": dashboard.get("parameters", []),
             "questions": questions,
             "layout": layout,
             "public_access": {
+                **_PUBLIC_ACCESS_TEMPLATE,
                 "enabled": public_enabled,
                 "embedding_enabled": public_enabled,
-                "signed_embedding": False,
-                "auto_refresh_interval": 86400,
             },
             "metadata": {
-                "created_by": "IBCo System",
-                "version": "1.0",
+                **_METADATA_TEMPLATE,
                 "metabase_dashboard_id": dashboard["id"],
                 "exported_at": dashboard.get("updated_at", ""),
-                "data_source": "PostgreSQL - IBCo Production Database",
                 "public_url": public_url,
             },
         }
@@ -189,17 +268,29 @@ class MetabaseExporter:
     def export_dashboard(self, dashboard_id: int, output_dir: Path) -> Path:
         """Export single dashboard to JSON file."""
         dashboard = self.get_dashboard_by_id(dashboard_id)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return self.write_dashboard(dashboard, output_dir)
+
+    def write_dashboard(self, dashboard: Dict[str, Any], output_dir: Path) -> Path:
+        """Convert already-fetched dashboard details and write them to a JSON file.
+
+        The caller is responsible for creating ``output_dir``.
+        """
         config = self.convert_dashboard_to_config(dashboard)
 
         # Generate filename from dashboard name
-        filename = dashboard["name"].lower().replace(" ", "_").replace("-", "_")
-        filename = f"{filename}.json"
+        filename = f"{dashboard['name'].lower().translate(_FILENAME_TABLE)}.json"
         output_file = output_dir / filename
 
+        # Skip the write when the file on disk is already identical, so that
+        # re-exports don't churn timestamps or produce spurious git diffs
+        new_bytes = json.dumps(config, indent=2).encode("utf-8")
+        if output_file.exists() and output_file.read_bytes() == new_bytes:
+            print(f"✓ Unchanged: {output_file}")
+            return output_file
+
         # Write to file
-        output_dir.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w") as f:
-            json.dump(config, f, indent=2)
+        output_file.write_bytes(new_bytes)
 
         print(f"✓ Exported '{dashboard['name']}' to {output_file}")
         return output_file
@@ -211,13 +302,36 @@ class MetabaseExporter:
 
         print(f"\nExporting {len(dashboards)} dashboard(s)...\n")
 
-        for dashboard in dashboards:
-            try:
-                output_file = self.export_dashboard(dashboard["id"], output_dir)
-                exported_files.append(output_file)
-            except Exception as e:
-                print(f"✗ Failed to export '{dashboard['name']}': {e}")
-                continue
+        # Load the card listing up front so worker threads only read it
+        self._all_cards = self.get_all_cards()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as write_executor:
+            fetch_futures = [
+                fetch_executor.submit(self.get_dashboard_by_id, dashboard["id"])
+                for dashboard in dashboards
+            ]
+
+            # Hand each dashboard to the write pool as soon as its details arrive
+            write_futures = []
+            for dashboard, fetch_future in zip(dashboards, fetch_futures):
+                try:
+                    details = fetch_future.result()
+                except Exception as e:
+                    print(f"✗ Failed to export '{dashboard['name']}': {e}")
+                    continue
+
+                write_futures.append(
+                    (dashboard, write_executor.submit(self.write_dashboard, details, output_dir))
+                )
+
+            for dashboard, write_future in write_futures:
+                try:
+                    exported_files.append(write_future.result())
+                except Exception as e:
+                    print(f"✗ Failed to export '{dashboard['name']}': {e}")
+                    continue
 
         return exported_files
 
@@ -21,16 +21,148 @@ Usage:
 """
 
 import argparse
+import atexit
+import hashlib
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from jsonschema import Draft202012Validator
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+SEPARATOR = "=" * 60
+
+# Maximum number of questions created concurrently per dashboard; bounds the
+# load we put on Metabase in place of a fixed sleep between requests
+MAX_QUESTION_WORKERS = 5
+
+# Maximum number of dashboard files imported concurrently
+MAX_DASHBOARD_WORKERS = 4
+
+# Pooled keep-alive connections; at least one per concurrent request so
+# threads never wait on (or churn through) connections
+POOL_SIZE = max(32, MAX_DASHBOARD_WORKERS * MAX_QUESTION_WORKERS)
+
+# Dashboard batches at least this large are parsed in worker processes;
+# smaller ones don't amortize the process start-up cost
+PARALLEL_PARSE_MIN_FILES = 16
+
+# Metabase session tokens are cached here between runs (one file per
+# server/user) and reused until shortly before they expire
+TOKEN_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "metabase_import"
+)
+TOKEN_TTL_SECONDS = 14 * 24 * 3600  # Metabase's default session lifetime
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Backoff for rate-limited (429) writes
+MAX_BACKOFF_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 30.0
+
+# Shape of a dashboard JSON file, checked before any request is made so a
+# malformed file can't leave a half-imported dashboard behind
+DASHBOARD_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        # Metabase reports an unset description as null
+        "description": {"type": ["string", "null"]},
+        "parameters": {"type": "array"},
+        "questions": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "name", "query", "visualization"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "description": {"type": ["string", "null"]},
+                    "query": {
+                        "type": "object",
+                        "required": ["type"],
+                        "properties": {"type": {"enum": ["native", "query"]}},
+                        "if": {"properties": {"type": {"const": "native"}}},
+                        "then": {"required": ["native"]},
+                    },
+                    "visualization": {
+                        "type": "object",
+                        "required": ["type"],
+                        "properties": {"type": {"type": "string"}},
+                    },
+                    "display": {"type": "object"},
+                },
+            },
+        },
+        "layout": {
+            "type": "object",
+            "required": ["cards"],
+            "properties": {
+                "cards": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["question_id", "row", "col", "size_x", "size_y"],
+                        "properties": {
+                            "question_id": {"type": "string"},
+                            "row": {"type": "integer"},
+                            "col": {"type": "integer"},
+                            "size_x": {"type": "integer"},
+                            "size_y": {"type": "integer"},
+                        },
+                    },
+                },
+            },
+        },
+        "public_access": {"type": "object"},
+    },
+}
+
+# Built once; validating against a prepared validator skips per-call setup
+Draft202012Validator.check_schema(DASHBOARD_SCHEMA)
+_dashboard_validator = Draft202012Validator(DASHBOARD_SCHEMA)
+
+
+@dataclass(slots=True)
+class DashCard:
+    """A dashcard in a PUT /api/dashboard/{id}/cards request."""
+
+    id: int
+    card_id: int
+    row: int
+    col: int
+    size_x: int
+    size_y: int
+
+    def serialize(self) -> bytes:
+        """Serialize to the JSON object Metabase expects."""
+        return (
+            b'{"id":%d,"card_id":%d,"row":%d,"col":%d,"size_x":%d,"size_y":%d,'
+            b'"series":[],"parameter_mappings":[]}'
+            % (self.id, self.card_id, self.row, self.col, self.size_x, self.size_y)
+        )
+
 
 class MetabaseClient:
     """Client for Metabase API operations."""
@@ -42,18 +174,100 @@ class MetabaseClient:
         self.password = password
         self.session_token: Optional[str] = None
 
+        # Name -> object indexes of the /api/database and /api/dashboard lists,
+        # fetched once and kept current as we create/delete objects
+        self._database_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dashboard_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index_lock = threading.Lock()
+
+        # Content hash of a question payload -> its (pending) Metabase card ID,
+        # so identical questions shared between dashboards are created once
+        self._question_cache: Dict[str, "Future[int]"] = {}
+        self._question_lock = threading.Lock()
+
+        # AIMD limit on concurrent writes: grows additively on success and
+        # halves whenever Metabase answers 429 Too Many Requests
+        self._concurrency_window = float(MAX_QUESTION_WORKERS)
+        self._in_flight = 0
+        self._window_cond = threading.Condition()
+
         # Configure session with retries
         self.session = requests.Session()
         retries = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
         )
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            pool_block=False,
+            max_retries=retries,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+    def _token_cache_path(self) -> Path:
+        """Get the session token cache file for this server and user."""
+        key = hashlib.blake2b(
+            f"{self.base_url}|{self.username}".encode("utf-8"), digest_size=8
+        ).hexdigest()
+        return TOKEN_CACHE_DIR / f"{key}.json"
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Get a cached session token that is unexpired and still accepted."""
+        try:
+            cached = json.loads(self._token_cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+
+        # A malformed cache file just means authenticating afresh
+        if not isinstance(cached, dict) or not isinstance(cached.get("id"), str):
+            return None
+
+        expires = cached.get("expires", 0)
+        if not isinstance(expires, (int, float)):
+            return None
+        if expires <= time.time() + TOKEN_EXPIRY_MARGIN_SECONDS:
+            return None
+
+        # Cheap check that the server hasn't dropped the session (e.g. restart)
+        response = self.session.get(
+            f"{self.base_url}/api/user/current",
+            headers={"X-Metabase-Session": cached["id"]},
+        )
+        return cached["id"] if response.ok else None
+
+    def _save_cached_token(self, token: str) -> None:
+        """Cache a session token for later runs, readable only by this user."""
+        path = self._token_cache_path()
+        data = json.dumps({"id": token, "expires": time.time() + TOKEN_TTL_SECONDS})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # mkstemp creates the file 0600, so the token is never readable by
+            # others; the rename then swaps it in atomically
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".token-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            log.warning(f"Could not cache Metabase session token: {e}")
 
     def authenticate(self) -> None:
-        """Authenticate and get session token."""
+        """Authenticate and get session token, reusing a cached one if valid."""
+        token = self._load_cached_token()
+        if token:
+            self.session_token = token
+            self.session.headers.update({"X-Metabase-Session": token})
+            log.info(f"✓ Reusing cached Metabase session for {self.username}")
+            return
+
         url = f"{self.base_url}/api/session"
         payload = {"username": self.username, "password": self.password}
 
@@ -62,63 +276,137 @@ class MetabaseClient:
 
         self.session_token = response.json()["id"]
         self.session.headers.update({"X-Metabase-Session": self.session_token})
+        self._save_cached_token(self.session_token)
+
+        log.info(f"✓ Authenticated to Metabase as {self.username}")
+
+    def _acquire_write_slot(self) -> None:
+        """Block until the number of in-flight writes is below the window."""
+        with self._window_cond:
+            while self._in_flight >= int(self._concurrency_window):
+                self._window_cond.wait()
+            self._in_flight += 1
+
+    def _release_write_slot(self, rate_limited: bool) -> None:
+        """Release a write slot and adjust the window (AIMD)."""
+        with self._window_cond:
+            self._in_flight -= 1
+            if rate_limited:
+                self._concurrency_window = max(1.0, self._concurrency_window / 2)
+            else:
+                self._concurrency_window = min(
+                    float(POOL_SIZE),
+                    self._concurrency_window + 1 / self._concurrency_window,
+                )
+            self._window_cond.notify_all()
+
+    def _post_with_backoff(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST, backing off and retrying while Metabase rate-limits us."""
+        if orjson is not None and "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Type": "application/json",
+            }
 
-        print(f"✓ Authenticated to Metabase as {self.username}")
+        for attempt in range(MAX_BACKOFF_ATTEMPTS):
+            self._acquire_write_slot()
+            rate_limited = False
+            try:
+                response = self.session.post(url, **kwargs)
+                rate_limited = response.status_code == 429
+            finally:
+                self._release_write_slot(rate_limited)
+
+            if not rate_limited:
+                return response
+
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = BACKOFF_BASE_SECONDS * 2**attempt * (1 + random.random() * 0.5)
+            time.sleep(min(delay, BACKOFF_CAP_SECONDS))
 
-    def get_database_id(self, database_name: str = "IBCo Production") -> Optional[int]:
-        """Get database ID by name."""
-        url = f"{self.base_url}/api/database"
-        response = self.session.get(url)
-        response.raise_for_status()
+        return response
+
+    def _get_database_index(self) -> Dict[str, Dict[str, Any]]:
+        """Get databases keyed by name, fetching the list only once.
+
+        Metabase has no server-side name filter for this endpoint. The listing
+        stays lean as long as we never ask for ``include=tables``, which would
+        embed every table's metadata in the response.
+        """
+        with self._index_lock:
+            if self._database_index is None:
+                url = f"{self.base_url}/api/database"
+                response = self.session.get(url)
+                response.raise_for_status()
+
+                databases = response.json()
+                # Newer Metabase versions wrap the list as {"data": [...]}
+                if isinstance(databases, dict):
+                    databases = databases.get("data", [])
+                self._database_index = {db["name"]: db for db in databases}
+
+            return self._database_index
 
-        databases = response.json()
-        for db in databases:
-            if db["name"] == database_name:
-                return db["id"]
+    def _get_dashboard_index(self) -> Dict[str, Dict[str, Any]]:
+        """Get dashboards keyed by name, fetching the list only once."""
+        with self._index_lock:
+            if self._dashboard_index is None:
+                url = f"{self.base_url}/api/dashboard"
+                response = self.session.get(url)
+                response.raise_for_status()
 
-        return None
+                self._dashboard_index = {d["name"]: d for d in response.json()}
+
+            return self._dashboard_index
+
+    def get_database_id(self, database_name: str = "IBCo Production") -> Optional[int]:
+        """Get database ID by name."""
+        db = self._get_database_index().get(database_name)
+        return db["id"] if db else None
 
     def create_database(self, config: Dict[str, Any]) -> int:
         """Create database connection if not exists."""
         db_id = self.get_database_id(config["name"])
         if db_id:
-            print(f"✓ Database '{config['name']}' already exists (ID: {db_id})")
+            log.info(f"✓ Database '{config['name']}' already exists (ID: {db_id})")
             return db_id
 
         url = f"{self.base_url}/api/database"
-        response = self.session.post(url, json=config)
+        response = self._post_with_backoff(url, json=config)
         response.raise_for_status()
 
-        db_id = response.json()["id"]
-        print(f"✓ Created database '{config['name']}' (ID: {db_id})")
+        database = response.json()
+        db_id = database["id"]
+        self._get_database_index()[config["name"]] = database
+        log.info(f"✓ Created database '{config['name']}' (ID: {db_id})")
         return db_id
 
     def get_dashboard_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get dashboard by name."""
-        url = f"{self.base_url}/api/dashboard"
-        response = self.session.get(url)
-        response.raise_for_status()
-
-        dashboards = response.json()
-        for dashboard in dashboards:
-            if dashboard["name"] == name:
-                return dashboard
-
-        return None
+        return self._get_dashboard_index().get(name)
 
     def delete_dashboard(self, dashboard_id: int) -> None:
         """Delete dashboard by ID."""
         url = f"{self.base_url}/api/dashboard/{dashboard_id}"
         response = self.session.delete(url)
         response.raise_for_status()
-        print(f"✓ Deleted existing dashboard (ID: {dashboard_id})")
+
+        index = self._get_dashboard_index()
+        for name, dashboard in list(index.items()):
+            if dashboard["id"] == dashboard_id:
+                del index[name]
+        log.info(f"✓ Deleted existing dashboard (ID: {dashboard_id})")
 
     def create_question(self, database_id: int, question_config: Dict[str, Any]) -> int:
         """Create a Metabase question (saved query)."""
         # Convert our JSON format to Metabase API format
         payload = {
             "name": question_config["name"],
-            "description": question_config.get("description", ""),
+            "description": question_config.get("description") or "",
             "dataset_query": {
                 "type": question_config["query"]["type"],
                 "database": database_id,
@@ -131,65 +419,104 @@ class MetabaseClient:
         if question_config["query"]["type"] == "native":
             payload["dataset_query"]["native"] = question_config["query"]["native"]
 
-        url = f"{self.base_url}/api/card"
-        response = self.session.post(url, json=payload)
-        response.raise_for_status()
+        # Reuse the card if an identical question was already created (or is
+        # being created by another thread) during this run
+        key = hashlib.blake2b(
+            json.dumps(payload, sort_keys=True).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        with self._question_lock:
+            pending = self._question_cache.get(key)
+            if pending is None:
+                pending = self._question_cache[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            question_id = pending.result()
+            log.info(f"  ✓ Reusing question: {question_config['name']} (ID: {question_id})")
+            return question_id
 
-        question_id = response.json()["id"]
-        print(f"  ✓ Created question: {question_config['name']} (ID: {question_id})")
+        try:
+            url = f"{self.base_url}/api/card"
+            response = self._post_with_backoff(url, json=payload)
+            response.raise_for_status()
+            question_id = response.json()["id"]
+        except Exception as e:
+            # Let a later attempt retry instead of caching the failure
+            with self._question_lock:
+                del self._question_cache[key]
+            pending.set_exception(e)
+            raise
+
+        pending.set_result(question_id)
+        log.info(f"  ✓ Created question: {question_config['name']} (ID: {question_id})")
         return question_id
 
     def create_dashboard(self, dashboard_config: Dict[str, Any]) -> int:
         """Create dashboard."""
         payload = {
             "name": dashboard_config["name"],
-            "description": dashboard_config.get("description", ""),
+            "description": dashboard_config.get("description") or "",
             "parameters": dashboard_config.get("parameters", []),
         }
 
         url = f"{self.base_url}/api/dashboard"
-        response = self.session.post(url, json=payload)
+        response = self._post_with_backoff(url, json=payload)
         response.raise_for_status()
 
-        dashboard_id = response.json()["id"]
-        print(f"✓ Created dashboard: {dashboard_config['name']} (ID: {dashboard_id})")
+        dashboard = response.json()
+        dashboard_id = dashboard["id"]
+        self._get_dashboard_index()[dashboard_config["name"]] = dashboard
+        log.info(f"✓ Created dashboard: {dashboard_config['name']} (ID: {dashboard_id})")
         return dashboard_id
 
     def add_cards_to_dashboard(
         self,
         dashboard_id: int,
         layout: Dict[str, Any],
-        question_id_map: Dict[str, int],
+        question_ids: Tuple[int, ...],
+        card_question_indexes: List[int],
     ) -> None:
-        """Add question cards to dashboard with layout."""
-        url = f"{self.base_url}/api/dashboard/{dashboard_id}/cards"
+        """Add question cards to dashboard with layout in a single request.
 
-        for card in layout["cards"]:
-            question_id = question_id_map[card["question_id"]]
+        ``card_question_indexes[i]`` is the position in ``question_ids`` of the
+        question shown by the i-th layout card (see ``resolve_layout``).
+        Metabase creates every dashcard with a negative ``id`` in one
+        transaction, so a failure never leaves a half-populated dashboard.
+        """
+        url = f"{self.base_url}/api/dashboard/{dashboard_id}/cards"
 
-            card_payload = {
-                "cardId": question_id,
-                "row": card["row"],
-                "col": card["col"],
-                "sizeX": card["size_x"],
-                "sizeY": card["size_y"],
-            }
+        dashcards = [
+            DashCard(
+                id=-(idx + 1),
+                card_id=question_ids[card_question_indexes[idx]],
+                row=card["row"],
+                col=card["col"],
+                size_x=card["size_x"],
+                size_y=card["size_y"],
+            )
+            for idx, card in enumerate(layout["cards"])
+        ]
+        body = b'{"cards":[' + b",".join(dc.serialize() for dc in dashcards) + b"]}"
 
-            response = self.session.post(url, json=card_payload)
-            response.raise_for_status()
+        response = self.session.put(
+            url, data=body, headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
 
-        print(f"  ✓ Added {len(layout['cards'])} cards to dashboard")
+        log.info(f"  ✓ Added {len(layout['cards'])} cards to dashboard")
 
     def enable_public_sharing(self, dashboard_id: int) -> str:
         """Enable public sharing for dashboard and return public URL."""
         url = f"{self.base_url}/api/dashboard/{dashboard_id}/public_link"
-        response = self.session.post(url)
+        response = self._post_with_backoff(url)
         response.raise_for_status()
 
         public_uuid = response.json()["uuid"]
         public_url = f"{self.base_url}/public/dashboard/{public_uuid}"
 
-        print(f"  ✓ Enabled public access: {public_url}")
+        log.info(f"  ✓ Enabled public access: {public_url}")
         return public_url
 
     def import_dashboard(
@@ -205,31 +532,37 @@ class MetabaseClient:
             if delete_existing:
                 self.delete_dashboard(existing["id"])
             else:
-                print(
+                log.warning(
                     f"✗ Dashboard '{dashboard_config['name']}' already exists. "
                     f"Use --delete-existing to overwrite."
                 )
                 return existing
 
-        # Create questions
-        print(f"Creating questions for '{dashboard_config['name']}'...")
-        question_id_map = {}
+        questions = dashboard_config.get("questions", [])
+        layout = dashboard_config.get("layout")
+        card_question_indexes = resolve_layout(questions, layout) if layout else []
 
-        for question in dashboard_config.get("questions", []):
-            question_id = self.create_question(database_id, question)
-            question_id_map[question["id"]] = question_id
-            time.sleep(0.5)  # Rate limiting
+        # Create the dashboard only once all of its questions exist, so a
+        # failed question doesn't leave an empty dashboard behind
+        log.info(f"Creating questions for '{dashboard_config['name']}'...")
+        with ThreadPoolExecutor(max_workers=MAX_QUESTION_WORKERS) as executor:
+            question_ids = tuple(
+                executor.map(lambda q: self.create_question(database_id, q), questions)
+            )
 
-        # Create dashboard
         dashboard_id = self.create_dashboard(dashboard_config)
 
         # Add cards to dashboard
-        if "layout" in dashboard_config:
-            self.add_cards_to_dashboard(
-                dashboard_id, dashboard_config["layout"], question_id_map
-            )
+        if layout:
+            try:
+                self.add_cards_to_dashboard(
+                    dashboard_id, layout, question_ids, card_question_indexes
+                )
+            except Exception:
+                self.delete_dashboard(dashboard_id)
+                raise
 
-        # Enable public access if specified
+        # Enable public access if specified, once the dashboard is complete
         public_url = None
         if dashboard_config.get("public_access", {}).get("enabled", False):
             public_url = self.enable_public_sharing(dashboard_id)
@@ -237,21 +570,70 @@ class MetabaseClient:
         return {
             "dashboard_id": dashboard_id,
             "dashboard_name": dashboard_config["name"],
-            "question_count": len(question_id_map),
+            "question_count": len(question_ids),
             "public_url": public_url,
         }
 
 
-def load_dashboard_config(file_path: Path) -> Dict[str, Any]:
-    """Load dashboard configuration from JSON file."""
-    with open(file_path, "r") as f:
-        return json.load(f)
+def resolve_layout(questions: List[Dict[str, Any]], layout: Dict[str, Any]) -> List[int]:
+    """Map each layout card to the index of its question in ``questions``.
+
+    Run before anything is created, so a card referencing an unknown question
+    fails the import up front instead of after the questions were posted.
+    """
+    question_index = {question["id"]: idx for idx, question in enumerate(questions)}
+    try:
+        return [question_index[card["question_id"]] for card in layout["cards"]]
+    except KeyError as e:
+        raise ValueError(f"Layout card references unknown question {e}") from None
+
+
+def find_dashboard_files(dashboard_dir: Path) -> List[str]:
+    """List the dashboard JSON files in a directory, sorted by name."""
+    with os.scandir(dashboard_dir) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+
+def load_dashboard_config(file_path: str) -> Dict[str, Any]:
+    """Load and validate dashboard configuration from JSON file."""
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            config = orjson.loads(f.read())
+    else:
+        with open(file_path, "r") as f:
+            config = json.load(f)
+
+    _dashboard_validator.validate(config)
+    return config
+
+
+def load_dashboard_configs(file_paths: List[str]) -> List[Any]:
+    """Load several dashboard configurations up front.
+
+    Returns one entry per file, in order: the parsed config, or the exception
+    raised while loading it.
+    """
+    if len(file_paths) < PARALLEL_PARSE_MIN_FILES:
+        configs: List[Any] = []
+        for file_path in file_paths:
+            try:
+                configs.append(load_dashboard_config(file_path))
+            except Exception as e:
+                configs.append(e)
+        return configs
+
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(load_dashboard_config, path) for path in file_paths]
+
+    return [future.exception() or future.result() for future in futures]
 
 
 def get_database_config() -> Dict[str, Any]:
     """Get database connection configuration."""
-    import os
-
     return {
         "name": "IBCo Production",
         "engine": "postgres",
@@ -267,6 +649,104 @@ def get_database_config() -> Dict[str, Any]:
     }
 
 
+def setup_logging() -> None:
+    """Log to stdout through a queue, so worker threads never block on I/O."""
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+
+
+def collect_dashboard_files(
+    dashboard: Optional[Path], dashboard_dir: Optional[Path]
+) -> List[str]:
+    """List the dashboard files to import: a single file, a directory, or the default dashboards."""
+    if dashboard:
+        return [str(dashboard)]
+    if dashboard_dir:
+        return find_dashboard_files(dashboard_dir)
+
+    # Default to dashboards directory
+    script_dir = Path(__file__).parent
+    return find_dashboard_files(script_dir.parent / "dashboards")
+
+
+def import_dashboards(
+    client: MetabaseClient,
+    database_id: int,
+    dashboard_files: List[str],
+    configs: List[Any],
+    delete_existing: bool = False,
+    enable_public_access: bool = False,
+) -> List[Dict[str, Any]]:
+    """Import loaded dashboard configs concurrently, logging each outcome.
+
+    Returns the results of the dashboards that imported successfully.
+    """
+
+    def import_one(dashboard_file: str, config: Any) -> Dict[str, Any]:
+        """Import a single already-loaded dashboard file."""
+        log.info(f"Importing: {os.path.basename(dashboard_file)}")
+        if isinstance(config, Exception):
+            raise config
+
+        # Override public access setting if flag provided
+        if enable_public_access:
+            config.setdefault("public_access", {})["enabled"] = True
+
+        return client.import_dashboard(config, database_id, delete_existing)
+
+    # Import dashboards concurrently; each file is independent
+    log.info(f"\nImporting {len(dashboard_files)} dashboard(s)...\n")
+
+    results = []
+    with ThreadPoolExecutor(max_workers=MAX_DASHBOARD_WORKERS) as executor:
+        futures = {
+            executor.submit(import_one, dashboard_file, config): dashboard_file
+            for dashboard_file, config in zip(dashboard_files, configs)
+        }
+
+        for future in as_completed(futures):
+            dashboard_file = futures[future]
+            try:
+                result = future.result()
+                results.append(result)
+
+                log.info(f"✓ Successfully imported '{result['dashboard_name']}'\n")
+
+            except Exception as e:
+                log.error(f"✗ Failed to import {os.path.basename(dashboard_file)}: {e}\n")
+                continue
+
+    return results
+
+
+def log_import_summary(total: int, results: List[Dict[str, Any]]) -> None:
+    """Log the import summary as a single record."""
+    summary = [
+        f"\n{SEPARATOR}",
+        "Import Summary",
+        SEPARATOR,
+        f"Total dashboards: {total}",
+        f"Successfully imported: {len(results)}",
+        f"Failed: {total - len(results)}\n",
+    ]
+
+    public_urls = [r for r in results if r.get("public_url")]
+    if public_urls:
+        summary.append("Public Dashboard URLs:")
+        summary.extend(f"  • {r['dashboard_name']}: {r['public_url']}" for r in public_urls)
+        summary.append("")
+
+    log.info("\n".join(summary))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Import Metabase dashboard configurations"
@@ -307,13 +787,12 @@ def main():
     )
 
     args = parser.parse_args()
+    setup_logging()
 
     # Get password from args or environment
-    import os
-
     password = args.metabase_password or os.getenv("METABASE_ADMIN_PASSWORD")
     if not password:
-        print("Error: Metabase password required (--metabase-password or METABASE_ADMIN_PASSWORD env var)")
+        log.error("Error: Metabase password required (--metabase-password or METABASE_ADMIN_PASSWORD env var)")
         sys.exit(1)
 
     # Initialize client
@@ -325,63 +804,26 @@ def main():
     database_id = client.create_database(db_config)
 
     # Collect dashboard files to import
-    dashboard_files = []
-    if args.dashboard:
-        dashboard_files = [args.dashboard]
-    elif args.dashboard_dir:
-        dashboard_files = list(args.dashboard_dir.glob("*.json"))
-    else:
-        # Default to dashboards directory
-        script_dir = Path(__file__).parent
-        dashboard_dir = script_dir.parent / "dashboards"
-        dashboard_files = list(dashboard_dir.glob("*.json"))
-
+    dashboard_files = collect_dashboard_files(args.dashboard, args.dashboard_dir)
     if not dashboard_files:
-        print("No dashboard files found")
+        log.error("No dashboard files found")
         sys.exit(1)
 
-    # Import each dashboard
-    print(f"\nImporting {len(dashboard_files)} dashboard(s)...\n")
-
-    results = []
-    for dashboard_file in dashboard_files:
-        print(f"{'=' * 60}")
-        print(f"Importing: {dashboard_file.name}")
-        print(f"{'=' * 60}")
-
-        try:
-            config = load_dashboard_config(dashboard_file)
+    # Parse every file before the network phase starts
+    configs = load_dashboard_configs(dashboard_files)
 
-            # Override public access setting if flag provided
-            if args.enable_public_access:
-                config.setdefault("public_access", {})["enabled"] = True
-
-            result = client.import_dashboard(config, database_id, args.delete_existing)
-            results.append(result)
-
-            print(f"✓ Successfully imported '{result['dashboard_name']}'\n")
+    results = import_dashboards(
+        client,
+        database_id,
+        dashboard_files,
+        configs,
+        delete_existing=args.delete_existing,
+        enable_public_access=args.enable_public_access,
+    )
 
-        except Exception as e:
-            print(f"✗ Failed to import {dashboard_file.name}: {e}\n")
-            continue
-
-    # Summary
-    print(f"\n{'=' * 60}")
-    print("Import Summary")
-    print(f"{'=' * 60}")
-    print(f"Total dashboards: {len(dashboard_files)}")
-    print(f"Successfully imported: {len(results)}")
-    print(f"Failed: {len(dashboard_files) - len(results)}\n")
-
-    # Print public URLs
-    public_urls = [r for r in results if r.get("public_url")]
-    if public_urls:
-        print("Public Dashboard URLs:")
-        for result in public_urls:
-            print(f"  • {result['dashboard_name']}: {result['public_url']}")
-        print()
+    log_import_summary(len(dashboard_files), results)
 
-    print("✓ Import complete!")
+    log.info("✓ Import complete!")
 
 
 if __name__ == "__main__":
@@ -5,13 +5,23 @@ Handles periodic checks for new source documents (CAFRs, CalPERS valuations),
 notifications to operators, and post-entry validation and analytics pipeline.
 """
 
+import atexit
+import os
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
 import requests
+import requests_cache
 import structlog
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 
 from src.analytics.projections.scenario_engine import ScenarioEngine
@@ -29,6 +39,155 @@ from src.utils.email_notifications import email_service
 
 logger = structlog.get_logger(__name__)
 
+# Shared HTTP session so repeat checks reuse kept-alive connections instead of
+# paying a TCP+TLS handshake per request. Successful responses are cached on
+# disk, so re-triggered checks within the TTL make no network request. Created
+# on first use, so importing this module opens no cache database.
+_SESSION: Optional[requests_cache.CachedSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _is_cacheable_size(response: requests.Response) -> bool:
+    """
+    Check whether a response is small enough to write to the HTTP cache.
+
+    Caching a response reads its whole body before it is returned, which
+    would bypass the streaming size cap in ``_fetch_page``. The body is
+    therefore read here first, decompressed and stopping just past
+    MAX_FINANCE_PAGE_BYTES, so gzip and chunked pages are capped on their
+    real size rather than a (possibly compressed or missing) Content-Length.
+    Only a body within the cap is cached; a larger one is kept truncated
+    just past the cap, which ``_fetch_page`` then rejects.
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body.extend(chunk)
+        if len(body) > MAX_FINANCE_PAGE_BYTES:
+            break
+
+    # Serve later reads from what was read here instead of the stream
+    response._content = bytes(body)
+    response._content_consumed = True
+    return len(body) <= MAX_FINANCE_PAGE_BYTES
+
+
+def _get_session() -> requests_cache.CachedSession:
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests_cache.CachedSession(
+                cache_name=str(Path(settings.data_directory) / "cache" / "http"),
+                backend="sqlite",
+                expire_after=settings.refresh_http_cache_ttl,
+                allowable_codes=(200,),
+                filter_fn=_is_cacheable_size,
+            )
+            session.headers.update({"User-Agent": settings.user_agent})
+            for prefix in ("https://", "http://"):
+                session.mount(
+                    prefix, HTTPAdapter(pool_connections=10, pool_maxsize=20, pool_block=False)
+                )
+            atexit.register(session.close)
+            _SESSION = session
+    return _SESSION
+
+
+# Upper bound on finance pages fetched at once during a multi-city sweep
+MAX_CONCURRENT_FETCHES = 10
+
+# Finance pages larger than this are rejected rather than read and parsed
+MAX_FINANCE_PAGE_BYTES = 5 * 1024 * 1024
+
+VALLEJO_FINANCE_URL = "https://www.cityofvallejo.net/city_hall/departments___divisions/finance"
+
+# Link text naming a CAFR, and the fiscal year in it (e.g. "FY2024", "FY 2023-24")
+_CAFR_RE = re.compile(r"CAFR|Comprehensive Annual Financial Report", re.IGNORECASE)
+_YEAR_RE = re.compile(r"20\d{2}")
+
+# Only <a href> elements matter when scanning a finance page for CAFRs
+_LINK_STRAINER = SoupStrainer("a", href=True)
+
+# Source hosts whose connections are opened ahead of a scheduled sweep
+_WARMUP_URLS = (settings.vallejo_cafr_base_url, settings.calpers_api_url)
+
+
+def _warm_up_connections() -> None:
+    """Open pooled connections to the source hosts (best effort)."""
+    for url in _WARMUP_URLS:
+        try:
+            _get_session().head(url, timeout=5)
+        except Exception as e:
+            logger.debug("connection_warmup_failed", url=url, error=str(e))
+
+
+# Process pool for parsing several finance pages at once (created on first use)
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared parse pool, starting it on first use."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+            atexit.register(_PARSE_POOL.shutdown)
+    return _PARSE_POOL
+
+
+def clear_http_cache() -> None:
+    """Drop cached finance page responses and their parse results."""
+    _get_session().cache.clear()
+    _find_latest_cafr_link.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _find_latest_cafr_link(html: bytes) -> Optional[Tuple[int, str, str]]:
+    """
+    Find the most recent CAFR link on a finance page.
+
+    Cached on the page body, so an unchanged page is only parsed once.
+
+    Args:
+        html: Raw page body
+
+    Returns:
+        See ``_extract_latest_cafr_link``
+    """
+    return _extract_latest_cafr_link(html)
+
+
+def _extract_latest_cafr_link(html: bytes) -> Optional[Tuple[int, str, str]]:
+    """
+    Parse a finance page for its most recent CAFR link.
+
+    Pure and module-level so sweeps can run it in the parse process pool.
+
+    Args:
+        html: Raw page body
+
+    Returns:
+        Tuple of (fiscal_year, href, link text) for the newest CAFR link
+        (first listed wins on a tie), or None if the page lists none
+    """
+    soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
+
+    # Look for links containing "CAFR" or "Comprehensive Annual Financial Report"
+    latest = None
+    for link in soup.find_all("a", href=True):
+        text = link.get_text().strip()
+
+        if _CAFR_RE.search(text):
+            # Extract fiscal year from text (e.g., "FY2024", "2024", "FY 2023-24")
+            year_match = _YEAR_RE.search(text)
+            if year_match:
+                fiscal_year = int(year_match.group(0))
+                if latest is None or fiscal_year > latest[0]:
+                    latest = (fiscal_year, link["href"], text)
+
+    return latest
+
 
 class CAFRAvailabilityChecker:
     """Check if new CAFRs are available on Vallejo finance website."""
@@ -36,13 +195,23 @@ class CAFRAvailabilityChecker:
     def __init__(self, db: Session):
         """Initialize checker with database session."""
         self.db = db
-
-    def check_for_new_cafr(self, city_id: int) -> Optional[Dict]:
+        self.session = _get_session()
+        # Check records queued during a sweep, inserted in bulk at the end
+        self._pending_checks: List[RefreshCheck] = []
+        # Finance page fetches done ahead of time for a sweep, keyed by
+        # (URL, conditional request headers)
+        self._page_cache: Dict[Tuple, Tuple[Optional[bytes], Dict[str, Optional[str]]]] = {}
+        # Latest CAFR link of each prefetched body, parsed in the process pool
+        self._parsed_links: Dict[bytes, Optional[Tuple[int, str, str]]] = {}
+
+    def check_for_new_cafr(self, city_id: int, commit: bool = True) -> Optional[Dict]:
         """
         Check if a new CAFR has been published for a city.
 
         Args:
             city_id: Database ID of the city to check
+            commit: Commit the check record; False queues it for
+                ``save_pending_checks`` so a sweep can insert them in bulk
 
         Returns:
             Dict with document details if found, None otherwise
@@ -58,22 +227,41 @@ class CAFRAvailabilityChecker:
             logger.error("city_not_found", city_id=city_id)
             return None
 
+        return self.check_city_for_new_cafr(city, commit=commit)
+
+    def check_city_for_new_cafr(self, city: City, commit: bool = True) -> Optional[Dict]:
+        """
+        Check an already-loaded city for a new CAFR.
+
+        Args:
+            city: City model instance
+            commit: Commit the check record; False queues it for
+                ``save_pending_checks`` so a sweep can insert them in bulk
+
+        Returns:
+            Dict with document details if found, None otherwise (see
+            ``check_for_new_cafr``)
+        """
         logger.info("checking_cafr_availability", city=city.name)
 
         try:
+            cache_headers = None
+
             # Scrape Vallejo finance website for CAFRs
-            if "vallejo" in city.name.lower():
-                result = self._check_vallejo_cafr(city)
+            if self._uses_vallejo_scraper(city):
+                result, cache_headers = self._check_vallejo_cafr(city)
             else:
                 # For other cities, use generic method
                 result = self._check_generic_cafr(city)
 
             # Record the check
             self._record_check(
-                city_id=city_id,
+                city_id=city.id,
                 check_type="cafr_availability",
                 new_document_found=result is not None,
                 result=result,
+                cache_headers=cache_headers,
+                commit=commit,
             )
 
             return result
@@ -81,63 +269,61 @@ class CAFRAvailabilityChecker:
         except Exception as e:
             logger.error("cafr_check_failed", city=city.name, error=str(e))
             self._record_check(
-                city_id=city_id,
+                city_id=city.id,
                 check_type="cafr_availability",
                 new_document_found=False,
                 error=str(e),
+                commit=commit,
             )
             return None
 
-    def _check_vallejo_cafr(self, city: City) -> Optional[Dict]:
+    def _check_vallejo_cafr(
+        self, city: City
+    ) -> Tuple[Optional[Dict], Dict[str, Optional[str]]]:
         """
         Check Vallejo-specific finance website for new CAFRs.
 
+        The page is requested conditionally against the validators stored on
+        the last successful check, so an unchanged page costs a 304 and no
+        parsing.
+
         Args:
             city: City model instance
 
         Returns:
-            Dict with document details if found, None otherwise
+            Tuple of (document details dict or None, cache headers to store
+            on the check record)
         """
-        # Vallejo CAFRs are published at:
-        # https://www.cityofvallejo.net/city_hall/departments___divisions/finance
-        finance_url = city.finance_department_url or "https://www.cityofvallejo.net/city_hall/departments___divisions/finance"
+        finance_url = self._finance_url(city)
+        request_headers = self._conditional_headers(city.id)
 
         logger.info("scraping_vallejo_finance_page", url=finance_url)
 
         try:
-            response = requests.get(
-                finance_url,
-                headers={"User-Agent": settings.user_agent},
-                timeout=settings.external_api_timeout,
-            )
-            response.raise_for_status()
+            cache_key = (finance_url, tuple(sorted(request_headers.items())))
+            if cache_key in self._page_cache:
+                content, cache_headers = self._page_cache[cache_key]
+            else:
+                content, cache_headers = self._fetch_page(finance_url, request_headers)
+
+            if content is None:
+                logger.info("finance_page_not_modified", city=city.name, url=finance_url)
+                return None, cache_headers
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Look for links containing "CAFR" or "Comprehensive Annual Financial Report"
-            cafr_links = []
-            for link in soup.find_all("a", href=True):
-                text = link.get_text().strip()
-                href = link["href"]
-
-                if re.search(r"CAFR|Comprehensive Annual Financial Report", text, re.IGNORECASE):
-                    # Extract fiscal year from text (e.g., "FY2024", "2024", "FY 2023-24")
-                    year_match = re.search(r"20(\d{2})", text)
-                    if year_match:
-                        fiscal_year = int(year_match.group(0))
-                        cafr_links.append({
-                            "fiscal_year": fiscal_year,
-                            "document_url": self._normalize_url(href, finance_url),
-                            "document_title": text,
-                        })
-
-            if not cafr_links:
+            if content in self._parsed_links:
+                latest_link = self._parsed_links[content]
+            else:
+                latest_link = _find_latest_cafr_link(content)
+            if latest_link is None:
                 logger.info("no_cafr_links_found", city=city.name)
-                return None
+                return None, cache_headers
 
-            # Sort by fiscal year descending to get most recent
-            cafr_links.sort(key=lambda x: x["fiscal_year"], reverse=True)
-            latest_cafr = cafr_links[0]
+            fiscal_year, href, title = latest_link
+            latest_cafr = {
+                "fiscal_year": fiscal_year,
+                "document_url": self._normalize_url(href, finance_url),
+                "document_title": title,
+            }
 
             # Check if this fiscal year already exists in our database
             existing_fy = (
@@ -146,7 +332,7 @@ class CAFRAvailabilityChecker:
                     FiscalYear.city_id == city.id,
                     FiscalYear.year == latest_cafr["fiscal_year"],
                 )
-                .first()
+                .one_or_none()
             )
 
             # If fiscal year exists and CAFR already recorded, no new document
@@ -156,7 +342,7 @@ class CAFRAvailabilityChecker:
                     city=city.name,
                     fiscal_year=latest_cafr["fiscal_year"],
                 )
-                return None
+                return None, cache_headers
 
             # New CAFR found!
             logger.info(
@@ -165,12 +351,152 @@ class CAFRAvailabilityChecker:
                 fiscal_year=latest_cafr["fiscal_year"],
                 url=latest_cafr["document_url"],
             )
-            return latest_cafr
+            return latest_cafr, cache_headers
 
         except Exception as e:
             logger.error("vallejo_scraping_failed", error=str(e))
             raise
 
+    def prefetch_pages(self, cities: List[City]) -> None:
+        """
+        Fetch the finance pages for several cities concurrently.
+
+        Bodies are cached for the following ``check_for_new_cafr`` calls, so
+        a sweep costs roughly one round-trip instead of one per city. Failed
+        fetches are skipped; the per-city check retries and records the error.
+        When several distinct pages come back they are parsed in parallel in
+        the parse process pool.
+
+        Args:
+            cities: Cities about to be checked
+        """
+        # Validators are read here because the DB session stays on this thread
+        requests_by_key = {}
+        for city in cities:
+            if self._uses_vallejo_scraper(city):
+                url = self._finance_url(city)
+                headers = self._conditional_headers(city.id)
+                requests_by_key[(url, tuple(sorted(headers.items())))] = (url, headers)
+        if not requests_by_key:
+            return
+
+        workers = min(MAX_CONCURRENT_FETCHES, len(requests_by_key))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self._fetch_page, url, headers)
+                for key, (url, headers) in requests_by_key.items()
+            }
+
+        for key, future in futures.items():
+            try:
+                self._page_cache[key] = future.result()
+            except Exception as e:
+                logger.warning("finance_page_prefetch_failed", url=key[0], error=str(e))
+
+        # A single page is cheaper to parse here than to ship to a worker
+        bodies = list({content for content, _ in self._page_cache.values() if content})
+        if len(bodies) > 1:
+            try:
+                links = _get_parse_pool().map(_extract_latest_cafr_link, bodies)
+                self._parsed_links.update(zip(bodies, links))
+            except Exception as e:
+                # Fall back to parsing in-process during the per-city checks
+                logger.warning("finance_page_parse_pool_failed", error=str(e))
+
+    def clear_page_cache(self) -> None:
+        """Drop finance pages prefetched for a sweep and their parse results."""
+        self._page_cache.clear()
+        self._parsed_links.clear()
+
+    def _fetch_page(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[bytes], Dict[str, Optional[str]]]:
+        """
+        Download a finance page (safe to call from worker threads).
+
+        The cache filter (``_is_cacheable_size``) has already read the body
+        up to just past the size cap, so an oversized page fails the size
+        check below without being read in full.
+
+        Args:
+            url: Page URL
+            headers: Conditional request headers (If-None-Match/If-Modified-Since)
+
+        Returns:
+            Tuple of (page body, or None if the server answered 304 Not
+            Modified; cache headers to store on the check record)
+
+        Raises:
+            ValueError: If the body exceeds MAX_FINANCE_PAGE_BYTES
+        """
+        headers = headers or {}
+        response = self.session.get(
+            url, headers=headers, timeout=settings.external_api_timeout, stream=True
+        )
+
+        try:
+            if response.status_code == 304:
+                # Unchanged: carry the validators forward to the new check record
+                return None, {
+                    "last_etag": headers.get("If-None-Match"),
+                    "last_modified": headers.get("If-Modified-Since"),
+                }
+
+            response.raise_for_status()
+
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body.extend(chunk)
+                if len(body) > MAX_FINANCE_PAGE_BYTES:
+                    raise ValueError(
+                        f"Finance page {url} is larger than {MAX_FINANCE_PAGE_BYTES} bytes"
+                    )
+
+            return bytes(body), {
+                "last_etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        finally:
+            response.close()
+
+    def _conditional_headers(self, city_id: int) -> Dict[str, str]:
+        """
+        Build conditional request headers from the last successful CAFR check.
+
+        Args:
+            city_id: City ID
+
+        Returns:
+            Dict of If-None-Match/If-Modified-Since headers (empty if none stored)
+        """
+        last_check = (
+            self.db.query(RefreshCheck.last_etag, RefreshCheck.last_modified)
+            .filter(
+                RefreshCheck.city_id == city_id,
+                RefreshCheck.check_type == "cafr_availability",
+                RefreshCheck.scraping_success.is_(True),
+            )
+            .order_by(RefreshCheck.performed_at.desc())
+            .first()
+        )
+
+        headers = {}
+        if last_check:
+            if last_check.last_etag:
+                headers["If-None-Match"] = last_check.last_etag
+            if last_check.last_modified:
+                headers["If-Modified-Since"] = last_check.last_modified
+        return headers
+
+    def _uses_vallejo_scraper(self, city: City) -> bool:
+        """Whether a city's CAFRs are found by scraping the Vallejo finance page."""
+        return "vallejo" in city.name.lower()
+
+    def _finance_url(self, city: City) -> str:
+        """Finance page to scrape for a city's CAFRs."""
+        # Vallejo CAFRs are published at VALLEJO_FINANCE_URL
+        return city.finance_department_url or VALLEJO_FINANCE_URL
+
     def _check_generic_cafr(self, city: City) -> Optional[Dict]:
         """
         Generic CAFR check for non-Vallejo cities.
@@ -189,6 +515,9 @@ class CAFRAvailabilityChecker:
         """
         Normalize URL (handle relative URLs).
 
+        Resolves the link the way a browser would, including protocol-relative
+        URLs, query strings and fragments.
+
         Args:
             url: URL to normalize
             base_url: Base URL for relative URLs
@@ -196,15 +525,7 @@ class CAFRAvailabilityChecker:
         Returns:
             Normalized absolute URL
         """
-        if url.startswith("http"):
-            return url
-        elif url.startswith("/"):
-            # Absolute path
-            parts = base_url.split("/")
-            return f"{parts[0]}//{parts[2]}{url}"
-        else:
-            # Relative path
-            return f"{base_url.rstrip('/')}/{url}"
+        return urljoin(base_url, url)
 
     def _record_check(
         self,
@@ -213,6 +534,8 @@ class CAFRAvailabilityChecker:
         new_document_found: bool,
         result: Optional[Dict] = None,
         error: Optional[str] = None,
+        cache_headers: Optional[Dict[str, Optional[str]]] = None,
+        commit: bool = True,
     ) -> None:
         """
         Record the check in the database.
@@ -223,6 +546,8 @@ class CAFRAvailabilityChecker:
             new_document_found: Whether a new document was found
             result: Optional result dict
             error: Optional error message
+            cache_headers: Optional ETag/Last-Modified of the scraped page
+            commit: Commit now, or queue the record for ``save_pending_checks``
         """
         check = RefreshCheck(
             city_id=city_id,
@@ -241,8 +566,28 @@ class CAFRAvailabilityChecker:
             check.fiscal_year = result.get("fiscal_year")
             check.notification_needed = True
 
-        self.db.add(check)
-        self.db.commit()
+        if cache_headers:
+            check.last_etag = cache_headers.get("last_etag")
+            check.last_modified = cache_headers.get("last_modified")
+
+        if commit:
+            self.db.add(check)
+            self.db.commit()
+        else:
+            self._pending_checks.append(check)
+
+    def save_pending_checks(self) -> None:
+        """Bulk-insert queued check records (the caller commits)."""
+        self.db.bulk_save_objects(self._pending_checks)
+        self._pending_checks.clear()
+
+    def pending_check_count(self) -> int:
+        """Return the number of check records queued for ``save_pending_checks``."""
+        return len(self._pending_checks)
+
+    def discard_pending_checks(self, keep: int = 0) -> None:
+        """Drop queued check records without saving them, keeping the first ``keep``."""
+        del self._pending_checks[keep:]
 
 
 class CalPERSAvailabilityChecker:
@@ -251,13 +596,20 @@ class CalPERSAvailabilityChecker:
     def __init__(self, db: Session):
         """Initialize checker with database session."""
         self.db = db
+        self.session = _get_session()
+        # Check records queued during a sweep, inserted in bulk at the end
+        self._pending_checks: List[RefreshCheck] = []
 
-    def check_for_new_calpers_valuation(self, city_id: int) -> Optional[Dict]:
+    def check_for_new_calpers_valuation(
+        self, city_id: int, commit: bool = True
+    ) -> Optional[Dict]:
         """
         Check if a new CalPERS actuarial valuation is available.
 
         Args:
             city_id: Database ID of the city to check
+            commit: Commit the check record; False queues it for
+                ``save_pending_checks`` so a sweep can insert them in bulk
 
         Returns:
             Dict with document details if found, None otherwise
@@ -267,6 +619,22 @@ class CalPERSAvailabilityChecker:
             logger.error("city_not_found", city_id=city_id)
             return None
 
+        return self.check_city_for_new_calpers_valuation(city, commit=commit)
+
+    def check_city_for_new_calpers_valuation(
+        self, city: City, commit: bool = True
+    ) -> Optional[Dict]:
+        """
+        Check an already-loaded city for a new CalPERS actuarial valuation.
+
+        Args:
+            city: City model instance
+            commit: Commit the check record; False queues it for
+                ``save_pending_checks`` so a sweep can insert them in bulk
+
+        Returns:
+            Dict with document details if found, None otherwise
+        """
         logger.info("checking_calpers_availability", city=city.name)
 
         try:
@@ -277,10 +645,11 @@ class CalPERSAvailabilityChecker:
 
             # Record the check
             self._record_check(
-                city_id=city_id,
+                city_id=city.id,
                 check_type="calpers_valuation",
                 new_document_found=result is not None,
                 result=result,
+                commit=commit,
             )
 
             return result
@@ -288,10 +657,11 @@ class CalPERSAvailabilityChecker:
         except Exception as e:
             logger.error("calpers_check_failed", city=city.name, error=str(e))
             self._record_check(
-                city_id=city_id,
+                city_id=city.id,
                 check_type="calpers_valuation",
                 new_document_found=False,
                 error=str(e),
+                commit=commit,
             )
             return None
 
@@ -326,8 +696,9 @@ class CalPERSAvailabilityChecker:
         new_document_found: bool,
         result: Optional[Dict] = None,
         error: Optional[str] = None,
+        commit: bool = True,
     ) -> None:
-        """Record the check in the database."""
+        """Record the check in the database (queued when ``commit`` is False)."""
         check = RefreshCheck(
             city_id=city_id,
             check_type=check_type,
@@ -345,8 +716,24 @@ class CalPERSAvailabilityChecker:
             check.fiscal_year = result.get("fiscal_year")
             check.notification_needed = True
 
-        self.db.add(check)
-        self.db.commit()
+        if commit:
+            self.db.add(check)
+            self.db.commit()
+        else:
+            self._pending_checks.append(check)
+
+    def save_pending_checks(self) -> None:
+        """Bulk-insert queued check records (the caller commits)."""
+        self.db.bulk_save_objects(self._pending_checks)
+        self._pending_checks.clear()
+
+    def pending_check_count(self) -> int:
+        """Return the number of check records queued for ``save_pending_checks``."""
+        return len(self._pending_checks)
+
+    def discard_pending_checks(self, keep: int = 0) -> None:
+        """Drop queued check records without saving them, keeping the first ``keep``."""
+        del self._pending_checks[keep:]
 
 
 class RefreshNotificationManager:
@@ -355,9 +742,11 @@ class RefreshNotificationManager:
     def __init__(self, db: Session):
         """Initialize manager with database session."""
         self.db = db
+        # City names by ID, so repeat notifications skip the City lookup
+        self._city_names: Dict[int, str] = {}
 
     def send_cafr_notification(
-        self, city_id: int, cafr_details: Dict
+        self, city_id: int, cafr_details: Dict, city_name: Optional[str] = None
     ) -> RefreshNotification:
         """
         Send notification that new CAFR is available.
@@ -365,11 +754,12 @@ class RefreshNotificationManager:
         Args:
             city_id: City ID
             cafr_details: Dict with fiscal_year, document_url, document_title
+            city_name: City name, if already loaded (skips the lookup)
 
         Returns:
             RefreshNotification record
         """
-        city = self.db.query(City).filter(City.id == city_id).first()
+        city_name = city_name or self._get_city_name(city_id)
 
         # Get operator emails from settings or schedule
         operator_emails = settings.admin_emails
@@ -377,7 +767,7 @@ class RefreshNotificationManager:
         # Send email
         success = email_service.send_cafr_available_notification(
             operator_emails=operator_emails,
-            city_name=city.name,
+            city_name=city_name,
             fiscal_year=cafr_details["fiscal_year"],
             document_url=cafr_details["document_url"],
             document_title=cafr_details.get("document_title"),
@@ -400,7 +790,7 @@ class RefreshNotificationManager:
 
         logger.info(
             "cafr_notification_sent",
-            city=city.name,
+            city=city_name,
             fiscal_year=cafr_details["fiscal_year"],
             success=success,
         )
@@ -408,7 +798,7 @@ class RefreshNotificationManager:
         return notification
 
     def send_calpers_notification(
-        self, city_id: int, calpers_details: Dict
+        self, city_id: int, calpers_details: Dict, city_name: Optional[str] = None
     ) -> RefreshNotification:
         """
         Send notification that new CalPERS valuation is available.
@@ -416,11 +806,12 @@ class RefreshNotificationManager:
         Args:
             city_id: City ID
             calpers_details: Dict with fiscal_year, document_url
+            city_name: City name, if already loaded (skips the lookup)
 
         Returns:
             RefreshNotification record
         """
-        city = self.db.query(City).filter(City.id == city_id).first()
+        city_name = city_name or self._get_city_name(city_id)
 
         # Get operator emails
         operator_emails = settings.admin_emails
@@ -428,7 +819,7 @@ class RefreshNotificationManager:
         # Send email
         success = email_service.send_calpers_available_notification(
             operator_emails=operator_emails,
-            city_name=city.name,
+            city_name=city_name,
             fiscal_year=calpers_details["fiscal_year"],
             document_url=calpers_details["document_url"],
         )
@@ -449,13 +840,30 @@ class RefreshNotificationManager:
 
         logger.info(
             "calpers_notification_sent",
-            city=city.name,
+            city=city_name,
             fiscal_year=calpers_details["fiscal_year"],
             success=success,
         )
 
         return notification
 
+    def _get_city_name(self, city_id: int) -> Optional[str]:
+        """
+        Look up a city's name, loading only that column once per city.
+
+        Args:
+            city_id: City ID
+
+        Returns:
+            City name, or None if the city does not exist
+        """
+        if city_id not in self._city_names:
+            name = self.db.query(City.name).filter(City.id == city_id).scalar()
+            if name is None:
+                return None
+            self._city_names[city_id] = name
+        return self._city_names[city_id]
+
 
 class PostEntryPipeline:
     """
@@ -494,14 +902,16 @@ class PostEntryPipeline:
         fiscal_year_record = (
             self.db.query(FiscalYear)
             .filter(FiscalYear.city_id == city_id, FiscalYear.year == fiscal_year)
-            .first()
+            .one_or_none()
         )
 
         if not fiscal_year_record:
             logger.error("fiscal_year_not_found", city_id=city_id, fiscal_year=fiscal_year)
             raise ValueError(f"Fiscal year {fiscal_year} not found for city {city_id}")
 
-        # Create operation record
+        # Create operation record; the duration is measured on the monotonic
+        # clock so wall-clock adjustments can't skew it
+        started = time.monotonic()
         operation = RefreshOperation(
             city_id=city_id,
             fiscal_year_id=fiscal_year_record.id,
@@ -525,19 +935,36 @@ class PostEntryPipeline:
                 self.db.commit()
                 return operation
 
-            # Step 2: Recalculate risk scores
-            self._recalculate_risk_scores(operation, fiscal_year_record)
+            # Steps 2 and 3: Recalculate risk scores and regenerate projections.
+            # Neither depends on the other, so they run side by side, each on
+            # its own session; the operation fields they set are applied here.
+            risk_updates: Dict = {}
+            projection_updates: Dict = {}
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                risk_future = executor.submit(
+                    self._run_in_own_session,
+                    self._recalculate_risk_scores,
+                    fiscal_year_record.id,
+                    risk_updates,
+                )
+                projection_future = executor.submit(
+                    self._run_in_own_session,
+                    self._regenerate_projections,
+                    fiscal_year_record.id,
+                    projection_updates,
+                )
 
-            # Step 3: Regenerate projections
-            self._regenerate_projections(operation, fiscal_year_record)
+            for updates in (risk_updates, projection_updates):
+                for field, value in updates.items():
+                    setattr(operation, field, value)
+            risk_future.result()
+            projection_future.result()
 
             # Mark operation as complete
             operation.status = "completed"
             operation.success = True
             operation.completed_at = datetime.utcnow()
-            operation.duration_seconds = int(
-                (operation.completed_at - operation.started_at).total_seconds()
-            )
+            operation.duration_seconds = int(time.monotonic() - started)
             self.db.commit()
 
             logger.info(
@@ -570,9 +997,12 @@ class PostEntryPipeline:
 
         Returns:
             True if validation passed, False otherwise
+
+        Changes are flushed, not committed; run_full_pipeline commits once
+        the pipeline finishes (failures are committed straight away).
         """
         operation.validation_started_at = datetime.utcnow()
-        self.db.commit()
+        self.db.flush()
 
         logger.info("running_validation", fiscal_year_id=fiscal_year_record.id)
 
@@ -584,7 +1014,7 @@ class PostEntryPipeline:
 
             operation.validation_completed_at = datetime.utcnow()
             operation.validation_passed = validation_passed
-            self.db.commit()
+            self.db.flush()
 
             logger.info(
                 "validation_complete",
@@ -602,18 +1032,33 @@ class PostEntryPipeline:
             self.db.commit()
             return False
 
+    def _run_in_own_session(self, step, fiscal_year_id: int, updates: Dict) -> None:
+        """
+        Run a pipeline step on a session of its own (sessions are not thread-safe).
+
+        The step only flushes; its writes are committed here if it succeeds.
+
+        Args:
+            step: Step method taking (db, fiscal_year_record, updates)
+            fiscal_year_id: FiscalYear ID
+            updates: Dict the step fills with RefreshOperation field values
+        """
+        with Session(bind=self.db.get_bind()) as db:
+            step(db, db.get(FiscalYear, fiscal_year_id), updates)
+            db.commit()
+
     def _recalculate_risk_scores(
-        self, operation: RefreshOperation, fiscal_year_record: FiscalYear
+        self, db: Session, fiscal_year_record: FiscalYear, updates: Dict
     ) -> None:
         """
         Recalculate risk scores for the fiscal year.
 
         Args:
-            operation: RefreshOperation record
+            db: Session to run on
             fiscal_year_record: FiscalYear record
+            updates: Dict to fill with RefreshOperation field values
         """
-        operation.risk_calculation_started_at = datetime.utcnow()
-        self.db.commit()
+        updates["risk_calculation_started_at"] = datetime.utcnow()
 
         logger.info("recalculating_risk_scores", fiscal_year_id=fiscal_year_record.id)
 
@@ -622,52 +1067,50 @@ class PostEntryPipeline:
             from src.database.models.risk import RiskScore
 
             previous_score = (
-                self.db.query(RiskScore)
+                db.query(RiskScore)
                 .filter(RiskScore.fiscal_year_id == fiscal_year_record.id)
                 .order_by(RiskScore.calculation_date.desc())
                 .first()
             )
 
             if previous_score:
-                operation.previous_risk_score = int(previous_score.overall_score)
+                updates["previous_risk_score"] = int(previous_score.overall_score)
 
             # Calculate new risk score
-            scoring_engine = RiskScoringEngine(self.db)
+            scoring_engine = RiskScoringEngine(db)
             new_risk_score = scoring_engine.calculate_risk_score(fiscal_year_record.id)
-            self.db.add(new_risk_score)
-            self.db.commit()
+            db.add(new_risk_score)
+            db.flush()
 
-            operation.new_risk_score = int(new_risk_score.overall_score)
-            operation.risk_calculation_completed_at = datetime.utcnow()
-            operation.risk_calculation_success = True
-            self.db.commit()
+            updates["new_risk_score"] = int(new_risk_score.overall_score)
+            updates["risk_calculation_completed_at"] = datetime.utcnow()
+            updates["risk_calculation_success"] = True
 
             logger.info(
                 "risk_scores_recalculated",
                 fiscal_year_id=fiscal_year_record.id,
-                previous_score=operation.previous_risk_score,
-                new_score=operation.new_risk_score,
+                previous_score=updates.get("previous_risk_score"),
+                new_score=updates["new_risk_score"],
             )
 
         except Exception as e:
             logger.error("risk_calculation_failed", error=str(e))
-            operation.risk_calculation_completed_at = datetime.utcnow()
-            operation.risk_calculation_success = False
-            self.db.commit()
+            updates["risk_calculation_completed_at"] = datetime.utcnow()
+            updates["risk_calculation_success"] = False
             raise
 
     def _regenerate_projections(
-        self, operation: RefreshOperation, fiscal_year_record: FiscalYear
+        self, db: Session, fiscal_year_record: FiscalYear, updates: Dict
     ) -> None:
         """
         Regenerate financial projections.
 
         Args:
-            operation: RefreshOperation record
+            db: Session to run on
             fiscal_year_record: FiscalYear record
+            updates: Dict to fill with RefreshOperation field values
         """
-        operation.projection_started_at = datetime.utcnow()
-        self.db.commit()
+        updates["projection_started_at"] = datetime.utcnow()
 
         logger.info("regenerating_projections", fiscal_year_id=fiscal_year_record.id)
 
@@ -676,24 +1119,23 @@ class PostEntryPipeline:
             from src.database.models.projections import FiscalCliffAnalysis
 
             previous_cliff = (
-                self.db.query(FiscalCliffAnalysis)
+                db.query(FiscalCliffAnalysis)
                 .filter(FiscalCliffAnalysis.city_id == fiscal_year_record.city_id)
                 .order_by(FiscalCliffAnalysis.created_at.desc())
                 .first()
             )
 
             if previous_cliff:
-                operation.previous_fiscal_cliff_year = previous_cliff.fiscal_cliff_year
+                updates["previous_fiscal_cliff_year"] = previous_cliff.fiscal_cliff_year
 
             # Generate new projections
             # This is a placeholder - actual implementation depends on scenario engine
-            scenario_engine = ScenarioEngine(self.db)
+            scenario_engine = ScenarioEngine(db, fiscal_year_record.city_id)
             # scenario_engine.generate_scenarios(fiscal_year_record.city_id, fiscal_year_record.year)
 
             # For now, just mark as success
-            operation.projection_completed_at = datetime.utcnow()
-            operation.projection_success = True
-            self.db.commit()
+            updates["projection_completed_at"] = datetime.utcnow()
+            updates["projection_success"] = True
 
             logger.info(
                 "projections_regenerated",
@@ -702,9 +1144,8 @@ class PostEntryPipeline:
 
         except Exception as e:
             logger.error("projection_failed", error=str(e))
-            operation.projection_completed_at = datetime.utcnow()
-            operation.projection_success = False
-            self.db.commit()
+            updates["projection_completed_at"] = datetime.utcnow()
+            updates["projection_success"] = False
             # Don't raise - projections are not critical
 
 
@@ -715,30 +1156,47 @@ class DataRefreshOrchestrator:
     Coordinates checks, notifications, and post-entry pipelines.
     """
 
-    def __init__(self, db: Session):
-        """Initialize orchestrator with database session."""
+    def __init__(self, db: Session, warm_up_connections: bool = False):
+        """
+        Initialize orchestrator with database session.
+
+        Args:
+            db: Database session
+            warm_up_connections: Open connections to the source hosts on a
+                background thread, so the first check after a long idle
+                period does not pay the DNS and TLS handshake
+        """
         self.db = db
+        if warm_up_connections:
+            threading.Thread(target=_warm_up_connections, daemon=True).start()
         self.cafr_checker = CAFRAvailabilityChecker(db)
         self.calpers_checker = CalPERSAvailabilityChecker(db)
         self.notification_manager = RefreshNotificationManager(db)
         self.post_entry_pipeline = PostEntryPipeline(db)
 
-    def run_quarterly_check(self, city_id: int) -> Dict:
+    def run_quarterly_check(self, city_id: int, commit: bool = True) -> Dict:
         """
         Run quarterly check for new CAFRs.
 
         Args:
             city_id: City ID to check
+            commit: Commit the check record (sweeps commit once at the end)
 
         Returns:
             Dict with check results
         """
         logger.info("running_quarterly_check", city_id=city_id)
 
-        result = {"cafr_found": False, "notification_sent": False}
-
         # Check for new CAFR
-        cafr_details = self.cafr_checker.check_for_new_cafr(city_id)
+        cafr_details = self.cafr_checker.check_for_new_cafr(city_id, commit=commit)
+
+        return self._notify_cafr(city_id, cafr_details)
+
+    def _notify_cafr(
+        self, city_id: int, cafr_details: Optional[Dict], city_name: Optional[str] = None
+    ) -> Dict:
+        """Send the CAFR notification if one was found and build the check result."""
+        result = {"cafr_found": False, "notification_sent": False}
 
         if cafr_details:
             result["cafr_found"] = True
@@ -746,29 +1204,121 @@ class DataRefreshOrchestrator:
 
             # Send notification
             notification = self.notification_manager.send_cafr_notification(
-                city_id, cafr_details
+                city_id, cafr_details, city_name=city_name
             )
             result["notification_sent"] = True
             result["notification_id"] = notification.id
 
         return result
 
-    def run_annual_check(self, city_id: int) -> Dict:
+    def run_quarterly_check_all(self, cities: List[City]) -> Dict[int, Dict]:
+        """
+        Run quarterly CAFR checks for several cities.
+
+        Finance pages are fetched concurrently up front; the per-city checks,
+        database writes and notifications then run in order on this session.
+        A city whose check fails is reported as ``{"error": ...}`` without
+        stopping the sweep. Check records are bulk-inserted and committed
+        once for the sweep.
+
+        Args:
+            cities: Cities to check
+
+        Returns:
+            Dict mapping city ID to its ``run_quarterly_check`` result
+        """
+        logger.info("running_quarterly_check_sweep", city_count=len(cities))
+
+        self.cafr_checker.prefetch_pages(cities)
+
+        try:
+            results = {
+                city.id: self._sweep_city(self.cafr_checker, city, self._check_and_notify_cafr)
+                for city in cities
+            }
+            self.cafr_checker.save_pending_checks()
+            self.db.commit()
+            return results
+        finally:
+            self.cafr_checker.clear_page_cache()
+
+    def run_annual_check_all(self, cities: List[City]) -> Dict[int, Dict]:
+        """
+        Run annual CalPERS checks for several cities.
+
+        A city whose check fails is reported as ``{"error": ...}`` without
+        stopping the sweep. Check records are bulk-inserted and committed once
+        for the sweep.
+
+        Args:
+            cities: Cities to check
+
+        Returns:
+            Dict mapping city ID to its ``run_annual_check`` result
+        """
+        logger.info("running_annual_check_sweep", city_count=len(cities))
+
+        results = {
+            city.id: self._sweep_city(self.calpers_checker, city, self._check_and_notify_calpers)
+            for city in cities
+        }
+        self.calpers_checker.save_pending_checks()
+        self.db.commit()
+        return results
+
+    def _sweep_city(self, checker, city: City, check_and_notify) -> Dict:
+        """
+        Run one city's check and notification as part of a sweep.
+
+        On failure the city's queued check record is dropped, so the next
+        sweep finds the document again and retries the notification, and the
+        session is rolled back; other cities' queued checks are kept.
+        """
+        queued = checker.pending_check_count()
+        try:
+            return check_and_notify(city)
+        except Exception as e:
+            checker.discard_pending_checks(keep=queued)
+            self.db.rollback()
+            return {"error": str(e)}
+
+    def _check_and_notify_cafr(self, city: City) -> Dict:
+        """Queue a city's CAFR check and notify operators of a new CAFR."""
+        cafr_details = self.cafr_checker.check_city_for_new_cafr(city, commit=False)
+        return self._notify_cafr(city.id, cafr_details, city_name=city.name)
+
+    def _check_and_notify_calpers(self, city: City) -> Dict:
+        """Queue a city's CalPERS check and notify operators of a new valuation."""
+        calpers_details = self.calpers_checker.check_city_for_new_calpers_valuation(
+            city, commit=False
+        )
+        return self._notify_calpers(city.id, calpers_details, city_name=city.name)
+
+    def run_annual_check(self, city_id: int, commit: bool = True) -> Dict:
         """
         Run annual check for new CalPERS valuations.
 
         Args:
             city_id: City ID to check
+            commit: Commit the check record (sweeps commit once at the end)
 
         Returns:
             Dict with check results
         """
         logger.info("running_annual_check", city_id=city_id)
 
-        result = {"calpers_found": False, "notification_sent": False}
-
         # Check for new CalPERS valuation
-        calpers_details = self.calpers_checker.check_for_new_calpers_valuation(city_id)
+        calpers_details = self.calpers_checker.check_for_new_calpers_valuation(
+            city_id, commit=commit
+        )
+
+        return self._notify_calpers(city_id, calpers_details)
+
+    def _notify_calpers(
+        self, city_id: int, calpers_details: Optional[Dict], city_name: Optional[str] = None
+    ) -> Dict:
+        """Send the CalPERS notification if one was found and build the check result."""
+        result = {"calpers_found": False, "notification_sent": False}
 
         if calpers_details:
             result["calpers_found"] = True
@@ -776,7 +1326,7 @@ class DataRefreshOrchestrator:
 
             # Send notification
             notification = self.notification_manager.send_calpers_notification(
-                city_id, calpers_details
+                city_id, calpers_details, city_name=city_name
             )
             result["notification_sent"] = True
             result["notification_id"] = notification.id
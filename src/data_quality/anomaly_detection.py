@@ -12,18 +12,100 @@ for human review.
 """
 
 import json
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
+import numpy as np
 import structlog
+from sqlalchemy import Float, and_, cast, func, or_, tuple_
 from sqlalchemy.orm import Session
 
 from src.database.models.core import FiscalYear
-from src.database.models.financial import Expenditure, FundBalance, Revenue
+from src.database.models.financial import Expenditure, Revenue
 from src.database.models.validation import AnomalyFlag, ValidationQueueItem, ValidationRule
 
 logger = structlog.get_logger(__name__)
 
+# (table_name, record_id, field_name, value, city_id, fiscal_year, entered_by),
+# i.e. the positional arguments of AnomalyDetector.check_value
+ValueRecord = Tuple[str, int, str, float, int, int, str]
+
+# Tables whose prior-year value is the summed amount of the year's rows
+SUMMED_TABLES = {"revenues": Revenue, "expenditures": Expenditure}
+
+# Rule severities ordered from least to most severe
+SEVERITY_LEVELS = ("INFO", "WARNING", "CRITICAL")
+SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_LEVELS)}
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRule:
+    """Session-independent snapshot of an active ValidationRule."""
+
+    rule_name: str
+    rule_description: str
+    rule_type: str
+    table_name: Optional[str]
+    field_name: Optional[str]
+    parameters: str
+    severity: str
+    suggested_action: str
+    priority: int
+    # Parsed once from ``parameters``; read-only because the rule is shared
+    params: Mapping[str, Any] = field(compare=False)
+    # Index into SEVERITY_LEVELS; unknown severities rank as INFO
+    severity_rank: int = field(compare=False)
+
+    @classmethod
+    def from_model(cls, rule: ValidationRule) -> "CachedRule":
+        """Copy the fields anomaly checks need off an ORM row."""
+        return cls(
+            rule_name=rule.rule_name,
+            rule_description=rule.rule_description,
+            rule_type=rule.rule_type,
+            table_name=rule.table_name,
+            field_name=rule.field_name,
+            parameters=rule.parameters,
+            severity=rule.severity,
+            suggested_action=rule.suggested_action,
+            priority=rule.priority,
+            params=MappingProxyType(json.loads(rule.parameters)),
+            severity_rank=SEVERITY_RANK.get(rule.severity, 0),
+        )
+
+
+@dataclass(slots=True)
+class Violation:
+    """A rule violation found while checking a value."""
+
+    rule: CachedRule
+    entered_value: float
+    prior_year_value: Optional[float] = None
+    expected_value: Optional[str] = None
+    deviation_percent: Optional[int] = None
+    context: str = ""
+
+
+# Process-wide LRU of active rules keyed by (version, table_name, field_name).
+# Bumping the version orphans every entry, including ones still being loaded
+# by a concurrent lookup that started before the rules changed.
+RULE_CACHE_SIZE = 256
+_rule_cache: "OrderedDict[Tuple[int, str, str], Tuple[CachedRule, ...]]" = OrderedDict()
+_rule_cache_version = 0
+_rule_cache_lock = threading.Lock()
+
+
+def invalidate_rule_cache() -> None:
+    """Drop cached validation rules; call after rules are added or edited."""
+    global _rule_cache_version
+    with _rule_cache_lock:
+        _rule_cache_version += 1
+        _rule_cache.clear()
+
 
 class AnomalyDetector:
     """
@@ -35,6 +117,8 @@ class AnomalyDetector:
     def __init__(self, db: Session):
         """Initialize detector with database session."""
         self.db = db
+        # Prior-year values looked up during the current check_value call
+        self._prior_values: Dict[Tuple[str, int, int], Optional[float]] = {}
 
     def check_value(
         self,
@@ -45,6 +129,7 @@ class AnomalyDetector:
         city_id: int,
         fiscal_year: int,
         entered_by: str,
+        fiscal_year_id: Optional[int] = None,
     ) -> Optional[ValidationQueueItem]:
         """
         Check a single value for anomalies.
@@ -57,6 +142,8 @@ class AnomalyDetector:
             city_id: City ID
             fiscal_year: Fiscal year
             entered_by: Who entered the data
+            fiscal_year_id: FiscalYear ID if the caller already has it;
+                looked up only when an anomaly is queued
 
         Returns:
             ValidationQueueItem if anomaly detected, None otherwise
@@ -71,6 +158,7 @@ class AnomalyDetector:
         # Get active validation rules for this field
         rules = self._get_applicable_rules(table_name, field_name)
 
+        self._prior_values.clear()
         anomalies_detected = []
 
         for rule in rules:
@@ -93,13 +181,16 @@ class AnomalyDetector:
             value=value,
             city_id=city_id,
             fiscal_year=fiscal_year,
+            fiscal_year_id=fiscal_year_id,
             entered_by=entered_by,
             anomalies=anomalies_detected,
         )
 
-        # Create anomaly flag records
-        for violation in anomalies_detected:
-            self._create_anomaly_flag(queue_item, violation)
+        # Create anomaly flag records and commit them with the queue item
+        self.db.add_all(
+            [self._create_anomaly_flag(queue_item, violation) for violation in anomalies_detected]
+        )
+        self.db.commit()
 
         logger.info(
             "anomalies_detected",
@@ -109,48 +200,200 @@ class AnomalyDetector:
 
         return queue_item
 
+    def check_values_bulk(
+        self, records: List[ValueRecord]
+    ) -> List[ValidationQueueItem]:
+        """
+        Check many entered values for anomalies in one pass.
+
+        Equivalent to calling check_value for each record, but prior-year
+        totals are loaded with one grouped query per table and the
+        year-over-year test runs as a single array expression per rule.
+
+        Args:
+            records: Value records in check_value argument order
+
+        Returns:
+            Queue items created for records with anomalies
+        """
+        prior_totals = self._load_prior_year_totals(
+            {(table_name, city_id, fiscal_year - 1)
+             for table_name, _, _, _, city_id, fiscal_year, _ in records}
+        )
+
+        indices_by_field: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for index, record in enumerate(records):
+            indices_by_field[(record[0], record[2])].append(index)
+
+        violations: List[List[Violation]] = [[] for _ in records]
+
+        for (table_name, field_name), indices in indices_by_field.items():
+            rules = self._get_applicable_rules(table_name, field_name)
+            percent_change = None
+
+            for rule in rules:
+                if rule.rule_type != "year_over_year":
+                    for index in indices:
+                        _, record_id, _, value, city_id, fiscal_year, _ = records[index]
+                        violation = self._check_rule(
+                            rule, table_name, record_id, field_name, value,
+                            city_id, fiscal_year,
+                        )
+                        if violation:
+                            violations[index].append(violation)
+                    continue
+
+                if percent_change is None:
+                    current, prior, percent_change = self._year_over_year_changes(
+                        [records[i] for i in indices], prior_totals
+                    )
+
+                threshold_percent = rule.params.get("threshold_percent", 50)
+                for position in np.flatnonzero(percent_change > threshold_percent):
+                    violations[indices[position]].append(
+                        self._year_over_year_violation(
+                            rule,
+                            current[position],
+                            prior[position],
+                            percent_change[position],
+                            threshold_percent,
+                        )
+                    )
+
+        queue_items = self._queue_bulk_violations(records, violations)
+
+        logger.info(
+            "bulk_anomaly_check_complete",
+            records=len(records),
+            flagged=len(queue_items),
+        )
+
+        return queue_items
+
+    def _year_over_year_changes(
+        self,
+        records: List[ValueRecord],
+        prior_totals: Dict[Tuple[str, int, int], float],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute the year-over-year change of many values of one field at once.
+
+        Args:
+            records: Value records of a single table and field
+            prior_totals: Prior-year totals from _load_prior_year_totals
+
+        Returns:
+            Arrays of (current values, prior totals, absolute percent change);
+            a missing or zero prior total gives a NaN change
+        """
+        current = np.fromiter((record[3] for record in records), dtype=float, count=len(records))
+        prior = np.fromiter(
+            (
+                prior_totals.get((table_name, city_id, fiscal_year - 1), np.nan)
+                for table_name, _, _, _, city_id, fiscal_year, _ in records
+            ),
+            dtype=float,
+            count=len(records),
+        )
+        # Missing or zero prior totals become NaN and never exceed the threshold
+        prior[prior == 0] = np.nan
+        return current, prior, np.abs((current - prior) / prior) * 100
+
+    def _queue_bulk_violations(
+        self, records: List[ValueRecord], violations: List[List[Violation]]
+    ) -> List[ValidationQueueItem]:
+        """Add a queue item and its anomaly flags for every record with violations."""
+        fiscal_year_ids = self._resolve_fiscal_year_ids(
+            {(record[4], record[5]) for record, anomalies in zip(records, violations) if anomalies}
+        )
+
+        queue_items = []
+        for record, anomalies in zip(records, violations):
+            if not anomalies:
+                continue
+            table_name, record_id, field_name, value, city_id, fiscal_year, entered_by = record
+            queue_item = self._create_queue_item(
+                table_name=table_name,
+                record_id=record_id,
+                field_name=field_name,
+                value=value,
+                city_id=city_id,
+                fiscal_year=fiscal_year,
+                fiscal_year_id=fiscal_year_ids.get((city_id, fiscal_year)),
+                entered_by=entered_by,
+                anomalies=anomalies,
+            )
+            self.db.add_all(
+                [self._create_anomaly_flag(queue_item, violation) for violation in anomalies]
+            )
+            queue_items.append(queue_item)
+
+        if queue_items:
+            self.db.commit()
+
+        return queue_items
+
     def _get_applicable_rules(
         self, table_name: str, field_name: str
-    ) -> List[ValidationRule]:
-        """Get validation rules applicable to this field."""
-        # Get rules for this specific field
-        specific_rules = (
-            self.db.query(ValidationRule)
-            .filter(
-                ValidationRule.is_active == True,
-                ValidationRule.table_name == table_name,
-                ValidationRule.field_name == field_name,
-            )
-            .order_by(ValidationRule.priority.desc())
-            .all()
+    ) -> Tuple[CachedRule, ...]:
+        """Get validation rules applicable to this field (cached per process)."""
+        with _rule_cache_lock:
+            key = (_rule_cache_version, table_name, field_name)
+            rules = _rule_cache.get(key)
+            if rules is not None:
+                _rule_cache.move_to_end(key)
+                return rules
+
+        rules = tuple(
+            CachedRule.from_model(rule)
+            for rule in self._load_applicable_rules(table_name, field_name)
         )
 
-        # Get global rules (apply to all fields)
-        global_rules = (
+        with _rule_cache_lock:
+            _rule_cache[key] = rules
+            _rule_cache.move_to_end(key)
+            while len(_rule_cache) > RULE_CACHE_SIZE:
+                _rule_cache.popitem(last=False)
+
+        return rules
+
+    def _load_applicable_rules(
+        self, table_name: str, field_name: str
+    ) -> List[ValidationRule]:
+        """Query validation rules applicable to this field."""
+        # Rules for this specific field plus global rules (apply to all
+        # fields) in one query; specific rules still come first
+        return (
             self.db.query(ValidationRule)
             .filter(
                 ValidationRule.is_active == True,
-                ValidationRule.table_name == None,
-                ValidationRule.field_name == None,
+                or_(
+                    and_(
+                        ValidationRule.table_name == table_name,
+                        ValidationRule.field_name == field_name,
+                    ),
+                    and_(
+                        ValidationRule.table_name.is_(None),
+                        ValidationRule.field_name.is_(None),
+                    ),
+                ),
             )
-            .order_by(ValidationRule.priority.desc())
+            .order_by(ValidationRule.table_name.is_(None), ValidationRule.priority.desc())
             .all()
         )
 
-        return specific_rules + global_rules
-
     def _check_rule(
         self,
-        rule: ValidationRule,
+        rule: CachedRule,
         table_name: str,
         record_id: int,
         field_name: str,
         value: float,
         city_id: int,
         fiscal_year: int,
-    ) -> Optional[Dict]:
+    ) -> Optional[Violation]:
         """Check if a value violates a validation rule."""
-        params = json.loads(rule.parameters)
+        params = rule.params
 
         if rule.rule_type == "year_over_year":
             return self._check_year_over_year(
@@ -176,30 +419,22 @@ class AnomalyDetector:
         value: float,
         city_id: int,
         fiscal_year: int,
-        params: Dict,
-        rule: ValidationRule,
-    ) -> Optional[Dict]:
+        params: Mapping[str, Any],
+        rule: CachedRule,
+    ) -> Optional[Violation]:
         """Check for unusual year-over-year changes."""
         threshold_percent = params.get("threshold_percent", 50)
 
-        # Get prior year value
-        prior_year = fiscal_year - 1
-        prior_fy = (
-            self.db.query(FiscalYear)
-            .filter(FiscalYear.city_id == city_id, FiscalYear.year == prior_year)
-            .first()
-        )
-
-        if not prior_fy:
-            # No prior year data, can't check
-            return None
-
-        # Get prior year value from appropriate table
-        prior_value = self._get_prior_year_value(
-            table_name, field_name, prior_fy.id
-        )
+        # Get prior year value (shared by every YoY rule in this call)
+        prior_key = (table_name, city_id, fiscal_year - 1)
+        if prior_key not in self._prior_values:
+            self._prior_values[prior_key] = self._get_prior_year_value(
+                table_name, field_name, city_id, fiscal_year - 1
+            )
+        prior_value = self._prior_values[prior_key]
 
         if prior_value is None:
+            # No prior year data, can't check
             return None
 
         # Calculate percent change
@@ -209,40 +444,51 @@ class AnomalyDetector:
         percent_change = abs((value - prior_value) / prior_value * 100)
 
         if percent_change > threshold_percent:
-            return {
-                "rule": rule,
-                "entered_value": value,
-                "prior_year_value": prior_value,
-                "deviation_percent": int(percent_change),
-                "context": f"Year-over-year change of {percent_change:.1f}% exceeds threshold of {threshold_percent}%",
-            }
+            return self._year_over_year_violation(
+                rule, value, prior_value, percent_change, threshold_percent
+            )
 
         return None
 
+    @staticmethod
+    def _year_over_year_violation(
+        rule: CachedRule,
+        value: float,
+        prior_value: float,
+        percent_change: float,
+        threshold_percent: float,
+    ) -> Violation:
+        """Build the violation record for a year-over-year change."""
+        return Violation(
+            rule=rule,
+            entered_value=float(value),
+            prior_year_value=float(prior_value),
+            deviation_percent=int(percent_change),
+            context=f"Year-over-year change of {percent_change:.1f}% exceeds threshold of {threshold_percent}%",
+        )
+
     def _check_range(
-        self, value: float, params: Dict, rule: ValidationRule
-    ) -> Optional[Dict]:
+        self, value: float, params: Mapping[str, Any], rule: CachedRule
+    ) -> Optional[Violation]:
         """Check if value is within expected range."""
         min_value = params.get("min_value")
         max_value = params.get("max_value")
 
         if min_value is not None and value < min_value:
-            return {
-                "rule": rule,
-                "entered_value": value,
-                "expected_value": f">= {min_value}",
-                "deviation_percent": None,
-                "context": f"Value {value} is below minimum of {min_value}",
-            }
+            return Violation(
+                rule=rule,
+                entered_value=value,
+                expected_value=f">= {min_value}",
+                context=f"Value {value} is below minimum of {min_value}",
+            )
 
         if max_value is not None and value > max_value:
-            return {
-                "rule": rule,
-                "entered_value": value,
-                "expected_value": f"<= {max_value}",
-                "deviation_percent": None,
-                "context": f"Value {value} exceeds maximum of {max_value}",
-            }
+            return Violation(
+                rule=rule,
+                entered_value=value,
+                expected_value=f"<= {max_value}",
+                context=f"Value {value} exceeds maximum of {max_value}",
+            )
 
         return None
 
@@ -252,9 +498,9 @@ class AnomalyDetector:
         record_id: int,
         field_name: str,
         value: float,
-        params: Dict,
-        rule: ValidationRule,
-    ) -> Optional[Dict]:
+        params: Mapping[str, Any],
+        rule: CachedRule,
+    ) -> Optional[Violation]:
         """Check if values reconcile (e.g., revenues - expenditures = balance)."""
         # Placeholder for reconciliation logic
         # Would implement specific reconciliation checks based on params
@@ -266,40 +512,79 @@ class AnomalyDetector:
         record_id: int,
         field_name: str,
         value: float,
-        params: Dict,
-        rule: ValidationRule,
-    ) -> Optional[Dict]:
+        params: Mapping[str, Any],
+        rule: CachedRule,
+    ) -> Optional[Violation]:
         """Check if value matches expected formula."""
         # Placeholder for formula checking logic
         return None
 
     def _get_prior_year_value(
-        self, table_name: str, field_name: str, prior_fy_id: int
+        self, table_name: str, field_name: str, city_id: int, prior_year: int
     ) -> Optional[float]:
-        """Get value from prior fiscal year."""
-        # Map table names to models
-        model_map = {
-            "revenues": Revenue,
-            "expenditures": Expenditure,
-            "fund_balances": FundBalance,
-        }
-
-        model = model_map.get(table_name)
+        """
+        Get value from prior fiscal year.
+
+        Revenues and expenditures sum all amounts for the year. The fiscal
+        year is joined in the same query, so a missing year and an empty one
+        both come back as None.
+        """
+        model = SUMMED_TABLES.get(table_name)
         if not model:
             return None
 
-        # For revenues/expenditures, sum all amounts
-        if table_name in ["revenues", "expenditures"]:
-            from sqlalchemy import func
+        # Summed and cast in SQL so the driver hands back a float, not a Decimal
+        total = (
+            self.db.query(cast(func.coalesce(func.sum(model.actual_amount), 0), Float))
+            .join(FiscalYear, model.fiscal_year_id == FiscalYear.id)
+            .filter(FiscalYear.city_id == city_id, FiscalYear.year == prior_year)
+            .scalar()
+        )
+        return total or None
 
-            total = (
-                self.db.query(func.sum(model.amount))
-                .filter(model.fiscal_year_id == prior_fy_id)
-                .scalar()
-            )
-            return float(total) if total else None
+    def _load_prior_year_totals(
+        self, keys: Set[Tuple[str, int, int]]
+    ) -> Dict[Tuple[str, int, int], float]:
+        """
+        Load summed amounts for many (table_name, city_id, year) keys.
 
-        return None
+        Issues one grouped query per summable table. Keys with no rows or a
+        zero total are omitted, matching _get_prior_year_value returning None.
+        """
+        totals = {}
+        for table_name, model in SUMMED_TABLES.items():
+            pairs = {(city_id, year) for table, city_id, year in keys if table == table_name}
+            if not pairs:
+                continue
+
+            rows = (
+                self.db.query(
+                    FiscalYear.city_id, FiscalYear.year, cast(func.sum(model.actual_amount), Float)
+                )
+                .join(FiscalYear, model.fiscal_year_id == FiscalYear.id)
+                .filter(tuple_(FiscalYear.city_id, FiscalYear.year).in_(pairs))
+                .group_by(FiscalYear.city_id, FiscalYear.year)
+                .all()
+            )
+            for city_id, year, total in rows:
+                if total:
+                    totals[(table_name, city_id, year)] = total
+
+        return totals
+
+    def _resolve_fiscal_year_ids(
+        self, keys: Set[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], int]:
+        """Map (city_id, year) keys to FiscalYear IDs in one query."""
+        if not keys:
+            return {}
+
+        rows = (
+            self.db.query(FiscalYear.city_id, FiscalYear.year, FiscalYear.id)
+            .filter(tuple_(FiscalYear.city_id, FiscalYear.year).in_(keys))
+            .all()
+        )
+        return {(city_id, year): fy_id for city_id, year, fy_id in rows}
 
     def _create_queue_item(
         self,
@@ -309,20 +594,21 @@ class AnomalyDetector:
         value: float,
         city_id: int,
         fiscal_year: int,
+        fiscal_year_id: Optional[int],
         entered_by: str,
-        anomalies: List[Dict],
+        anomalies: List[Violation],
     ) -> ValidationQueueItem:
         """Create validation queue item for anomaly."""
-        # Get fiscal year record
-        fy = (
-            self.db.query(FiscalYear)
-            .filter(FiscalYear.city_id == city_id, FiscalYear.year == fiscal_year)
-            .first()
-        )
+        # Get fiscal year ID unless the caller resolved it
+        if fiscal_year_id is None:
+            fiscal_year_id = (
+                self.db.query(FiscalYear.id)
+                .filter(FiscalYear.city_id == city_id, FiscalYear.year == fiscal_year)
+                .scalar()
+            )
 
         # Determine severity (highest severity from all anomalies)
-        severities = [a["rule"].severity for a in anomalies]
-        severity = "CRITICAL" if "CRITICAL" in severities else "WARNING" if "WARNING" in severities else "INFO"
+        severity = SEVERITY_LEVELS[max(a.rule.severity_rank for a in anomalies)]
 
         # Create queue item
         queue_item = ValidationQueueItem(
@@ -332,49 +618,48 @@ class AnomalyDetector:
             entered_value=str(value),
             city_id=city_id,
             fiscal_year=fiscal_year,
-            fiscal_year_id=fy.id if fy else None,
+            fiscal_year_id=fiscal_year_id,
             entered_by=entered_by,
             entered_at=datetime.utcnow(),
             status="FLAGGED",
             severity=severity,
-            flag_reason=anomalies[0]["rule"].rule_name,
-            flag_details=anomalies[0]["context"],
-            prior_year_value=str(anomalies[0].get("prior_year_value"))
-            if anomalies[0].get("prior_year_value")
+            flag_reason=anomalies[0].rule.rule_name,
+            flag_details=anomalies[0].context,
+            prior_year_value=str(anomalies[0].prior_year_value)
+            if anomalies[0].prior_year_value
             else None,
         )
 
         self.db.add(queue_item)
-        self.db.commit()
+        self.db.flush()  # Assigns queue_item.id for the flags; check_value commits
 
         return queue_item
 
     def _create_anomaly_flag(
-        self, queue_item: ValidationQueueItem, violation: Dict
-    ):
-        """Create anomaly flag record."""
-        rule = violation["rule"]
+        self, queue_item: ValidationQueueItem, violation: Violation
+    ) -> AnomalyFlag:
+        """Build an (unsaved) anomaly flag record for a violation."""
+        rule = violation.rule
 
         flag = AnomalyFlag(
             queue_item_id=queue_item.id,
             rule_name=rule.rule_name,
             rule_description=rule.rule_description,
             severity=rule.severity,
-            entered_value=str(violation["entered_value"]),
-            expected_value=str(violation.get("expected_value"))
-            if violation.get("expected_value")
+            entered_value=str(violation.entered_value),
+            expected_value=str(violation.expected_value)
+            if violation.expected_value
             else None,
-            prior_year_value=str(violation.get("prior_year_value"))
-            if violation.get("prior_year_value")
+            prior_year_value=str(violation.prior_year_value)
+            if violation.prior_year_value
             else None,
-            deviation_percent=violation.get("deviation_percent"),
-            context=violation.get("context"),
+            deviation_percent=violation.deviation_percent,
+            context=violation.context,
             suggested_action=rule.suggested_action,
             resolved=False,
         )
 
-        self.db.add(flag)
-        self.db.commit()
+        return flag
 
 
 def seed_default_rules(db: Session):
@@ -441,17 +726,25 @@ def seed_default_rules(db: Session):
         },
     ]
 
-    for rule_data in default_rules:
-        # Check if rule already exists
-        existing = (
-            db.query(ValidationRule)
-            .filter(ValidationRule.rule_name == rule_data["rule_name"])
-            .first()
+    # Look up which rules already exist in one query
+    existing = {
+        rule_name
+        for (rule_name,) in db.query(ValidationRule.rule_name).filter(
+            ValidationRule.rule_name.in_([r["rule_name"] for r in default_rules])
         )
+    }
 
-        if not existing:
-            rule = ValidationRule(**rule_data)
-            db.add(rule)
+    new_rules = [
+        ValidationRule(**rule_data)
+        for rule_data in default_rules
+        if rule_data["rule_name"] not in existing
+    ]
+    db.bulk_save_objects(new_rules)
 
     db.commit()
-    logger.info("default_validation_rules_seeded", count=len(default_rules))
+    invalidate_rule_cache()
+    logger.info(
+        "default_validation_rules_seeded",
+        count=len(default_rules),
+        created=len(new_rules),
+    )
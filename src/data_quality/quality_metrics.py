@@ -8,22 +8,78 @@ Calculates:
 - Quality scorecards by fiscal year
 """
 
+import threading
+from collections import Counter
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import func
+import numpy as np
+from sqlalchemy import and_, exists, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
 from src.database.models import (
     Expenditure,
     FiscalYear,
     FundBalance,
+    PensionContribution,
     PensionPlan,
     Revenue,
 )
-from src.data_quality.validators import DataQualityValidator, ValidationSeverity
+from src.data_quality.validators import (
+    DataQualityValidator,
+    ValidationAlert,
+    ValidationSeverity,
+)
+
+# Tables whose rows feed a fiscal year's metrics (FiscalYear itself covers
+# validation_status and the prior year used by year-over-year checks)
+_VERSIONED_MODELS = (
+    FiscalYear,
+    Revenue,
+    Expenditure,
+    FundBalance,
+    PensionPlan,
+    PensionContribution,
+)
+
+# Consistency points deducted per alert; INFO alerts don't reduce the score
+_SEVERITY_PENALTY = {
+    ValidationSeverity.CRITICAL.value: 20,  # Critical issues heavily penalized
+    ValidationSeverity.WARNING.value: 5,  # Warnings lightly penalized
+}
+
+# Record layout used to reduce a list of QualityMetrics in one pass
+_SUMMARY_DTYPE = np.dtype(
+    [
+        ("completeness", "f8"),
+        ("consistency", "f8"),
+        ("overall", "f8"),
+        ("critical_issues", "i8"),
+        ("warnings", "i8"),
+    ]
+)
+
+# Process-wide memo of metrics by fiscal year id, stored with the data
+# version they were computed from
+_metrics_cache: Dict[int, Tuple[tuple, "QualityMetrics"]] = {}
+_metrics_cache_lock = threading.Lock()
+
+
+def _get_cached_metrics(fiscal_year_id: int, version: tuple) -> Optional["QualityMetrics"]:
+    """Return a year's memoized metrics if they were computed from this data version."""
+    with _metrics_cache_lock:
+        cached = _metrics_cache.get(fiscal_year_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    return None
+
+
+def _cache_metrics(fiscal_year_id: int, version: tuple, metrics: "QualityMetrics") -> None:
+    """Memoize a year's metrics together with the data version they came from."""
+    with _metrics_cache_lock:
+        _metrics_cache[fiscal_year_id] = (version, metrics)
 
 
 class ValidationStatus(str, Enum):
@@ -54,7 +110,8 @@ class QualityMetrics:
         self.completeness_score = completeness_score
         self.consistency_score = consistency_score
         self.overall_score = overall_score
-        self.validation_status = validation_status
+        # Coerced once so status checks can compare enum members by identity
+        self.validation_status = ValidationStatus(validation_status)
         self.critical_issues = critical_issues
         self.warnings = warnings
         self.info_items = info_items
@@ -76,10 +133,11 @@ class QualityMetrics:
 
     def can_publish(self) -> bool:
         """Determine if data quality is sufficient for publishing."""
+        # Cheapest checks first; critical issues reject most unpublishable years
         return (
             self.critical_issues == 0
+            and self.validation_status is not ValidationStatus.NEEDS_CORRECTION
             and self.overall_score >= 95.0
-            and self.validation_status != ValidationStatus.NEEDS_CORRECTION
         )
 
 
@@ -90,24 +148,62 @@ class QualityMetricsCalculator:
         self.db = db
         self.validator = DataQualityValidator(db)
 
-    def calculate_metrics(self, fiscal_year: FiscalYear) -> QualityMetrics:
+    def calculate_metrics(
+        self,
+        fiscal_year: FiscalYear,
+        presence: Optional[Tuple[bool, bool, bool, bool]] = None,
+        alerts: Optional[List[ValidationAlert]] = None,
+    ) -> QualityMetrics:
         """
         Calculate comprehensive quality metrics for a fiscal year.
 
+        Without precomputed alerts, the last result is reused while none of
+        the year's underlying rows changed, skipping validation.
+
         Args:
             fiscal_year: FiscalYear to analyze
+            presence: Preloaded (revenues, expenditures, fund balance, pensions)
+                presence flags; probed from the database when omitted
+            alerts: The year's validation alerts if already computed (e.g. by
+                DataQualityValidator.validate_city); validated here when omitted
 
         Returns:
             QualityMetrics object with scores and status
         """
-        # Run validation
-        alerts = self.validator.validate_fiscal_year(fiscal_year)
+        if alerts is not None:
+            # Validation already ran, so a memo hit would save nothing
+            return self._score_metrics(fiscal_year, presence, alerts)
+
+        version = self._data_version(fiscal_year)
+        cached = _get_cached_metrics(fiscal_year.id, version)
+        if cached is not None:
+            return cached
+
+        metrics = self._score_metrics(fiscal_year, presence)
+        _cache_metrics(fiscal_year.id, version, metrics)
+        return metrics
 
-        # Count alerts by severity
-        alert_summary = self.validator.get_alert_summary()
+    def _score_metrics(
+        self,
+        fiscal_year: FiscalYear,
+        presence: Optional[Tuple[bool, bool, bool, bool]] = None,
+        alerts: Optional[List[ValidationAlert]] = None,
+    ) -> QualityMetrics:
+        """Score a fiscal year from its alerts, validating it when they are omitted."""
+        if alerts is None:
+            # Run validation
+            alerts = self.validator.validate_fiscal_year(fiscal_year)
+
+            # Count alerts by severity
+            alert_summary = self.validator.get_alert_summary()
+        else:
+            counts = Counter(alert.severity for alert in alerts)
+            alert_summary = {
+                severity.value: counts[severity.value] for severity in ValidationSeverity
+            }
 
         # Calculate completeness score
-        completeness_score = self._calculate_completeness_score(fiscal_year)
+        completeness_score = self._calculate_completeness_score(fiscal_year, presence)
 
         # Calculate consistency score
         consistency_score = self._calculate_consistency_score(fiscal_year, alerts)
@@ -133,7 +229,79 @@ class QualityMetricsCalculator:
             info_items=alert_summary["info"],
         )
 
-    def _calculate_completeness_score(self, fiscal_year: FiscalYear) -> float:
+    def _data_version(self, fiscal_year: FiscalYear) -> tuple:
+        """
+        Fingerprint the rows that feed a fiscal year's metrics.
+
+        Returns the latest updated_at and row count of every versioned table
+        for this year and the prior one, fetched in a single round-trip.
+
+        This is one query of twelve aggregate subqueries, so it only pays off
+        against the validation run it can skip. It relies on updated_at being
+        bumped on every UPDATE: the ORM does so, and on PostgreSQL the
+        set_updated_at trigger covers writes made outside the ORM. On other
+        databases, a raw SQL UPDATE that leaves updated_at and the row count
+        unchanged goes unnoticed until the process restarts.
+        """
+        in_scope = and_(
+            FiscalYear.city_id == fiscal_year.city_id,
+            FiscalYear.year.in_((fiscal_year.year, fiscal_year.year - 1)),
+        )
+
+        columns = []
+        for model in _VERSIONED_MODELS:
+            for aggregate in (func.max(model.updated_at), func.count(model.id)):
+                query = select(aggregate)
+                if model is not FiscalYear:
+                    query = query.join(FiscalYear, model.fiscal_year_id == FiscalYear.id)
+                columns.append(query.where(in_scope).scalar_subquery())
+
+        return tuple(self.db.query(*columns).one())
+
+    def _city_data_versions(self, city_id: int) -> Dict[int, tuple]:
+        """
+        Fingerprint every fiscal year of a city in one round-trip.
+
+        Each table's latest updated_at and row count are grouped by year in a
+        single UNION ALL query, then combined per year with the prior year's
+        exactly as ``_data_version`` does, so both share memo entries.
+
+        Returns:
+            Dict mapping fiscal year to its data version
+        """
+        queries = []
+        for index, model in enumerate(_VERSIONED_MODELS):
+            query = select(
+                literal(index), FiscalYear.year, func.max(model.updated_at), func.count(model.id)
+            )
+            if model is not FiscalYear:
+                query = query.join(FiscalYear, model.fiscal_year_id == FiscalYear.id)
+            queries.append(query.where(FiscalYear.city_id == city_id).group_by(FiscalYear.year))
+
+        stats = {
+            (index, year): (updated_at, count)
+            for index, year, updated_at, count in self.db.execute(union_all(*queries))
+        }
+        years = {year for _, year in stats}
+
+        versions = {}
+        for year in years:
+            version = []
+            for index in range(len(_VERSIONED_MODELS)):
+                in_scope = [
+                    stats[key] for key in ((index, year), (index, year - 1)) if key in stats
+                ]
+                latest = [updated_at for updated_at, _ in in_scope if updated_at is not None]
+                version.append(max(latest) if latest else None)
+                version.append(sum(count for _, count in in_scope))
+            versions[year] = tuple(version)
+        return versions
+
+    def _calculate_completeness_score(
+        self,
+        fiscal_year: FiscalYear,
+        presence: Optional[Tuple[bool, bool, bool, bool]] = None,
+    ) -> float:
         """
         Calculate data completeness score (0-100).
 
@@ -144,48 +312,28 @@ class QualityMetricsCalculator:
         - Pension plans (optional, weighted lower)
         """
         max_points = 100
-        points = 0
 
-        # Check revenues (35 points)
-        revenue_count = (
-            self.db.query(Revenue)
-            .filter(Revenue.fiscal_year_id == fiscal_year.id)
-            .count()
-        )
-        if revenue_count > 0:
-            points += 35
-
-        # Check expenditures (35 points)
-        expenditure_count = (
-            self.db.query(Expenditure)
-            .filter(Expenditure.fiscal_year_id == fiscal_year.id)
-            .count()
+        if presence is None:
+            # One round-trip; EXISTS stops at the first matching row per table
+            presence = self.db.query(
+                exists().where(Revenue.fiscal_year_id == fiscal_year.id),
+                exists().where(Expenditure.fiscal_year_id == fiscal_year.id),
+                exists().where(FundBalance.fiscal_year_id == fiscal_year.id),
+                exists().where(PensionPlan.fiscal_year_id == fiscal_year.id),
+            ).one()
+        has_revenues, has_expenditures, has_fund_balance, has_pensions = presence
+
+        points = (
+            35 * has_revenues  # Revenues (35 points)
+            + 35 * has_expenditures  # Expenditures (35 points)
+            + 20 * has_fund_balance  # Fund balance (20 points)
+            + 10 * has_pensions  # Pension data (10 points)
         )
-        if expenditure_count > 0:
-            points += 35
-
-        # Check fund balance (20 points)
-        fund_balance = (
-            self.db.query(FundBalance)
-            .filter(FundBalance.fiscal_year_id == fiscal_year.id)
-            .first()
-        )
-        if fund_balance:
-            points += 20
-
-        # Check pension data (10 points)
-        pension_count = (
-            self.db.query(PensionPlan)
-            .filter(PensionPlan.fiscal_year_id == fiscal_year.id)
-            .count()
-        )
-        if pension_count > 0:
-            points += 10
 
         return (points / max_points) * 100
 
     def _calculate_consistency_score(
-        self, fiscal_year: FiscalYear, alerts: List
+        self, fiscal_year: FiscalYear, alerts: Iterable[ValidationAlert]
     ) -> float:
         """
         Calculate data consistency score (0-100).
@@ -198,16 +346,13 @@ class QualityMetricsCalculator:
         max_points = 100
         points = max_points
 
-        # Deduct points for each alert
+        # Deduct points for each alert (alerts may be streamed, so stop
+        # consuming once the score bottoms out)
         for alert in alerts:
-            if alert.severity == ValidationSeverity.CRITICAL:
-                points -= 20  # Critical issues heavily penalized
-            elif alert.severity == ValidationSeverity.WARNING:
-                points -= 5  # Warnings lightly penalized
-            # INFO alerts don't reduce score
-
-        # Ensure score doesn't go below 0
-        points = max(0, points)
+            points -= _SEVERITY_PENALTY.get(alert.severity, 0)
+            if points <= 0:
+                # Ensure score doesn't go below 0
+                return 0
 
         return points
 
@@ -265,27 +410,59 @@ class QualityMetricsCalculator:
         return ValidationStatus.PENDING
 
     def calculate_metrics_for_city(
-        self, city_id: int
+        self, city_id: int, alerts_by_year: Optional[Dict[int, List[ValidationAlert]]] = None
     ) -> Dict[int, QualityMetrics]:
         """
         Calculate quality metrics for all fiscal years of a city.
 
+        Without precomputed alerts, every year is fingerprinted in one query
+        and validation is skipped when all of them are memoized unchanged.
+
         Args:
             city_id: City ID
+            alerts_by_year: Validation alerts keyed by fiscal year, as returned
+                by DataQualityValidator.validate_city; computed when omitted
 
         Returns:
             Dictionary mapping fiscal year to QualityMetrics
         """
-        fiscal_years = (
-            self.db.query(FiscalYear)
+        # Load every year together with its completeness flags in one query
+        # instead of probing the child tables once per year. The child
+        # relationships are dynamic, so they can't be eager-loaded; correlated
+        # EXISTS subqueries give the same single round-trip.
+        rows = (
+            self.db.query(
+                FiscalYear,
+                exists().where(Revenue.fiscal_year_id == FiscalYear.id),
+                exists().where(Expenditure.fiscal_year_id == FiscalYear.id),
+                exists().where(FundBalance.fiscal_year_id == FiscalYear.id),
+                exists().where(PensionPlan.fiscal_year_id == FiscalYear.id),
+            )
             .filter(FiscalYear.city_id == city_id)
             .order_by(FiscalYear.year)
             .all()
         )
 
+        if alerts_by_year is not None:
+            # Validation already ran, so a memo hit would save nothing
+            return {
+                fy.year: self._score_metrics(fy, tuple(presence), alerts_by_year[fy.year])
+                for fy, *presence in rows
+            }
+
+        # Reuse memoized metrics, validating only when some year changed
+        versions = self._city_data_versions(city_id)
+        cached = {fy.year: _get_cached_metrics(fy.id, versions[fy.year]) for fy, *_ in rows}
+        if all(metrics is not None for metrics in cached.values()):
+            return cached
+
+        # Validate every year from one load per table, not one per year
+        alerts_by_year = self.validator.validate_city(city_id)
+
         metrics_by_year = {}
-        for fy in fiscal_years:
-            metrics = self.calculate_metrics(fy)
+        for fy, *presence in rows:
+            metrics = self._score_metrics(fy, tuple(presence), alerts_by_year[fy.year])
+            _cache_metrics(fy.id, versions[fy.year], metrics)
             metrics_by_year[fy.year] = metrics
 
         return metrics_by_year
@@ -314,27 +491,31 @@ class QualityMetricsCalculator:
                 "years_needing_correction": 0,
             }
 
-        return {
-            "total_years": len(metrics_list),
-            "avg_completeness": round(
-                sum(m.completeness_score for m in metrics_list) / len(metrics_list), 1
-            ),
-            "avg_consistency": round(
-                sum(m.consistency_score for m in metrics_list) / len(metrics_list), 1
-            ),
-            "avg_overall_score": round(
-                sum(m.overall_score for m in metrics_list) / len(metrics_list), 1
-            ),
-            "total_critical_issues": sum(m.critical_issues for m in metrics_list),
-            "total_warnings": sum(m.warnings for m in metrics_list),
-            "years_validated": sum(
-                1
+        scores = np.fromiter(
+            (
+                (m.completeness_score, m.consistency_score, m.overall_score,
+                 m.critical_issues, m.warnings)
                 for m in metrics_list
-                if m.validation_status == ValidationStatus.VALIDATED
-            ),
-            "years_needing_correction": sum(
-                1
-                for m in metrics_list
-                if m.validation_status == ValidationStatus.NEEDS_CORRECTION
             ),
+            dtype=_SUMMARY_DTYPE,
+            count=len(metrics_list),
+        )
+
+        years_validated = 0
+        years_needing_correction = 0
+        for m in metrics_list:
+            if m.validation_status is ValidationStatus.VALIDATED:
+                years_validated += 1
+            elif m.validation_status is ValidationStatus.NEEDS_CORRECTION:
+                years_needing_correction += 1
+
+        return {
+            "total_years": len(metrics_list),
+            "avg_completeness": round(float(scores["completeness"].mean()), 1),
+            "avg_consistency": round(float(scores["consistency"].mean()), 1),
+            "avg_overall_score": round(float(scores["overall"].mean()), 1),
+            "total_critical_issues": int(scores["critical_issues"].sum()),
+            "total_warnings": int(scores["warnings"].sum()),
+            "years_validated": years_validated,
+            "years_needing_correction": years_needing_correction,
         }
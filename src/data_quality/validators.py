@@ -9,22 +9,25 @@ Implements comprehensive validation framework to catch:
 - Temporal inconsistencies
 """
 
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import exists, func, or_, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.database.models import (
     City,
     Expenditure,
+    ExpenditureCategory,
     FiscalYear,
     FundBalance,
-    PensionContribution,
     PensionPlan,
     Revenue,
+    RevenueCategory,
 )
 
 
@@ -39,6 +42,16 @@ class ValidationSeverity(str, Enum):
 class ValidationAlert:
     """Represents a data quality validation alert."""
 
+    __slots__ = (
+        "severity",
+        "category",
+        "fiscal_year",
+        "message",
+        "details",
+        "recommendation",
+        "timestamp",
+    )
+
     def __init__(
         self,
         severity: ValidationSeverity,
@@ -47,28 +60,58 @@ class ValidationAlert:
         message: str,
         details: Optional[Dict[str, Any]] = None,
         recommendation: Optional[str] = None,
+        timestamp: Optional[datetime] = None,
     ):
-        self.severity = severity
+        # Stored as the plain value ("critical"), so filtering and bucketing
+        # alerts compares strings instead of going through the Enum
+        self.severity: str = ValidationSeverity(severity).value
         self.category = category
         self.fiscal_year = fiscal_year
         self.message = message
         self.details = details or {}
         self.recommendation = recommendation
-        self.timestamp = datetime.utcnow()
+        self.timestamp = timestamp or datetime.utcnow()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary."""
         return {
-            "severity": self.severity.value,
+            "severity": self.severity,
             "category": self.category,
             "fiscal_year": self.fiscal_year,
             "message": self.message,
-            "details": self.details,
+            # Amounts are kept as Decimal until an alert is actually serialized
+            "details": {
+                key: float(value) if isinstance(value, Decimal) else value
+                for key, value in self.details.items()
+            },
             "recommendation": self.recommendation,
             "timestamp": self.timestamp.isoformat(),
         }
 
 
+@dataclass(slots=True)
+class _YearData:
+    """Rows and aggregates the validation rules read for one fiscal year."""
+
+    has_revenues: bool = False
+    has_expenditures: bool = False
+    has_fund_balance: bool = False
+    has_pensions: bool = False
+    total_revenues: Decimal = Decimal("0")
+    total_expenditures: Decimal = Decimal("0")
+    # (id, amount, category name) of line items outside the expected range
+    revenue_outliers: List[Tuple[int, Decimal, Optional[str]]] = field(default_factory=list)
+    expenditure_outliers: List[Tuple[int, Decimal, Optional[str]]] = field(
+        default_factory=list
+    )
+    pension_plans: List[PensionPlan] = field(default_factory=list)
+    fund_balance: Optional[FundBalance] = None
+    # Set when the city has a fiscal year immediately before this one
+    prior_year: Optional[int] = None
+    prior_revenues: Decimal = Decimal("0")
+    prior_expenditures: Decimal = Decimal("0")
+
+
 class DataQualityValidator:
     """
     Comprehensive data quality validator for manually-entered fiscal data.
@@ -87,10 +130,17 @@ class DataQualityValidator:
     FUNDED_RATIO_MAX = Decimal("1.50")  # 150%
     CONTRIBUTION_RATE_MAX = Decimal("0.50")  # 50% of payroll
 
+    # Line items above this are likely magnitude errors ($10 billion)
+    _MAGNITUDE_LIMIT = Decimal("10000000000")
+    _FUNDED_RATIO_RANGE_STR = f"{float(FUNDED_RATIO_MIN):.0%} - {float(FUNDED_RATIO_MAX):.0%}"
+
+    # Rows fetched per round-trip when scanning line items
+    STREAM_BATCH_SIZE = 1000
+
     def __init__(self, db: Session):
         """Initialize validator with database session."""
         self.db = db
-        self.alerts: List[ValidationAlert] = []
+        self._reset_alerts()
 
     def validate_fiscal_year(self, fiscal_year: FiscalYear) -> List[ValidationAlert]:
         """
@@ -102,39 +152,199 @@ class DataQualityValidator:
         Returns:
             List of validation alerts
         """
-        self.alerts = []
+        for _ in self.stream_alerts(fiscal_year):
+            pass
+
+        return self.alerts
+
+    def stream_alerts(self, fiscal_year: FiscalYear) -> Iterator[ValidationAlert]:
+        """
+        Run all validation rules for a fiscal year, yielding alerts as they are found.
 
-        # Core data completeness
-        self._validate_data_completeness(fiscal_year)
+        Alerts from each rule are yielded as soon as that rule finishes, so a
+        consumer can stop early. Once exhausted, self.alerts holds the full list.
 
-        # Financial validations
-        self._validate_financial_data(fiscal_year)
+        Args:
+            fiscal_year: FiscalYear to validate
 
-        # Pension validations
-        self._validate_pension_data(fiscal_year)
+        Yields:
+            Validation alerts
+        """
+        year_data = self._load_year_data([fiscal_year])
+        yield from self._run_rules(fiscal_year, year_data[fiscal_year.id])
 
-        # Cross-table reconciliation
-        self._validate_fund_balance_reconciliation(fiscal_year)
+    def validate_city(self, city_id: int) -> Dict[int, List[ValidationAlert]]:
+        """
+        Run all validation rules for every fiscal year of a city.
 
-        # Year-over-year anomalies
-        self._validate_temporal_consistency(fiscal_year)
+        Loads each table once for all of the city's years and validates the
+        years from memory, so the query count doesn't grow with the number
+        of years. Afterwards self.alerts holds the alerts of the latest year.
 
-        return self.alerts
+        Args:
+            city_id: City ID
 
-    def _validate_data_completeness(self, fiscal_year: FiscalYear) -> None:
+        Returns:
+            Dictionary mapping fiscal year to its validation alerts
+        """
+        fiscal_years = (
+            self.db.query(FiscalYear)
+            .filter(FiscalYear.city_id == city_id)
+            .order_by(FiscalYear.year)
+            .all()
+        )
+        year_data = self._load_year_data(fiscal_years)
+
+        alerts_by_year = {}
+        for fy in fiscal_years:
+            for _ in self._run_rules(fy, year_data[fy.id]):
+                pass
+            alerts_by_year[fy.year] = self.alerts
+
+        return alerts_by_year
+
+    def _run_rules(
+        self, fiscal_year: FiscalYear, data: _YearData
+    ) -> Iterator[ValidationAlert]:
+        """Run every rule against preloaded data, yielding each rule's alerts."""
+        self._reset_alerts()
+        # One clock read per run; every alert of the run shares it
+        self._run_ts = datetime.utcnow()
+
+        rules = (
+            self._validate_data_completeness,  # Core data completeness
+            self._validate_financial_data,  # Financial validations
+            self._validate_pension_data,  # Pension validations
+            self._validate_fund_balance_reconciliation,  # Cross-table reconciliation
+            self._validate_temporal_consistency,  # Year-over-year anomalies
+        )
+        for rule in rules:
+            start = len(self.alerts)
+            rule(fiscal_year, data)
+            yield from self.alerts[start:]
+
+    def _load_year_data(self, fiscal_years: List[FiscalYear]) -> Dict[int, _YearData]:
+        """
+        Load everything the rules read for a set of fiscal years.
+
+        Issues one query per table regardless of how many years are given.
+
+        Returns:
+            Dictionary mapping fiscal year ID to its _YearData
+        """
+        data = {fy.id: _YearData() for fy in fiscal_years}
+        if not data:
+            return data
+
+        self._load_totals(fiscal_years, data)
+        self._load_outliers(data)
+        self._load_pensions_and_fund_balances(data)
+        return data
+
+    def _load_totals(self, fiscal_years: List[FiscalYear], data: Dict[int, _YearData]) -> None:
+        """Load totals and presence flags for the years and their predecessors."""
+        keys = {(fy.city_id, fy.year) for fy in fiscal_years}
+        keys |= {(fy.city_id, fy.year - 1) for fy in fiscal_years}
+        totals = {}
+        rows = (
+            self.db.query(
+                FiscalYear.id,
+                FiscalYear.city_id,
+                FiscalYear.year,
+                # Totals stored at ingest; only years without them are summed
+                func.coalesce(
+                    FiscalYear.total_revenues,
+                    select(func.sum(Revenue.actual_amount))
+                    .where(Revenue.fiscal_year_id == FiscalYear.id)
+                    .scalar_subquery(),
+                ),
+                func.coalesce(
+                    FiscalYear.total_expenditures,
+                    select(func.sum(Expenditure.actual_amount))
+                    .where(Expenditure.fiscal_year_id == FiscalYear.id)
+                    .scalar_subquery(),
+                ),
+                # Only presence matters (the alerts report a zero count), so
+                # EXISTS stops at the first row
+                *(
+                    exists().where(model.fiscal_year_id == FiscalYear.id)
+                    for model in (Revenue, Expenditure, FundBalance, PensionPlan)
+                ),
+            )
+            .filter(tuple_(FiscalYear.city_id, FiscalYear.year).in_(keys))
+            .all()
+        )
+        for fy_id, city_id, year, revenues, expenditures, *presence in rows:
+            totals[(city_id, year)] = (revenues or Decimal("0"), expenditures or Decimal("0"))
+            if fy_id in data:
+                year_data = data[fy_id]
+                year_data.total_revenues, year_data.total_expenditures = totals[(city_id, year)]
+                (
+                    year_data.has_revenues,
+                    year_data.has_expenditures,
+                    year_data.has_fund_balance,
+                    year_data.has_pensions,
+                ) = presence
+
+        for fy in fiscal_years:
+            prior = totals.get((fy.city_id, fy.year - 1))
+            if prior is not None:
+                data[fy.id].prior_year = fy.year - 1
+                data[fy.id].prior_revenues, data[fy.id].prior_expenditures = prior
+
+    def _load_outliers(self, data: Dict[int, _YearData]) -> None:
+        """Load the line items outside the expected range; no others leave the database."""
+        for model, category_model, attr in (
+            (Revenue, RevenueCategory, "revenue_outliers"),
+            (Expenditure, ExpenditureCategory, "expenditure_outliers"),
+        ):
+            outliers = (
+                self.db.query(
+                    model.fiscal_year_id,
+                    model.id,
+                    model.actual_amount,
+                    category_model.standard_name,
+                )
+                .outerjoin(model.category)
+                .filter(
+                    model.fiscal_year_id.in_(list(data)),
+                    or_(model.actual_amount < 0, model.actual_amount > self._MAGNITUDE_LIMIT),
+                )
+                .yield_per(self.STREAM_BATCH_SIZE)
+            )
+            for fy_id, row_id, amount, category_name in outliers:
+                getattr(data[fy_id], attr).append((row_id, amount, category_name))
+
+    def _load_pensions_and_fund_balances(self, data: Dict[int, _YearData]) -> None:
+        """Load the pension plans and the first fund balance of each year."""
+        fy_ids = list(data)
+
+        for plan in (
+            self.db.query(PensionPlan)
+            .filter(PensionPlan.fiscal_year_id.in_(fy_ids))
+            .yield_per(self.STREAM_BATCH_SIZE)
+        ):
+            data[plan.fiscal_year_id].pension_plans.append(plan)
+
+        for fund_balance in (
+            self.db.query(FundBalance)
+            .filter(FundBalance.fiscal_year_id.in_(fy_ids))
+            .order_by(FundBalance.id)
+        ):
+            year_data = data[fund_balance.fiscal_year_id]
+            if year_data.fund_balance is None:
+                year_data.fund_balance = fund_balance
+
+    def _validate_data_completeness(self, fiscal_year: FiscalYear, data: _YearData) -> None:
         """Validate that core data is present."""
         # Check for revenues
-        revenue_count = (
-            self.db.query(Revenue)
-            .filter(Revenue.fiscal_year_id == fiscal_year.id)
-            .count()
-        )
-        if revenue_count == 0:
-            self.alerts.append(
+        if not data.has_revenues:
+            self._append_alert(
                 ValidationAlert(
                     severity=ValidationSeverity.CRITICAL,
                     category="completeness",
                     fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
                     message="No revenue data found",
                     details={"table": "revenues", "count": 0},
                     recommendation="Import revenue data from CAFR",
@@ -142,17 +352,13 @@ class DataQualityValidator:
             )
 
         # Check for expenditures
-        expenditure_count = (
-            self.db.query(Expenditure)
-            .filter(Expenditure.fiscal_year_id == fiscal_year.id)
-            .count()
-        )
-        if expenditure_count == 0:
-            self.alerts.append(
+        if not data.has_expenditures:
+            self._append_alert(
                 ValidationAlert(
                     severity=ValidationSeverity.CRITICAL,
                     category="completeness",
                     fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
                     message="No expenditure data found",
                     details={"table": "expenditures", "count": 0},
                     recommendation="Import expenditure data from CAFR",
@@ -160,17 +366,13 @@ class DataQualityValidator:
             )
 
         # Check for fund balance
-        fund_balance = (
-            self.db.query(FundBalance)
-            .filter(FundBalance.fiscal_year_id == fiscal_year.id)
-            .first()
-        )
-        if not fund_balance:
-            self.alerts.append(
+        if not data.has_fund_balance:
+            self._append_alert(
                 ValidationAlert(
                     severity=ValidationSeverity.CRITICAL,
                     category="completeness",
                     fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
                     message="No fund balance data found",
                     details={"table": "fund_balances"},
                     recommendation="Import fund balance data from CAFR",
@@ -178,235 +380,203 @@ class DataQualityValidator:
             )
 
         # Check for pension data (warning, not critical)
-        pension_count = (
-            self.db.query(PensionPlan)
-            .filter(PensionPlan.fiscal_year_id == fiscal_year.id)
-            .count()
-        )
-        if pension_count == 0:
-            self.alerts.append(
+        if not data.has_pensions:
+            self._append_alert(
                 ValidationAlert(
                     severity=ValidationSeverity.WARNING,
                     category="completeness",
                     fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
                     message="No pension plan data found",
                     details={"table": "pension_plans", "count": 0},
                     recommendation="Import pension data from CalPERS valuation",
                 )
             )
 
-    def _validate_financial_data(self, fiscal_year: FiscalYear) -> None:
+    def _validate_financial_data(self, fiscal_year: FiscalYear, data: _YearData) -> None:
         """Validate financial data ranges and types."""
         # Validate revenues
-        revenues = (
-            self.db.query(Revenue)
-            .filter(Revenue.fiscal_year_id == fiscal_year.id)
-            .all()
-        )
-
-        for revenue in revenues:
+        for revenue_id, amount, category_name in data.revenue_outliers:
             # Check for negative revenues
-            if revenue.amount < 0:
-                self.alerts.append(
+            if amount < 0:
+                self._append_alert(
                     ValidationAlert(
                         severity=ValidationSeverity.CRITICAL,
                         category="financial",
                         fiscal_year=fiscal_year.year,
-                        message=f"Negative revenue amount: {revenue.category.name if revenue.category else 'Unknown'}",
+                        timestamp=self._run_ts,
+                        message=f"Negative revenue amount: {category_name or 'Unknown'}",
                         details={
-                            "revenue_id": revenue.id,
-                            "amount": float(revenue.amount),
-                            "category": revenue.category.name if revenue.category else None,
+                            "revenue_id": revenue_id,
+                            "amount": amount,
+                            "category": category_name,
                         },
                         recommendation="Verify revenue amount in source document",
                     )
                 )
 
             # Check for suspiciously large amounts (likely magnitude error)
-            if revenue.amount > Decimal("10000000000"):  # $10 billion
-                self.alerts.append(
+            if amount > self._MAGNITUDE_LIMIT:
+                self._append_alert(
                     ValidationAlert(
                         severity=ValidationSeverity.WARNING,
                         category="financial",
                         fiscal_year=fiscal_year.year,
-                        message=f"Unusually large revenue amount: {revenue.category.name if revenue.category else 'Unknown'}",
+                        timestamp=self._run_ts,
+                        message=f"Unusually large revenue amount: {category_name or 'Unknown'}",
                         details={
-                            "revenue_id": revenue.id,
-                            "amount": float(revenue.amount),
-                            "category": revenue.category.name if revenue.category else None,
+                            "revenue_id": revenue_id,
+                            "amount": amount,
+                            "category": category_name,
                         },
                         recommendation="Check if amount should be in thousands/millions (possible magnitude error)",
                     )
                 )
 
         # Validate expenditures
-        expenditures = (
-            self.db.query(Expenditure)
-            .filter(Expenditure.fiscal_year_id == fiscal_year.id)
-            .all()
-        )
-
-        for expenditure in expenditures:
+        for expenditure_id, amount, category_name in data.expenditure_outliers:
             # Check for negative expenditures
-            if expenditure.amount < 0:
-                self.alerts.append(
+            if amount < 0:
+                self._append_alert(
                     ValidationAlert(
                         severity=ValidationSeverity.CRITICAL,
                         category="financial",
                         fiscal_year=fiscal_year.year,
-                        message=f"Negative expenditure amount: {expenditure.category.name if expenditure.category else 'Unknown'}",
+                        timestamp=self._run_ts,
+                        message=f"Negative expenditure amount: {category_name or 'Unknown'}",
                         details={
-                            "expenditure_id": expenditure.id,
-                            "amount": float(expenditure.amount),
-                            "category": expenditure.category.name if expenditure.category else None,
+                            "expenditure_id": expenditure_id,
+                            "amount": amount,
+                            "category": category_name,
                         },
                         recommendation="Verify expenditure amount in source document",
                     )
                 )
 
             # Check for suspiciously large amounts
-            if expenditure.amount > Decimal("10000000000"):  # $10 billion
-                self.alerts.append(
+            if amount > self._MAGNITUDE_LIMIT:
+                self._append_alert(
                     ValidationAlert(
                         severity=ValidationSeverity.WARNING,
                         category="financial",
                         fiscal_year=fiscal_year.year,
-                        message=f"Unusually large expenditure amount: {expenditure.category.name if expenditure.category else 'Unknown'}",
+                        timestamp=self._run_ts,
+                        message=f"Unusually large expenditure amount: {category_name or 'Unknown'}",
                         details={
-                            "expenditure_id": expenditure.id,
-                            "amount": float(expenditure.amount),
-                            "category": expenditure.category.name if expenditure.category else None,
+                            "expenditure_id": expenditure_id,
+                            "amount": amount,
+                            "category": category_name,
                         },
                         recommendation="Check if amount should be in thousands/millions (possible magnitude error)",
                     )
                 )
 
-    def _validate_pension_data(self, fiscal_year: FiscalYear) -> None:
+    def _validate_pension_data(self, fiscal_year: FiscalYear, data: _YearData) -> None:
         """Validate pension data ranges."""
-        pension_plans = (
-            self.db.query(PensionPlan)
-            .filter(PensionPlan.fiscal_year_id == fiscal_year.id)
-            .all()
-        )
-
-        for plan in pension_plans:
+        for plan in data.pension_plans:
             # Validate funded ratio
             if plan.funded_ratio is not None:
                 if plan.funded_ratio < self.FUNDED_RATIO_MIN or plan.funded_ratio > self.FUNDED_RATIO_MAX:
-                    self.alerts.append(
+                    self._append_alert(
                         ValidationAlert(
                             severity=ValidationSeverity.WARNING,
                             category="pension",
                             fiscal_year=fiscal_year.year,
+                            timestamp=self._run_ts,
                             message=f"Funded ratio out of expected range: {plan.plan_name}",
                             details={
                                 "plan_id": plan.id,
                                 "plan_name": plan.plan_name,
-                                "funded_ratio": float(plan.funded_ratio),
-                                "expected_range": f"{float(self.FUNDED_RATIO_MIN):.0%} - {float(self.FUNDED_RATIO_MAX):.0%}",
+                                "funded_ratio": plan.funded_ratio,
+                                "expected_range": self._FUNDED_RATIO_RANGE_STR,
                             },
                             recommendation="Verify funded ratio in CalPERS valuation report",
                         )
                     )
 
             # Validate UAL is non-negative
-            if plan.unfunded_liability is not None and plan.unfunded_liability < 0:
-                self.alerts.append(
+            ual = plan.unfunded_actuarial_liability
+            if ual is not None and ual < 0:
+                self._append_alert(
                     ValidationAlert(
                         severity=ValidationSeverity.WARNING,
                         category="pension",
                         fiscal_year=fiscal_year.year,
+                        timestamp=self._run_ts,
                         message=f"Negative unfunded liability: {plan.plan_name}",
                         details={
                             "plan_id": plan.id,
                             "plan_name": plan.plan_name,
-                            "unfunded_liability": float(plan.unfunded_liability),
+                            "unfunded_actuarial_liability": ual,
                         },
                         recommendation="Verify UAL calculation (should be positive for underfunded plans)",
                     )
                 )
 
-        # Validate contribution rates
-        contributions = (
-            self.db.query(PensionContribution)
-            .filter(PensionContribution.fiscal_year_id == fiscal_year.id)
-            .all()
-        )
-
-        for contribution in contributions:
-            if contribution.contribution_rate is not None:
-                if contribution.contribution_rate > self.CONTRIBUTION_RATE_MAX:
-                    self.alerts.append(
-                        ValidationAlert(
-                            severity=ValidationSeverity.WARNING,
-                            category="pension",
-                            fiscal_year=fiscal_year.year,
-                            message=f"Unusually high contribution rate: {contribution.plan_name}",
-                            details={
-                                "contribution_id": contribution.id,
-                                "plan_name": contribution.plan_name,
-                                "contribution_rate": float(contribution.contribution_rate),
-                            },
-                            recommendation="Verify contribution rate in CalPERS valuation (>50% is unusual)",
-                        )
+            # Validate employer contribution rate (% of payroll)
+            contribution_rate = plan.total_employer_contribution_percent
+            if contribution_rate is not None and contribution_rate > self.CONTRIBUTION_RATE_MAX:
+                self._append_alert(
+                    ValidationAlert(
+                        severity=ValidationSeverity.WARNING,
+                        category="pension",
+                        fiscal_year=fiscal_year.year,
+                        timestamp=self._run_ts,
+                        message=f"Unusually high contribution rate: {plan.plan_name}",
+                        details={
+                            "plan_id": plan.id,
+                            "plan_name": plan.plan_name,
+                            "contribution_rate": contribution_rate,
+                        },
+                        recommendation="Verify contribution rate in CalPERS valuation (>50% is unusual)",
                     )
+                )
 
-    def _validate_fund_balance_reconciliation(self, fiscal_year: FiscalYear) -> None:
+    def _validate_fund_balance_reconciliation(
+        self, fiscal_year: FiscalYear, data: _YearData
+    ) -> None:
         """Validate fund balance reconciliation formula."""
-        # Get fund balance
-        fund_balance = (
-            self.db.query(FundBalance)
-            .filter(FundBalance.fiscal_year_id == fiscal_year.id)
-            .first()
-        )
+        fund_balance = data.fund_balance
+        total_revenues = data.total_revenues
+        total_expenditures = data.total_expenditures
 
         if not fund_balance:
             return  # Already flagged in completeness check
 
-        # Calculate total revenues
-        total_revenues = (
-            self.db.query(func.sum(Revenue.amount))
-            .filter(Revenue.fiscal_year_id == fiscal_year.id)
-            .scalar()
-            or Decimal("0")
-        )
+        if fund_balance.yoy_change_amount is None:
+            return  # Beginning balance unknown, nothing to reconcile against
 
-        # Calculate total expenditures
-        total_expenditures = (
-            self.db.query(func.sum(Expenditure.amount))
-            .filter(Expenditure.fiscal_year_id == fiscal_year.id)
-            .scalar()
-            or Decimal("0")
-        )
+        # Beginning balance is the ending balance less the year's change
+        ending_balance = fund_balance.total_fund_balance
+        beginning_balance = ending_balance - fund_balance.yoy_change_amount
 
         # Expected ending balance
-        expected_ending = (
-            fund_balance.beginning_balance + total_revenues - total_expenditures
-        )
+        expected_ending = beginning_balance + total_revenues - total_expenditures
 
         # Calculate variance
-        variance = abs(fund_balance.ending_balance - expected_ending)
-        if fund_balance.ending_balance != 0:
-            variance_percent = variance / abs(fund_balance.ending_balance)
+        variance = abs(ending_balance - expected_ending)
+        if ending_balance != 0:
+            variance_percent = variance / abs(ending_balance)
         else:
             variance_percent = Decimal("0")
 
         # Check if variance exceeds tolerance
         if variance_percent > self.RECONCILIATION_TOLERANCE:
-            self.alerts.append(
+            self._append_alert(
                 ValidationAlert(
                     severity=ValidationSeverity.CRITICAL,
                     category="reconciliation",
                     fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
                     message="Fund balance reconciliation failure",
                     details={
-                        "beginning_balance": float(fund_balance.beginning_balance),
-                        "revenues": float(total_revenues),
-                        "expenditures": float(total_expenditures),
-                        "expected_ending": float(expected_ending),
-                        "actual_ending": float(fund_balance.ending_balance),
-                        "variance": float(variance),
-                        "variance_percent": float(variance_percent),
+                        "beginning_balance": beginning_balance,
+                        "revenues": total_revenues,
+                        "expenditures": total_expenditures,
+                        "expected_ending": expected_ending,
+                        "actual_ending": ending_balance,
+                        "variance": variance,
+                        "variance_percent": variance_percent,
                     },
                     recommendation=(
                         "Formula: ending = beginning + revenues - expenditures. "
@@ -415,115 +585,101 @@ class DataQualityValidator:
                 )
             )
 
-    def _validate_temporal_consistency(self, fiscal_year: FiscalYear) -> None:
+    def _validate_temporal_consistency(
+        self, fiscal_year: FiscalYear, data: _YearData
+    ) -> None:
         """Validate year-over-year changes for anomalies."""
-        # Get previous fiscal year
-        prev_fy = (
-            self.db.query(FiscalYear)
-            .filter(
-                FiscalYear.city_id == fiscal_year.city_id,
-                FiscalYear.year == fiscal_year.year - 1,
-            )
-            .first()
-        )
-
-        if not prev_fy:
+        if data.prior_year is None:
             # No prior year to compare
             return
 
-        # Compare total revenues
-        current_revenues = (
-            self.db.query(func.sum(Revenue.amount))
-            .filter(Revenue.fiscal_year_id == fiscal_year.id)
-            .scalar()
-            or Decimal("0")
-        )
-
-        prev_revenues = (
-            self.db.query(func.sum(Revenue.amount))
-            .filter(Revenue.fiscal_year_id == prev_fy.id)
-            .scalar()
-            or Decimal("0")
-        )
-
-        if prev_revenues > 0:
+        prior_year = data.prior_year
+        prev_revenues = data.prior_revenues
+        prev_expenditures = data.prior_expenditures
+        current_revenues = data.total_revenues
+        current_expenditures = data.total_expenditures
+
+        # Compare total revenues (the threshold test needs no division; the
+        # change percent is only computed when an alert is raised)
+        if prev_revenues > 0 and (
+            abs(current_revenues - prev_revenues) > self.ANOMALY_THRESHOLD * prev_revenues
+        ):
             revenue_change_percent = (current_revenues - prev_revenues) / prev_revenues
-
-            if abs(revenue_change_percent) > self.ANOMALY_THRESHOLD:
-                self.alerts.append(
-                    ValidationAlert(
-                        severity=ValidationSeverity.WARNING,
-                        category="anomaly",
-                        fiscal_year=fiscal_year.year,
-                        message=f"Large year-over-year revenue change: {revenue_change_percent:+.1%}",
-                        details={
-                            "prior_year": prev_fy.year,
-                            "prior_revenues": float(prev_revenues),
-                            "current_revenues": float(current_revenues),
-                            "change_percent": float(revenue_change_percent),
-                        },
-                        recommendation=(
-                            "Verify this change is accurate. If correct, add annotation "
-                            "explaining the cause (e.g., new tax, one-time windfall, etc.)"
-                        ),
-                    )
+            self._append_alert(
+                ValidationAlert(
+                    severity=ValidationSeverity.WARNING,
+                    category="anomaly",
+                    fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
+                    message=f"Large year-over-year revenue change: {revenue_change_percent:+.1%}",
+                    details={
+                        "prior_year": prior_year,
+                        "prior_revenues": prev_revenues,
+                        "current_revenues": current_revenues,
+                        "change_percent": revenue_change_percent,
+                    },
+                    recommendation=(
+                        "Verify this change is accurate. If correct, add annotation "
+                        "explaining the cause (e.g., new tax, one-time windfall, etc.)"
+                    ),
                 )
+            )
 
         # Compare total expenditures
-        current_expenditures = (
-            self.db.query(func.sum(Expenditure.amount))
-            .filter(Expenditure.fiscal_year_id == fiscal_year.id)
-            .scalar()
-            or Decimal("0")
-        )
-
-        prev_expenditures = (
-            self.db.query(func.sum(Expenditure.amount))
-            .filter(Expenditure.fiscal_year_id == prev_fy.id)
-            .scalar()
-            or Decimal("0")
-        )
-
-        if prev_expenditures > 0:
+        if prev_expenditures > 0 and (
+            abs(current_expenditures - prev_expenditures)
+            > self.ANOMALY_THRESHOLD * prev_expenditures
+        ):
             expenditure_change_percent = (
                 current_expenditures - prev_expenditures
             ) / prev_expenditures
-
-            if abs(expenditure_change_percent) > self.ANOMALY_THRESHOLD:
-                self.alerts.append(
-                    ValidationAlert(
-                        severity=ValidationSeverity.WARNING,
-                        category="anomaly",
-                        fiscal_year=fiscal_year.year,
-                        message=f"Large year-over-year expenditure change: {expenditure_change_percent:+.1%}",
-                        details={
-                            "prior_year": prev_fy.year,
-                            "prior_expenditures": float(prev_expenditures),
-                            "current_expenditures": float(current_expenditures),
-                            "change_percent": float(expenditure_change_percent),
-                        },
-                        recommendation=(
-                            "Verify this change is accurate. If correct, add annotation "
-                            "explaining the cause (e.g., major capital project, service cuts, etc.)"
-                        ),
-                    )
+            self._append_alert(
+                ValidationAlert(
+                    severity=ValidationSeverity.WARNING,
+                    category="anomaly",
+                    fiscal_year=fiscal_year.year,
+                    timestamp=self._run_ts,
+                    message=f"Large year-over-year expenditure change: {expenditure_change_percent:+.1%}",
+                    details={
+                        "prior_year": prior_year,
+                        "prior_expenditures": prev_expenditures,
+                        "current_expenditures": current_expenditures,
+                        "change_percent": expenditure_change_percent,
+                    },
+                    recommendation=(
+                        "Verify this change is accurate. If correct, add annotation "
+                        "explaining the cause (e.g., major capital project, service cuts, etc.)"
+                    ),
                 )
+            )
+
+    def _reset_alerts(self) -> None:
+        """Clear alerts and their per-severity buckets."""
+        self.alerts: List[ValidationAlert] = []
+        self._alerts_by_severity: Dict[str, List[ValidationAlert]] = defaultdict(list)
+        self._severity_counts: Counter = Counter()
+
+    def _append_alert(self, alert: ValidationAlert) -> None:
+        """Record an alert, keeping the per-severity buckets up to date."""
+        self.alerts.append(alert)
+        self._alerts_by_severity[alert.severity].append(alert)
+        self._severity_counts[alert.severity] += 1
 
     def get_alerts_by_severity(
         self, severity: ValidationSeverity
     ) -> List[ValidationAlert]:
         """Get all alerts of a specific severity level."""
-        return [alert for alert in self.alerts if alert.severity == severity]
+        return list(self._alerts_by_severity.get(ValidationSeverity(severity).value, ()))
 
     def has_critical_alerts(self) -> bool:
         """Check if any critical alerts exist."""
-        return any(alert.severity == ValidationSeverity.CRITICAL for alert in self.alerts)
+        return "critical" in self._severity_counts
 
     def get_alert_summary(self) -> Dict[str, int]:
         """Get summary of alerts by severity."""
         return {
-            "critical": len(self.get_alerts_by_severity(ValidationSeverity.CRITICAL)),
-            "warning": len(self.get_alerts_by_severity(ValidationSeverity.WARNING)),
-            "info": len(self.get_alerts_by_severity(ValidationSeverity.INFO)),
+            "critical": self._severity_counts["critical"],
+            "warning": self._severity_counts["warning"],
+            "info": self._severity_counts["info"],
             "total": len(self.alerts),
         }
@@ -5,12 +5,14 @@ Provides:
 - Base declarative class for all models
 - Naming conventions for database constraints
 - Mixin classes for common functionality (timestamps, soft deletes, audit)
+- Enum column type backed by VARCHAR + CHECK
 """
 
 from datetime import datetime
-from typing import Any
+from enum import Enum
+from typing import Any, Type
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, MetaData
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Enum as SQLEnum, Integer, MetaData
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import declarative_base
 
@@ -28,6 +30,27 @@ convention = {
 metadata = MetaData(naming_convention=convention)
 Base = declarative_base(metadata=metadata)
 
+# 64-bit key for high-volume tables (SQLite only autoincrements INTEGER keys)
+BigIntegerKey = BigInteger().with_variant(Integer, "sqlite")
+
+
+def value_enum(enum_class: Type[Enum], name: str) -> SQLEnum:
+    """
+    Column type for a Python Enum stored as VARCHAR of its member values.
+
+    Allowed values are enforced by a CHECK constraint (ck_<table>_<name>)
+    rather than a native PostgreSQL ENUM type, so adding a value later means
+    swapping the constraint instead of ALTER TYPE.
+    """
+    return SQLEnum(
+        enum_class,
+        name=name,
+        native_enum=False,
+        length=32,
+        create_constraint=True,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
 
 class TimestampMixin:
     """
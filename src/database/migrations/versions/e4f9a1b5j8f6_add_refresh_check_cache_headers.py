@@ -0,0 +1,30 @@
+"""Add HTTP cache validators to refresh checks
+
+Revision ID: e4f9a1b5j8f6
+Revises: d2e8f0g4i7e5
+Create Date: 2025-11-13 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f9a1b5j8f6'
+down_revision: Union[str, Sequence[str], None] = 'd2e8f0g4i7e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ETag/Last-Modified columns to refresh_checks."""
+    op.add_column('refresh_checks', sa.Column('last_etag', sa.String(length=255), nullable=True))
+    op.add_column('refresh_checks', sa.Column('last_modified', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove ETag/Last-Modified columns from refresh_checks."""
+    op.drop_column('refresh_checks', 'last_modified')
+    op.drop_column('refresh_checks', 'last_etag')
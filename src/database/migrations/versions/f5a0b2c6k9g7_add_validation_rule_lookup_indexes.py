@@ -0,0 +1,58 @@
+"""Add partial indexes for validation rule lookups
+
+Revision ID: f5a0b2c6k9g7
+Revises: e4f9a1b5j8f6
+Create Date: 2025-11-14 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a0b2c6k9g7'
+down_revision: Union[str, Sequence[str], None] = 'e4f9a1b5j8f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index active rules by field and active global rules by priority."""
+    # validation_rules is live; build without blocking writes. CONCURRENTLY
+    # can't run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_validation_rule_field_lookup',
+            'validation_rules',
+            ['table_name', 'field_name', 'priority'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_validation_rule_global',
+            'validation_rules',
+            ['priority'],
+            postgresql_where=sa.text('is_active AND table_name IS NULL AND field_name IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the validation rule lookup indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_validation_rule_global',
+            table_name='validation_rules',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_validation_rule_field_lookup',
+            table_name='validation_rules',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
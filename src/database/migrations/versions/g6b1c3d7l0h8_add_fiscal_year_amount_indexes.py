@@ -0,0 +1,61 @@
+"""Add composite fiscal year indexes for data quality scans
+
+Revision ID: g6b1c3d7l0h8
+Revises: f5a0b2c6k9g7
+Create Date: 2025-11-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g6b1c3d7l0h8'
+down_revision: Union[str, Sequence[str], None] = 'f5a0b2c6k9g7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index line item amounts and funded ratios by fiscal year."""
+    # These tables are live; build without blocking writes. CONCURRENTLY
+    # can't run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_revenue_fiscal_year_amount',
+            'revenues',
+            ['fiscal_year_id', 'actual_amount'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_expenditure_fiscal_year_amount',
+            'expenditures',
+            ['fiscal_year_id', 'actual_amount'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_pension_plan_fiscal_year_funded_ratio',
+            'pension_plans',
+            ['fiscal_year_id', 'funded_ratio'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the composite fiscal year indexes."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name in (
+            ('ix_pension_plan_fiscal_year_funded_ratio', 'pension_plans'),
+            ('ix_expenditure_fiscal_year_amount', 'expenditures'),
+            ('ix_revenue_fiscal_year_amount', 'revenues'),
+        ):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,45 @@
+"""Add denormalized revenue and expenditure totals to fiscal years
+
+Revision ID: h7c2d4e8m1i9
+Revises: g6b1c3d7l0h8
+Create Date: 2025-11-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h7c2d4e8m1i9'
+down_revision: Union[str, Sequence[str], None] = 'g6b1c3d7l0h8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add total columns and backfill them from existing line items."""
+    op.add_column('fiscal_years', sa.Column('total_revenues', sa.Numeric(18, 2), nullable=True))
+    op.add_column(
+        'fiscal_years', sa.Column('total_expenditures', sa.Numeric(18, 2), nullable=True)
+    )
+    op.execute(
+        """
+        UPDATE fiscal_years SET
+            total_revenues = (
+                SELECT COALESCE(SUM(actual_amount), 0) FROM revenues
+                WHERE revenues.fiscal_year_id = fiscal_years.id
+            ),
+            total_expenditures = (
+                SELECT COALESCE(SUM(actual_amount), 0) FROM expenditures
+                WHERE expenditures.fiscal_year_id = fiscal_years.id
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the total columns."""
+    op.drop_column('fiscal_years', 'total_expenditures')
+    op.drop_column('fiscal_years', 'total_revenues')
@@ -0,0 +1,82 @@
+"""Replace decision and notification listing indexes with live-row partial indexes
+
+Revision ID: i8d3e5f9n2j0
+Revises: h7c2d4e8m1i9
+Create Date: 2025-11-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i8d3e5f9n2j0'
+down_revision: Union[str, Sequence[str], None] = 'h7c2d4e8m1i9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index only rows that haven't been soft-deleted."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_decisions_live_city_date',
+            'decisions',
+            ['city_id', 'decision_date'],
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_decisions_city_date',
+            table_name='decisions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'ix_notifications_live_status_sent',
+            'notifications',
+            ['status', 'sent_at'],
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_notifications_status',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the full-table indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_status',
+            'notifications',
+            ['status'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_notifications_live_status_sent',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            'ix_decisions_city_date',
+            'decisions',
+            ['city_id', 'decision_date'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_decisions_live_city_date',
+            table_name='decisions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,81 @@
+"""Consolidate notification and validation queue indexes into composites
+
+Revision ID: j9e4f6g0o3k1
+Revises: i8d3e5f9n2j0
+Create Date: 2025-11-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j9e4f6g0o3k1'
+down_revision: Union[str, Sequence[str], None] = 'i8d3e5f9n2j0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, composite index name, columns, single-column indexes it replaces)
+COMPOSITE_INDEXES = [
+    (
+        'notifications',
+        'ix_notifications_subscriber_status_sent',
+        ['subscriber_id', 'status', 'sent_at'],
+        [
+            ('ix_notifications_subscriber', ['subscriber_id']),
+            ('ix_notifications_type', ['notification_type']),
+            ('ix_notifications_sent_date', ['sent_at']),
+        ],
+    ),
+    (
+        'validation_queue',
+        'ix_validation_queue_status_severity_city',
+        ['status', 'severity', 'city_id'],
+        [
+            ('ix_validation_queue_severity', ['severity']),
+            ('ix_validation_queue_status', ['status']),
+        ],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Build each composite index, then drop the indexes it replaces."""
+    with op.get_context().autocommit_block():
+        for table_name, index_name, columns, replaced in COMPOSITE_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            for old_name, _ in replaced:
+                op.drop_index(
+                    old_name,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    with op.get_context().autocommit_block():
+        for table_name, index_name, _, replaced in reversed(COMPOSITE_INDEXES):
+            for old_name, old_columns in replaced:
+                op.create_index(
+                    old_name,
+                    table_name,
+                    old_columns,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,95 @@
+"""Convert PostgreSQL ENUM columns to VARCHAR with CHECK constraints
+
+Revision ID: k0f5g7h1p4l2
+Revises: j9e4f6g0o3k1
+Create Date: 2025-11-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k0f5g7h1p4l2'
+down_revision: Union[str, Sequence[str], None] = 'j9e4f6g0o3k1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ENUM_TYPES = {
+    'decisioncategory': (
+        'budget', 'tax', 'bond', 'labor', 'service', 'infrastructure',
+        'pension', 'policy', 'emergency', 'other',
+    ),
+    'decisionstatus': (
+        'proposed', 'approved', 'rejected', 'pending_outcome',
+        'outcome_tracked', 'cancelled',
+    ),
+    'votetype': ('council', 'ballot', 'referendum', 'emergency'),
+    'outcomestatus': ('pending', 'partial', 'final', 'revised'),
+    'subscribercategory': (
+        'media', 'council', 'civil_society', 'researcher', 'public', 'other',
+    ),
+    'subscriberstatus': ('active', 'unsubscribed', 'bounced', 'inactive'),
+    'notificationtype': (
+        'risk_score_change', 'fiscal_cliff_change', 'pension_threshold',
+        'new_data', 'quarterly_update', 'press_release', 'decision_outcome', 'custom',
+    ),
+    'alertseverity': ('info', 'warning', 'critical'),
+    'notificationstatus': ('pending', 'sent', 'failed', 'bounced'),
+}
+
+# (table, column, enum type)
+ENUM_COLUMNS = [
+    ('decisions', 'category', 'decisioncategory'),
+    ('decisions', 'status', 'decisionstatus'),
+    ('decisions', 'vote_type', 'votetype'),
+    ('outcomes', 'status', 'outcomestatus'),
+    ('subscribers', 'category', 'subscribercategory'),
+    ('subscribers', 'status', 'subscriberstatus'),
+    ('alert_rules', 'notification_type', 'notificationtype'),
+    ('alert_rules', 'severity', 'alertseverity'),
+    ('notifications', 'notification_type', 'notificationtype'),
+    ('notifications', 'severity', 'alertseverity'),
+    ('notifications', 'status', 'notificationstatus'),
+]
+
+
+def _allowed(type_name: str) -> str:
+    return ', '.join(f"'{value}'" for value in ENUM_TYPES[type_name])
+
+
+def upgrade() -> None:
+    """Store enum values as VARCHAR(32) guarded by CHECK constraints."""
+    for table_name, column_name, type_name in ENUM_COLUMNS:
+        op.alter_column(
+            table_name,
+            column_name,
+            type_=sa.String(length=32),
+            postgresql_using=f'{column_name}::text',
+        )
+        op.create_check_constraint(
+            f'ck_{table_name}_{column_name}',
+            table_name,
+            f'{column_name} IN ({_allowed(type_name)})',
+        )
+
+    for type_name in ENUM_TYPES:
+        op.execute(f'DROP TYPE IF EXISTS {type_name}')
+
+
+def downgrade() -> None:
+    """Restore the native ENUM types."""
+    for type_name, values in ENUM_TYPES.items():
+        sa.Enum(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+
+    for table_name, column_name, type_name in reversed(ENUM_COLUMNS):
+        op.drop_constraint(f'ck_{table_name}_{column_name}', table_name, type_='check')
+        op.alter_column(
+            table_name,
+            column_name,
+            type_=sa.Enum(*ENUM_TYPES[type_name], name=type_name),
+            postgresql_using=f'{column_name}::{type_name}',
+        )
@@ -0,0 +1,57 @@
+"""Index foreign key columns that no existing index leads with
+
+Revision ID: l1g6h8i2q5m3
+Revises: k0f5g7h1p4l2
+Create Date: 2025-11-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l1g6h8i2q5m3'
+down_revision: Union[str, Sequence[str], None] = 'k0f5g7h1p4l2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, foreign key column)
+FOREIGN_KEY_INDEXES = [
+    ('ix_decisions_primary_fiscal_year', 'decisions', 'primary_fiscal_year_id'),
+    ('ix_decisions_source_document', 'decisions', 'source_document_id'),
+    ('ix_outcomes_fiscal_year', 'outcomes', 'fiscal_year_id'),
+    ('ix_outcomes_source_document', 'outcomes', 'source_document_id'),
+    ('ix_subscribers_city', 'subscribers', 'city_id'),
+    ('ix_alert_rules_city', 'alert_rules', 'city_id'),
+    ('ix_notifications_city', 'notifications', 'city_id'),
+    ('ix_notifications_alert_rule', 'notifications', 'alert_rule_id'),
+    ('ix_notifications_fiscal_year', 'notifications', 'fiscal_year_id'),
+    ('ix_validation_queue_fiscal_year', 'validation_queue', 'fiscal_year_id'),
+]
+
+
+def upgrade() -> None:
+    """Index foreign keys so parent deletes don't scan the child table."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in FOREIGN_KEY_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the foreign key indexes."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(FOREIGN_KEY_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
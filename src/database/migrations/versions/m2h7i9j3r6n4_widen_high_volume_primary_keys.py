@@ -0,0 +1,52 @@
+"""Widen primary keys of high-volume tables to BIGINT
+
+Revision ID: m2h7i9j3r6n4
+Revises: l1g6h8i2q5m3
+Create Date: 2025-11-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm2h7i9j3r6n4'
+down_revision: Union[str, Sequence[str], None] = 'l1g6h8i2q5m3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose id (and backing sequence) become BIGINT
+WIDENED_TABLES = ['validation_queue', 'anomaly_flags', 'votes', 'notifications']
+
+# (table, column) foreign keys that reference a widened id
+REFERENCING_COLUMNS = [
+    ('validation_records', 'queue_item_id'),
+    ('anomaly_flags', 'queue_item_id'),
+]
+
+
+def upgrade() -> None:
+    """Widen ids, their sequences, and the columns that reference them."""
+    for table_name in WIDENED_TABLES:
+        op.alter_column(table_name, 'id', type_=sa.BigInteger(), existing_nullable=False)
+        op.execute(f'ALTER SEQUENCE {table_name}_id_seq AS BIGINT')
+
+    for table_name, column_name in REFERENCING_COLUMNS:
+        op.alter_column(
+            table_name, column_name, type_=sa.BigInteger(), existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    """Narrow ids back to INTEGER."""
+    for table_name, column_name in REFERENCING_COLUMNS:
+        op.alter_column(
+            table_name, column_name, type_=sa.Integer(), existing_nullable=False
+        )
+
+    for table_name in reversed(WIDENED_TABLES):
+        op.execute(f'ALTER SEQUENCE {table_name}_id_seq AS INTEGER')
+        op.alter_column(table_name, 'id', type_=sa.Integer(), existing_nullable=False)
@@ -0,0 +1,49 @@
+"""Drop unused indexes on small-cardinality string fields
+
+Revision ID: n3i8j0k4s7o5
+Revises: m2h7i9j3r6n4
+Create Date: 2025-11-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'n3i8j0k4s7o5'
+down_revision: Union[str, Sequence[str], None] = 'm2h7i9j3r6n4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, column)
+DROPPED_INDEXES = [
+    ('ix_anomaly_flag_severity', 'anomaly_flags', 'severity'),
+    ('ix_validation_record_action', 'validation_records', 'action'),
+]
+
+
+def upgrade() -> None:
+    """Drop indexes that no query filters or sorts on."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in DROPPED_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in DROPPED_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [column_name],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -0,0 +1,82 @@
+"""Add server-side created_at/updated_at defaults and an updated_at trigger
+
+Revision ID: o4j9k1l5t8p6
+Revises: n3i8j0k4s7o5
+Create Date: 2025-11-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'o4j9k1l5t8p6'
+down_revision: Union[str, Sequence[str], None] = 'n3i8j0k4s7o5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+AUDITED_TABLES = [
+    'validation_queue',
+    'validation_records',
+    'anomaly_flags',
+    'validation_rules',
+    'decisions',
+    'votes',
+    'outcomes',
+    'subscribers',
+    'alert_rules',
+    'notifications',
+]
+
+# Columns hold naive UTC, matching datetime.utcnow() on the application side
+UTC_NOW = "timezone('utc', now())"
+
+
+def upgrade() -> None:
+    """Default audit timestamps in the database and maintain updated_at on UPDATE."""
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            -- Keep a value the application set explicitly
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := {UTC_NOW};
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for table_name in AUDITED_TABLES:
+        for column_name in ('created_at', 'updated_at'):
+            op.alter_column(
+                table_name,
+                column_name,
+                server_default=sa.text(UTC_NOW),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
+        op.execute(
+            f'CREATE TRIGGER trg_{table_name}_updated_at BEFORE UPDATE ON {table_name} '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade() -> None:
+    """Remove the triggers and server defaults."""
+    for table_name in reversed(AUDITED_TABLES):
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table_name}_updated_at ON {table_name}')
+        for column_name in ('updated_at', 'created_at'):
+            op.alter_column(
+                table_name,
+                column_name,
+                server_default=None,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
+
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
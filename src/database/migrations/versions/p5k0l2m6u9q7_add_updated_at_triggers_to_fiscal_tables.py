@@ -0,0 +1,65 @@
+"""Maintain updated_at by trigger on the fiscal and pension tables
+
+Revision ID: p5k0l2m6u9q7
+Revises: o4j9k1l5t8p6
+Create Date: 2025-11-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p5k0l2m6u9q7'
+down_revision: Union[str, Sequence[str], None] = 'o4j9k1l5t8p6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose updated_at/row count fingerprint a fiscal year's quality
+# metrics (see QualityMetricsCalculator._data_version)
+FISCAL_TABLES = [
+    'fiscal_years',
+    'revenues',
+    'expenditures',
+    'fund_balances',
+    'pension_plans',
+    'pension_contributions',
+]
+
+# Columns hold naive UTC, matching datetime.utcnow() on the application side
+UTC_NOW = "timezone('utc', now())"
+
+
+def upgrade() -> None:
+    """Default audit timestamps in the database and maintain updated_at on UPDATE."""
+    # set_updated_at() was created by o4j9k1l5t8p6
+    for table_name in FISCAL_TABLES:
+        for column_name in ('created_at', 'updated_at'):
+            op.alter_column(
+                table_name,
+                column_name,
+                server_default=sa.text(UTC_NOW),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
+        op.execute(
+            f'CREATE TRIGGER trg_{table_name}_updated_at BEFORE UPDATE ON {table_name} '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade() -> None:
+    """Remove the triggers and server defaults."""
+    for table_name in reversed(FISCAL_TABLES):
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table_name}_updated_at ON {table_name}')
+        for column_name in ('updated_at', 'created_at'):
+            op.alter_column(
+                table_name,
+                column_name,
+                server_default=None,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
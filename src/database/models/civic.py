@@ -20,11 +20,11 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
-    Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import relationship
 
-from src.database.base import AuditMixin, Base
+from src.database.base import AuditMixin, BigIntegerKey, Base, value_enum
 
 if TYPE_CHECKING:
     from src.database.models.core import City, FiscalYear
@@ -90,9 +90,17 @@ class Decision(Base, AuditMixin):
 
     __tablename__ = "decisions"
     __table_args__ = (
-        Index("ix_decisions_city_date", "city_id", "decision_date"),
+        # Listings always exclude soft-deleted decisions
+        Index(
+            "ix_decisions_live_city_date",
+            "city_id",
+            "decision_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
         Index("ix_decisions_category", "category"),
         Index("ix_decisions_status", "status"),
+        Index("ix_decisions_primary_fiscal_year", "primary_fiscal_year_id"),
+        Index("ix_decisions_source_document", "source_document_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -104,11 +112,13 @@ class Decision(Base, AuditMixin):
     title = Column(String(500), nullable=False)  # Short title
     description = Column(Text, nullable=False)  # Detailed description
 
-    category = Column(SQLEnum(DecisionCategory), nullable=False)
-    status = Column(SQLEnum(DecisionStatus), nullable=False, default=DecisionStatus.PROPOSED)
+    category = Column(value_enum(DecisionCategory, "category"), nullable=False)
+    status = Column(
+        value_enum(DecisionStatus, "status"), nullable=False, default=DecisionStatus.PROPOSED
+    )
 
     # Vote Information
-    vote_type = Column(SQLEnum(VoteType), nullable=True)
+    vote_type = Column(value_enum(VoteType, "vote_type"), nullable=True)
     vote_count_yes = Column(Integer, nullable=True)
     vote_count_no = Column(Integer, nullable=True)
     vote_count_abstain = Column(Integer, nullable=True)
@@ -202,7 +212,7 @@ class Vote(Base, AuditMixin):
         Index("ix_votes_voter", "voter_name"),
     )
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerKey, primary_key=True)
 
     decision_id = Column(Integer, ForeignKey("decisions.id"), nullable=False)
 
@@ -243,6 +253,8 @@ class Outcome(Base, AuditMixin):
         Index("ix_outcomes_decision", "decision_id"),
         Index("ix_outcomes_date", "outcome_date"),
         Index("ix_outcomes_status", "status"),
+        Index("ix_outcomes_fiscal_year", "fiscal_year_id"),
+        Index("ix_outcomes_source_document", "source_document_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -251,7 +263,9 @@ class Outcome(Base, AuditMixin):
 
     # Outcome Information
     outcome_date = Column(Date, nullable=False)  # Date of outcome measurement
-    status = Column(SQLEnum(OutcomeStatus), nullable=False, default=OutcomeStatus.PENDING)
+    status = Column(
+        value_enum(OutcomeStatus, "status"), nullable=False, default=OutcomeStatus.PENDING
+    )
 
     # Actual Impact
     actual_annual_impact = Column(Numeric(15, 2), nullable=True)  # Actual ± dollars/year
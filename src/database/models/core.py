@@ -131,6 +131,10 @@ class FiscalYear(Base, AuditMixin):
     data_quality_score = Column(Integer, nullable=True)
     data_quality_notes = Column(Text, nullable=True)
 
+    # Line item totals, refreshed on ingest (NULL until first computed)
+    total_revenues = Column(Numeric(18, 2), nullable=True)
+    total_expenditures = Column(Numeric(18, 2), nullable=True)
+
     # Validation
     validated_by = Column(String(255), nullable=True)  # Person or system
     validated_at = Column(DateTime, nullable=True)
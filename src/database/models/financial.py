@@ -78,6 +78,7 @@ class Revenue(Base, AuditMixin):
         ),
         CheckConstraint("actual_amount >= 0", name="ck_revenue_actual_non_negative"),
         Index("ix_revenue_fiscal_year", "fiscal_year_id"),
+        Index("ix_revenue_fiscal_year_amount", "fiscal_year_id", "actual_amount"),
         Index("ix_revenue_category", "category_id"),
     )
 
@@ -178,6 +179,7 @@ class Expenditure(Base, AuditMixin):
             "actual_amount >= 0", name="ck_expenditure_actual_non_negative"
         ),
         Index("ix_expenditure_fiscal_year", "fiscal_year_id"),
+        Index("ix_expenditure_fiscal_year_amount", "fiscal_year_id", "actual_amount"),
         Index("ix_expenditure_category", "category_id"),
     )
 
@@ -48,6 +48,9 @@ class PensionPlan(Base, AuditMixin):
             "fiscal_year_id", "plan_name", name="uq_pension_plan_year_name"
         ),
         Index("ix_pension_plan_fiscal_year", "fiscal_year_id"),
+        Index(
+            "ix_pension_plan_fiscal_year_funded_ratio", "fiscal_year_id", "funded_ratio"
+        ),
         CheckConstraint(
             "funded_ratio >= 0 AND funded_ratio <= 2.0",
             name="ck_pension_funded_ratio_reasonable",
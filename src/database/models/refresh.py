@@ -62,6 +62,10 @@ class RefreshCheck(Base, AuditMixin):
     scraping_success = Column(Boolean, nullable=False, default=True)
     scraping_error = Column(Text, nullable=True)
 
+    # HTTP cache validators of the scraped page, sent back on the next check
+    last_etag = Column(String(255), nullable=True)
+    last_modified = Column(String(64), nullable=True)
+
     # Next Steps
     notification_needed = Column(Boolean, nullable=False, default=False)
     notification_sent = Column(Boolean, nullable=False, default=False)
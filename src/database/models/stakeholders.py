@@ -20,11 +20,11 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
-    Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import relationship
 
-from src.database.base import AuditMixin, Base
+from src.database.base import AuditMixin, BigIntegerKey, Base, value_enum
 
 if TYPE_CHECKING:
     from src.database.models.core import City
@@ -93,6 +93,7 @@ class Subscriber(Base, AuditMixin):
         Index("ix_subscribers_email", "email"),
         Index("ix_subscribers_category", "category"),
         Index("ix_subscribers_status", "status"),
+        Index("ix_subscribers_city", "city_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -103,8 +104,10 @@ class Subscriber(Base, AuditMixin):
     organization = Column(String(255), nullable=True)  # Optional: organization
 
     # Categorization
-    category = Column(SQLEnum(SubscriberCategory), nullable=False)
-    status = Column(SQLEnum(SubscriberStatus), nullable=False, default=SubscriberStatus.ACTIVE)
+    category = Column(value_enum(SubscriberCategory, "category"), nullable=False)
+    status = Column(
+        value_enum(SubscriberStatus, "status"), nullable=False, default=SubscriberStatus.ACTIVE
+    )
 
     # Subscription Preferences
     subscribed_to_quarterly_updates = Column(Boolean, nullable=False, default=True)
@@ -159,6 +162,7 @@ class AlertRule(Base, AuditMixin):
     __table_args__ = (
         Index("ix_alert_rules_type", "notification_type"),
         Index("ix_alert_rules_enabled", "is_enabled"),
+        Index("ix_alert_rules_city", "city_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -166,7 +170,7 @@ class AlertRule(Base, AuditMixin):
     # Rule Configuration
     rule_name = Column(String(100), nullable=False, unique=True)
     description = Column(Text, nullable=False)
-    notification_type = Column(SQLEnum(NotificationType), nullable=False)
+    notification_type = Column(value_enum(NotificationType, "notification_type"), nullable=False)
 
     # Trigger Conditions
     metric_name = Column(String(100), nullable=True)  # e.g., "overall_risk_score"
@@ -175,7 +179,9 @@ class AlertRule(Base, AuditMixin):
     direction = Column(String(20), nullable=True)  # "increase", "decrease", "either"
 
     # Alert Configuration
-    severity = Column(SQLEnum(AlertSeverity), nullable=False, default=AlertSeverity.INFO)
+    severity = Column(
+        value_enum(AlertSeverity, "severity"), nullable=False, default=AlertSeverity.INFO
+    )
     message_template = Column(Text, nullable=True)  # Template for alert message
 
     # Filtering
@@ -249,20 +255,29 @@ class Notification(Base, AuditMixin):
 
     __tablename__ = "notifications"
     __table_args__ = (
-        Index("ix_notifications_subscriber", "subscriber_id"),
-        Index("ix_notifications_type", "notification_type"),
-        Index("ix_notifications_status", "status"),
-        Index("ix_notifications_sent_date", "sent_at"),
+        Index("ix_notifications_subscriber_status_sent", "subscriber_id", "status", "sent_at"),
+        Index("ix_notifications_city", "city_id"),
+        Index("ix_notifications_alert_rule", "alert_rule_id"),
+        Index("ix_notifications_fiscal_year", "fiscal_year_id"),
+        # Feeds always exclude soft-deleted notifications
+        Index(
+            "ix_notifications_live_status_sent",
+            "status",
+            "sent_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
     )
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerKey, primary_key=True)
 
     # Recipient
     subscriber_id = Column(Integer, ForeignKey("subscribers.id"), nullable=False)
 
     # Notification Details
-    notification_type = Column(SQLEnum(NotificationType), nullable=False)
-    severity = Column(SQLEnum(AlertSeverity), nullable=False, default=AlertSeverity.INFO)
+    notification_type = Column(value_enum(NotificationType, "notification_type"), nullable=False)
+    severity = Column(
+        value_enum(AlertSeverity, "severity"), nullable=False, default=AlertSeverity.INFO
+    )
 
     subject = Column(String(500), nullable=False)
     message_text = Column(Text, nullable=False)  # Plain text version
@@ -282,7 +297,9 @@ class Notification(Base, AuditMixin):
     previous_value = Column(Numeric(10, 2), nullable=True)  # Previous value for comparison
 
     # Delivery Status
-    status = Column(SQLEnum(NotificationStatus), nullable=False, default=NotificationStatus.PENDING)
+    status = Column(
+        value_enum(NotificationStatus, "status"), nullable=False, default=NotificationStatus.PENDING
+    )
     sent_at = Column(DateTime, nullable=True)
     delivery_error = Column(Text, nullable=True)
 
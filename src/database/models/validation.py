@@ -17,10 +17,11 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 
-from src.database.base import AuditMixin, Base
+from src.database.base import AuditMixin, BigIntegerKey, Base
 
 if TYPE_CHECKING:
     from src.database.models.core import City, FiscalYear
@@ -36,12 +37,13 @@ class ValidationQueueItem(Base, AuditMixin):
 
     __tablename__ = "validation_queue"
     __table_args__ = (
-        Index("ix_validation_queue_status", "status"),
-        Index("ix_validation_queue_severity", "severity"),
+        # Review queue: status filter, then severity and city
+        Index("ix_validation_queue_status_severity_city", "status", "severity", "city_id"),
         Index("ix_validation_queue_city_fy", "city_id", "fiscal_year"),
+        Index("ix_validation_queue_fiscal_year", "fiscal_year_id"),
     )
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerKey, primary_key=True)
 
     # What data needs validation?
     table_name = Column(String(100), nullable=False)
@@ -109,13 +111,12 @@ class ValidationRecord(Base, AuditMixin):
     __table_args__ = (
         Index("ix_validation_record_queue_item", "queue_item_id"),
         Index("ix_validation_record_validator", "validated_by"),
-        Index("ix_validation_record_action", "action"),
     )
 
     id = Column(Integer, primary_key=True)
 
     # Link to queue item
-    queue_item_id = Column(Integer, ForeignKey("validation_queue.id"), nullable=False)
+    queue_item_id = Column(BigIntegerKey, ForeignKey("validation_queue.id"), nullable=False)
 
     # Validation action
     action = Column(String(20), nullable=False)  # APPROVE, CORRECT, REJECT, ESCALATE
@@ -157,13 +158,12 @@ class AnomalyFlag(Base, AuditMixin):
     __table_args__ = (
         Index("ix_anomaly_flag_queue_item", "queue_item_id"),
         Index("ix_anomaly_flag_rule", "rule_name"),
-        Index("ix_anomaly_flag_severity", "severity"),
     )
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigIntegerKey, primary_key=True)
 
     # Link to queue item
-    queue_item_id = Column(Integer, ForeignKey("validation_queue.id"), nullable=False)
+    queue_item_id = Column(BigIntegerKey, ForeignKey("validation_queue.id"), nullable=False)
 
     # Anomaly detection rule
     rule_name = Column(String(100), nullable=False)
@@ -211,7 +211,22 @@ class ValidationRule(Base, AuditMixin):
     """
 
     __tablename__ = "validation_rules"
-    __table_args__ = (Index("ix_validation_rule_active", "is_active"),)
+    __table_args__ = (
+        Index("ix_validation_rule_active", "is_active"),
+        # Partial indexes for the anomaly detector's rule lookup
+        Index(
+            "ix_validation_rule_field_lookup",
+            "table_name",
+            "field_name",
+            "priority",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_validation_rule_global",
+            "priority",
+            postgresql_where=text("is_active AND table_name IS NULL AND field_name IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
 
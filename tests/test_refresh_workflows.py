@@ -88,12 +88,13 @@ class TestCAFRAvailabilityChecker:
         checker = CAFRAvailabilityChecker(db_session)
         assert checker.db == db_session
 
-    @patch("src.data_pipeline.orchestration.refresh_workflows.requests.get")
+    @patch("requests_cache.CachedSession.get")
     def test_check_for_new_cafr_found(self, mock_get, db_session, test_city):
         """Test detecting a new CAFR on the website."""
         # Mock HTML response with CAFR link
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.content = b"""
         <html>
             <body>
@@ -101,6 +102,7 @@ class TestCAFRAvailabilityChecker:
             </body>
         </html>
         """
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
 
         checker = CAFRAvailabilityChecker(db_session)
@@ -110,13 +112,15 @@ class TestCAFRAvailabilityChecker:
         assert result["fiscal_year"] == 2024
         assert "cafr-fy2024.pdf" in result["document_url"]
 
-    @patch("src.data_pipeline.orchestration.refresh_workflows.requests.get")
+    @patch("requests_cache.CachedSession.get")
     def test_check_for_new_cafr_not_found(self, mock_get, db_session, test_city):
         """Test when no new CAFR is found."""
         # Mock HTML response without CAFR link
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.content = b"<html><body>No CAFRs here</body></html>"
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
 
         checker = CAFRAvailabilityChecker(db_session)
@@ -126,10 +130,12 @@ class TestCAFRAvailabilityChecker:
 
     def test_check_records_created(self, db_session, test_city):
         """Test that checks are recorded in database."""
-        with patch("src.data_pipeline.orchestration.refresh_workflows.requests.get") as mock_get:
+        with patch("requests_cache.CachedSession.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
+            mock_response.headers = {}
             mock_response.content = b"<html><body>No CAFRs</body></html>"
+            mock_response.iter_content.return_value = [mock_response.content]
             mock_get.return_value = mock_response
 
             checker = CAFRAvailabilityChecker(db_session)
@@ -149,6 +155,69 @@ class TestCAFRAvailabilityChecker:
             db_session.delete(check)
             db_session.commit()
 
+    def test_unchanged_page_uses_conditional_get(self, db_session, test_city):
+        """Test that stored validators are sent and a 304 skips parsing."""
+        with patch("requests_cache.CachedSession.get") as mock_get:
+            first = Mock()
+            first.status_code = 200
+            first.headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}
+            first.iter_content.return_value = [b"<html><body>No CAFRs</body></html>"]
+            not_modified = Mock()
+            not_modified.status_code = 304
+            mock_get.side_effect = [first, not_modified]
+
+            checker = CAFRAvailabilityChecker(db_session)
+            checker.check_for_new_cafr(test_city.id)
+            with patch("src.data_pipeline.orchestration.refresh_workflows.BeautifulSoup") as mock_soup:
+                result = checker.check_for_new_cafr(test_city.id)
+
+            assert result is None
+            mock_soup.assert_not_called()
+            sent_headers = mock_get.call_args_list[1].kwargs["headers"]
+            assert sent_headers["If-None-Match"] == '"v1"'
+            assert sent_headers["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+
+            # Validators are carried forward onto the 304 check record
+            checks = (
+                db_session.query(RefreshCheck)
+                .filter(RefreshCheck.city_id == test_city.id)
+                .all()
+            )
+            assert len(checks) == 2
+            assert all(check.last_etag == '"v1"' for check in checks)
+
+            # Cleanup
+            for check in checks:
+                db_session.delete(check)
+            db_session.commit()
+
+    @patch("src.data_pipeline.orchestration.refresh_workflows.MAX_FINANCE_PAGE_BYTES", 16)
+    @patch("requests_cache.CachedSession.get")
+    def test_oversized_page_is_rejected(self, mock_get, db_session, test_city):
+        """Test that a page over the size cap is recorded as a failed check."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [b"<html>" * 4, b"<body></body>"]
+        mock_get.return_value = mock_response
+
+        checker = CAFRAvailabilityChecker(db_session)
+        result = checker.check_for_new_cafr(test_city.id)
+
+        assert result is None
+        mock_response.close.assert_called_once()
+        check = (
+            db_session.query(RefreshCheck)
+            .filter(RefreshCheck.city_id == test_city.id)
+            .first()
+        )
+        assert check.scraping_success is False
+        assert "larger than" in check.scraping_error
+
+        # Cleanup
+        db_session.delete(check)
+        db_session.commit()
+
 
 class TestCalPERSAvailabilityChecker:
     """Tests for CalPERS valuation checking."""
@@ -376,7 +445,7 @@ class TestDataRefreshOrchestrator:
 class TestRefreshWorkflowIntegration:
     """Integration tests for complete refresh workflow."""
 
-    @patch("src.data_pipeline.orchestration.refresh_workflows.requests.get")
+    @patch("requests_cache.CachedSession.get")
     @patch("src.data_pipeline.orchestration.refresh_workflows.email_service.send_cafr_available_notification")
     def test_complete_cafr_workflow(
         self, mock_email, mock_get, db_session, test_city
@@ -385,11 +454,13 @@ class TestRefreshWorkflowIntegration:
         # Mock HTML with new CAFR
         mock_response = Mock()
         mock_response.status_code = 200
+        mock_response.headers = {}
         mock_response.content = b"""
         <html><body>
             <a href="/files/cafr-fy2025.pdf">FY2025 CAFR</a>
         </body></html>
         """
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_get.return_value = mock_response
         mock_email.return_value = True
 
@@ -427,6 +498,36 @@ class TestRefreshWorkflowIntegration:
             db_session.delete(notification)
         db_session.commit()
 
+    @patch("requests_cache.CachedSession.get")
+    @patch("src.data_pipeline.orchestration.refresh_workflows.email_service.send_cafr_available_notification")
+    def test_quarterly_sweep_fetches_each_page_once(
+        self, mock_email, mock_get, db_session, test_city
+    ):
+        """Test multi-city sweep prefetches finance pages and checks every city."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b"""
+        <html><body>
+            <a href="/files/cafr-fy2025.pdf">FY2025 CAFR</a>
+        </body></html>
+        """
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_get.return_value = mock_response
+        mock_email.return_value = True
+
+        orchestrator = DataRefreshOrchestrator(db_session)
+        results = orchestrator.run_quarterly_check_all([test_city])
+
+        assert results[test_city.id]["cafr_found"] is True
+        mock_get.assert_called_once()
+        assert orchestrator.cafr_checker._page_cache == {}
+
+        # Cleanup
+        for model in (RefreshCheck, RefreshNotification):
+            db_session.query(model).filter(model.city_id == test_city.id).delete()
+        db_session.commit()
+
 
 # Mark tests that require database as slow
 pytestmark = pytest.mark.slow
@@ -0,0 +1,79 @@
+"""
+Test anomaly detection on entered values.
+"""
+import pytest
+
+from src.data_quality.anomaly_detection import AnomalyDetector, seed_default_rules
+from src.database.models.validation import AnomalyFlag
+
+
+@pytest.fixture
+def detector(test_db):
+    """Anomaly detector with the default rules seeded."""
+    seed_default_rules(test_db)
+    return AnomalyDetector(test_db)
+
+
+def test_bulk_flags_year_over_year_change(
+    detector, test_db, sample_city, sample_financial_data
+):
+    """Test bulk check flags a value far from the prior year's summed total."""
+    # Prior year (2024) revenues total 50M
+    records = [
+        ("revenues", 1, "amount", 100.0, sample_city.id, 2025, "tester"),
+        ("revenues", 2, "amount", 51000000.0, sample_city.id, 2025, "tester"),
+    ]
+
+    queue_items = detector.check_values_bulk(records)
+
+    assert [item.record_id for item in queue_items] == [1]
+    assert queue_items[0].severity == "WARNING"
+    flags = test_db.query(AnomalyFlag).filter(AnomalyFlag.queue_item_id == queue_items[0].id).all()
+    assert [flag.rule_name for flag in flags] == ["revenue_yoy_50"]
+
+
+def test_bulk_takes_highest_severity(detector, test_db, sample_city, sample_financial_data):
+    """Test a record breaking several rules is queued at the highest severity."""
+    records = [("expenditures", 3, "amount", -5.0, sample_city.id, 2025, "tester")]
+
+    queue_items = detector.check_values_bulk(records)
+
+    assert len(queue_items) == 1
+    assert queue_items[0].severity == "CRITICAL"
+    rule_names = {
+        flag.rule_name
+        for flag in test_db.query(AnomalyFlag).filter(
+            AnomalyFlag.queue_item_id == queue_items[0].id
+        )
+    }
+    assert rule_names == {"negative_expenditure", "expenditure_yoy_50"}
+
+
+def test_bulk_without_prior_year(detector, sample_city, sample_financial_data):
+    """Test values with no prior-year data are not flagged year-over-year."""
+    records = [("revenues", 4, "amount", 100.0, sample_city.id, 2030, "tester")]
+
+    assert detector.check_values_bulk(records) == []
+
+
+def test_check_value_flags_year_over_year_change(
+    detector, test_db, sample_city, sample_financial_data
+):
+    """Test single-value check compares against the prior year's summed total."""
+    queue_item = detector.check_value(
+        "revenues", 5, "amount", 100.0, sample_city.id, 2025, "tester"
+    )
+
+    assert queue_item is not None
+    flags = test_db.query(AnomalyFlag).filter(AnomalyFlag.queue_item_id == queue_item.id).all()
+    assert [flag.rule_name for flag in flags] == ["revenue_yoy_50"]
+    assert float(flags[0].prior_year_value) == pytest.approx(50000000.0)
+
+
+def test_check_value_within_threshold(detector, sample_city, sample_financial_data):
+    """Test single-value check passes a value close to the prior year's total."""
+    queue_item = detector.check_value(
+        "revenues", 6, "amount", 51000000.0, sample_city.id, 2025, "tester"
+    )
+
+    assert queue_item is None
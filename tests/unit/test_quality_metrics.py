@@ -0,0 +1,86 @@
+"""
+Test data quality metrics calculation.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from src.data_quality import quality_metrics
+from src.data_quality.quality_metrics import QualityMetricsCalculator, ValidationStatus
+from src.data_quality.validators import DataQualityValidator, ValidationAlert, ValidationSeverity
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics_cache():
+    """Keep metrics cached by one test from leaking into the next."""
+    quality_metrics._metrics_cache.clear()
+    yield
+    quality_metrics._metrics_cache.clear()
+
+
+def _alert(severity):
+    """Build a validation alert of the given severity."""
+    return ValidationAlert(
+        severity=severity, category="financial", fiscal_year=2024, message="test"
+    )
+
+
+def test_calculate_metrics_uses_given_alerts(test_db, sample_fiscal_year, sample_financial_data):
+    """Test metrics are scored from precomputed alerts without re-validating."""
+    calculator = QualityMetricsCalculator(test_db)
+    alerts = [_alert(ValidationSeverity.WARNING), _alert(ValidationSeverity.INFO)]
+
+    with patch.object(DataQualityValidator, "validate_fiscal_year") as validate:
+        metrics = calculator.calculate_metrics(sample_fiscal_year, alerts=alerts)
+
+    validate.assert_not_called()
+    assert metrics.completeness_score == 100.0
+    assert metrics.consistency_score == 95
+    assert (metrics.critical_issues, metrics.warnings, metrics.info_items) == (0, 1, 1)
+
+
+def test_calculate_metrics_for_city_uses_given_alerts(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test city metrics reuse alerts from validate_city instead of validating each year."""
+    calculator = QualityMetricsCalculator(test_db)
+    alerts_by_year = {2024: [_alert(ValidationSeverity.CRITICAL)]}
+
+    with patch.object(DataQualityValidator, "validate_fiscal_year") as validate:
+        metrics_by_year = calculator.calculate_metrics_for_city(sample_city.id, alerts_by_year)
+
+    validate.assert_not_called()
+    assert list(metrics_by_year) == [2024]
+    assert metrics_by_year[2024].critical_issues == 1
+    assert metrics_by_year[2024].validation_status is ValidationStatus.NEEDS_CORRECTION
+
+
+def test_calculate_metrics_for_city_skips_validation_when_memoized(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test city metrics are validated again only after a year's data changes."""
+    calculator = QualityMetricsCalculator(test_db)
+
+    with patch.object(
+        DataQualityValidator, "validate_city", return_value={2024: []}
+    ) as validate:
+        first = calculator.calculate_metrics_for_city(sample_city.id)
+        second = calculator.calculate_metrics_for_city(sample_city.id)
+        assert validate.call_count == 1
+        assert second[2024] is first[2024]
+
+        sample_financial_data["revenue"].actual_amount += 1
+        test_db.commit()
+        calculator.calculate_metrics_for_city(sample_city.id)
+        assert validate.call_count == 2
+
+
+def test_city_data_versions_match_single_year_version(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test the grouped city fingerprint matches the per-year one, so they share memo entries."""
+    calculator = QualityMetricsCalculator(test_db)
+
+    versions = calculator._city_data_versions(sample_city.id)
+
+    assert versions == {2024: calculator._data_version(sample_fiscal_year)}
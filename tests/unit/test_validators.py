@@ -0,0 +1,112 @@
+"""
+Test data quality validation of fiscal year data.
+"""
+from datetime import date
+from decimal import Decimal
+
+from src.data_quality.validators import DataQualityValidator
+from src.database.models import Expenditure, FiscalYear, Revenue
+
+
+def test_load_year_data_totals_and_presence(test_db, sample_fiscal_year, sample_financial_data):
+    """Test year data sums line item amounts and records which tables have rows."""
+    validator = DataQualityValidator(test_db)
+
+    data = validator._load_year_data([sample_fiscal_year])[sample_fiscal_year.id]
+
+    assert data.total_revenues == Decimal("50000000")
+    assert data.total_expenditures == Decimal("48000000")
+    assert data.has_revenues and data.has_expenditures
+    assert data.has_fund_balance and data.has_pensions
+    assert data.revenue_outliers == []
+    assert data.expenditure_outliers == []
+    assert data.prior_year is None
+
+
+def test_load_year_data_collects_outliers(test_db, sample_fiscal_year, sample_financial_data):
+    """Test only line items outside the expected range are loaded as outliers."""
+    oversized_revenue = Revenue(
+        fiscal_year_id=sample_fiscal_year.id,
+        category_id=test_db.query(Revenue.category_id).scalar(),
+        fund_type="Special Revenue",
+        actual_amount=Decimal("15000000000"),
+        source_document_type="CAFR",
+    )
+    oversized_expenditure = Expenditure(
+        fiscal_year_id=sample_fiscal_year.id,
+        category_id=test_db.query(Expenditure.category_id).scalar(),
+        fund_type="Capital",
+        actual_amount=Decimal("20000000000"),
+        source_document_type="CAFR",
+    )
+    test_db.add_all([oversized_revenue, oversized_expenditure])
+    test_db.commit()
+    validator = DataQualityValidator(test_db)
+
+    data = validator._load_year_data([sample_fiscal_year])[sample_fiscal_year.id]
+
+    assert data.revenue_outliers == [
+        (oversized_revenue.id, Decimal("15000000000"), "Property Taxes")
+    ]
+    assert data.expenditure_outliers == [
+        (oversized_expenditure.id, Decimal("20000000000"), "Police")
+    ]
+
+    validator._run_ts = None
+    validator._validate_financial_data(sample_fiscal_year, data)
+    assert [alert.severity for alert in validator.alerts] == ["warning", "warning"]
+    assert validator.alerts[1].message == "Unusually large expenditure amount: Police"
+
+
+def test_load_year_data_prior_year_totals(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test a year's prior-year totals are summed from the preceding fiscal year."""
+    next_year = FiscalYear(
+        city_id=sample_city.id,
+        year=2025,
+        start_date=date(2024, 7, 1),
+        end_date=date(2025, 6, 30),
+    )
+    test_db.add(next_year)
+    test_db.commit()
+    validator = DataQualityValidator(test_db)
+
+    data = validator._load_year_data([next_year])[next_year.id]
+
+    assert data.prior_year == 2024
+    assert data.prior_revenues == Decimal("50000000")
+    assert data.prior_expenditures == Decimal("48000000")
+    assert not data.has_revenues
+
+
+def test_validate_city_runs_every_rule_on_fixture_data(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test a complete, consistent fiscal year validates end to end without alerts."""
+    validator = DataQualityValidator(test_db)
+
+    alerts_by_year = validator.validate_city(sample_city.id)
+
+    assert alerts_by_year == {2024: []}
+
+
+def test_validate_city_flags_fund_balance_reconciliation_failure(
+    test_db, sample_city, sample_fiscal_year, sample_financial_data
+):
+    """Test a fund balance change that revenues less expenditures can't explain is flagged."""
+    fund_balance = sample_financial_data["fund_balance"]
+    fund_balance.yoy_change_amount = Decimal("5000000")
+    pension = sample_financial_data["pension"]
+    pension.total_employer_contribution_percent = Decimal("0.55")
+    test_db.commit()
+    validator = DataQualityValidator(test_db)
+
+    alerts = validator.validate_city(sample_city.id)[2024]
+
+    assert [(alert.category, alert.severity) for alert in alerts] == [
+        ("pension", "warning"),
+        ("reconciliation", "critical"),
+    ]
+    assert alerts[1].details["beginning_balance"] == Decimal("5000000")
+    assert alerts[1].details["expected_ending"] == Decimal("7000000")